@@ -3,10 +3,12 @@ WealthAdvisor AI - ML Service
 Flask application entry point with health check and chat endpoints.
 """
 
+import itertools
 import os
 import logging
+import threading
 import time
-from flask import Flask, jsonify, request
+from flask import Flask, Response, jsonify, request, stream_with_context
 from flask_cors import CORS
 
 # Configure logging
@@ -19,21 +21,40 @@ logger = logging.getLogger(__name__)
 app = Flask(__name__)
 CORS(app, origins=["http://localhost:3001", "http://localhost:3000"])
 
-# Lazy-load the RAG pipeline to avoid cold-start delays at import time
+# Build (and warm) the RAG pipeline when the worker starts, on a background
+# thread: model loading can outlast the gunicorn worker timeout, and /ready
+# reports 503 until it finishes.  With RAG_EAGER_LOAD=0 the pipeline is
+# built on the first /chat or /ready request instead.
+RAG_EAGER_LOAD = os.environ.get("RAG_EAGER_LOAD", "1") == "1"
+
 _rag_pipeline = None
+_rag_pipeline_lock = threading.Lock()
 
 
 def get_rag_pipeline():
     """Return (or initialize) the singleton RAG pipeline."""
     global _rag_pipeline
     if _rag_pipeline is None:
-        logger.info("Initializing RAG pipeline on first request …")
-        from rag import RAGPipeline  # noqa: PLC0415
-        _rag_pipeline = RAGPipeline()
-        logger.info("RAG pipeline ready.")
+        with _rag_pipeline_lock:
+            if _rag_pipeline is None:
+                logger.info("Initializing RAG pipeline …")
+                from rag import RAGPipeline  # noqa: PLC0415
+                _rag_pipeline = RAGPipeline()
+                logger.info("RAG pipeline ready.")
     return _rag_pipeline
 
 
+def _load_rag_pipeline():
+    try:
+        get_rag_pipeline()
+    except Exception as exc:
+        logger.error("RAG pipeline startup load failed: %s", exc)
+
+
+if RAG_EAGER_LOAD:
+    threading.Thread(target=_load_rag_pipeline, name="rag-startup", daemon=True).start()
+
+
 # ---------------------------------------------------------------------------
 # Health check
 # ---------------------------------------------------------------------------
@@ -58,8 +79,10 @@ def ready():
     are loaded and the service can actually serve traffic.
     """
     try:
-        pipeline = get_rag_pipeline()
-        ready_flag = pipeline.is_ready()
+        # With eager loading, don't block the probe on a startup load that
+        # is still running (or build a second one after it failed)
+        pipeline = _rag_pipeline if RAG_EAGER_LOAD else get_rag_pipeline()
+        ready_flag = pipeline is not None and pipeline.is_ready()
         code = 200 if ready_flag else 503
         return jsonify({"ready": ready_flag}), code
     except Exception as exc:
@@ -105,6 +128,50 @@ def chat():
     )
 
 
+@app.route("/chat/stream", methods=["POST"])
+def chat_stream():
+    """
+    POST /chat/stream
+    Body: { "message": str, "session_id": str }
+    Returns: the answer as a chunked text/plain stream, sent as it is generated.
+    """
+    body = request.get_json(silent=True) or {}
+    message = (body.get("message") or "").strip()
+    session_id = (body.get("session_id") or "default").strip()
+
+    if not message:
+        return jsonify({"error": "message is required"}), 400
+
+    # Start the stream before any response is sent: setup, retrieval and
+    # the first decode step fail here as a JSON 500, not as a 200 with an
+    # empty or truncated body.  Later failures end the body with
+    # rag.STREAM_ERROR_MARKER.
+    try:
+        pipeline = get_rag_pipeline()
+        chunks = pipeline.query_stream(message, session_id=session_id)
+        first = next(chunks, "")
+    except Exception as exc:
+        logger.error("Chat error for session %s: %s", session_id, exc)
+        return jsonify({"error": "Internal error — please try again."}), 500
+
+    return Response(
+        stream_with_context(itertools.chain((first,), chunks)),
+        mimetype="text/plain",
+    )
+
+
+@app.route("/chat/<session_id>", methods=["DELETE"])
+def end_session(session_id):
+    """
+    DELETE /chat/<session_id>
+    Called by the client when a conversation is closed so its memory is
+    released immediately instead of waiting for stale-session eviction.
+    Returns: { "cleared": bool }
+    """
+    from memory import clear_session  # noqa: PLC0415
+    return jsonify({"cleared": clear_session(session_id.strip())})
+
+
 # ---------------------------------------------------------------------------
 # Feedback endpoint (records thumbs-up/down for satisfaction tracking)
 # ---------------------------------------------------------------------------
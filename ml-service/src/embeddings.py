@@ -11,11 +11,15 @@ import json
 import logging
 import os
 import pickle
+import queue
+import threading
 import time
+from concurrent.futures import Future
 from pathlib import Path
-from typing import List, Optional
+from typing import Callable, List, Optional, Tuple
 
 from langchain_community.embeddings import HuggingFaceEmbeddings
+from langchain_core.pydantic_v1 import PrivateAttr
 
 logger = logging.getLogger(__name__)
 
@@ -28,6 +32,12 @@ DEFAULT_MODEL = os.environ.get(
 )
 DEFAULT_CACHE_DIR = os.environ.get("EMBEDDING_CACHE_PATH", "./embedding_cache")
 
+# Query micro-batching: cache-missing embed_query calls from concurrent
+# request threads are collected for up to this long (or this many) and
+# encoded in one model pass.  0 ms disables batching.
+QUERY_BATCH_WAIT_MS = float(os.environ.get("EMBED_BATCH_WAIT_MS", "5"))
+QUERY_BATCH_MAX = int(os.environ.get("EMBED_BATCH_MAX", "32"))
+
 # Track cache performance for the 20% latency metric
 _cache_stats = {"hits": 0, "misses": 0, "total_saved_ms": 0.0}
 
@@ -65,6 +75,63 @@ def _save_to_cache(text: str, embedding: List[float], cache_dir: str) -> None:
         logger.warning("Cache write error (%s): %s", path, exc)
 
 
+# ---------------------------------------------------------------------------
+# Query micro-batcher
+# ---------------------------------------------------------------------------
+
+class _QueryBatcher:
+    """
+    Coalesces concurrent single-text embedding requests into batched calls.
+
+    Callers block in embed() while one daemon thread drains the queue: it
+    takes the first waiting text, gathers more until max_wait_ms has passed
+    or max_batch texts are queued, runs embed_batch once and hands each
+    caller its vector (or the batch's exception).
+    """
+
+    def __init__(
+        self,
+        embed_batch: Callable[[List[str]], List[List[float]]],
+        max_wait_ms: float = QUERY_BATCH_WAIT_MS,
+        max_batch: int = QUERY_BATCH_MAX,
+    ):
+        self._embed_batch = embed_batch
+        self._max_wait = max_wait_ms / 1000.0
+        self._max_batch = max_batch
+        self._queue: "queue.Queue[Tuple[str, Future]]" = queue.Queue()
+        self._worker = threading.Thread(target=self._run, name="embed-batcher", daemon=True)
+        self._worker.start()
+
+    def embed(self, text: str) -> List[float]:
+        future: Future = Future()
+        self._queue.put((text, future))
+        return future.result()
+
+    def _run(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self._max_wait
+            while len(batch) < self._max_batch:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+
+            try:
+                vectors = self._embed_batch([text for text, _ in batch])
+            except Exception as exc:
+                for _, future in batch:
+                    future.set_exception(exc)
+                continue
+            if len(batch) > 1:
+                logger.debug("Micro-batched %d query embeddings", len(batch))
+            for (_, future), vector in zip(batch, vectors):
+                future.set_result(vector)
+
+
 # ---------------------------------------------------------------------------
 # Cached embeddings class (wraps HuggingFaceEmbeddings)
 # ---------------------------------------------------------------------------
@@ -79,11 +146,16 @@ class CachedHuggingFaceEmbeddings(HuggingFaceEmbeddings):
     """
 
     cache_dir: str = DEFAULT_CACHE_DIR
+    _query_batcher: Optional[_QueryBatcher] = PrivateAttr(default=None)
 
     def __init__(self, model_name: str = DEFAULT_MODEL, cache_dir: str = DEFAULT_CACHE_DIR, **kwargs):
         super().__init__(model_name=model_name, **kwargs)
         self.cache_dir = cache_dir
         Path(cache_dir).mkdir(parents=True, exist_ok=True)
+        if QUERY_BATCH_WAIT_MS > 0:
+            # Queries carry no instruction prefix for sentence-transformers,
+            # so a batched embed_documents pass gives the same vectors.
+            self._query_batcher = _QueryBatcher(super().embed_documents)
         logger.info(
             "CachedHuggingFaceEmbeddings initialized: model=%s cache=%s",
             model_name, cache_dir,
@@ -99,7 +171,10 @@ class CachedHuggingFaceEmbeddings(HuggingFaceEmbeddings):
 
         _cache_stats["misses"] += 1
         t0 = time.perf_counter()
-        embedding = super().embed_query(text)
+        if self._query_batcher is not None:
+            embedding = self._query_batcher.embed(text)
+        else:
+            embedding = super().embed_query(text)
         elapsed_ms = (time.perf_counter() - t0) * 1000
 
         _save_to_cache(text, embedding, self.cache_dir)
@@ -13,10 +13,13 @@ Covers:
 from __future__ import annotations
 
 from dataclasses import dataclass, field, asdict
-from datetime import date
+from datetime import date, datetime
 from enum import Enum
-from typing import Dict, List, Optional, Deque
-from collections import deque
+import bisect
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import msgspec
+import numpy as np
 
 
 class ValuationMethod(str, Enum):
@@ -118,10 +121,21 @@ class InventorySummary:
     low_stock_count:     int
     out_of_stock_count:  int
     stock_levels:        List[StockLevel]
-    low_stock_alerts:    List[str]
     valuation_method:    str
     gold_stock_grams:    float
     gold_stock_value:    float
+    low_stock_alerts:    Optional[List[str]] = None   # see InventoryManager.get_alerts
+
+
+_OUTWARD_TYPES = frozenset((TransactionType.SALE, TransactionType.RETURN_OUT))
+
+# Consumed FIFO batches are compacted away once at least this many (and at
+# least half the list) have accumulated ahead of the head pointer.
+_FIFO_COMPACT_MIN = 32
+
+
+def _batch_date(batch: StockBatch) -> date:
+    return batch.purchase_date
 
 
 # ---------------------------------------------------------------------------
@@ -139,67 +153,184 @@ class InventoryManager:
         summary = mgr.get_summary()
     """
 
+    _INITIAL_CAPACITY = 64
+
     def __init__(self, valuation: ValuationMethod = ValuationMethod.WAVG):
         self.valuation   = valuation
         self._products:  Dict[str, Product] = {}
-        self._stock:     Dict[str, float] = {}           # sku -> qty
-        self._fifo:      Dict[str, Deque[StockBatch]] = {}  # sku -> batches
-        self._wavg_cost: Dict[str, float] = {}           # sku -> weighted avg cost
+        # sku -> batches sorted by purchase_date; entries before _fifo_head[sku]
+        # are fully consumed and dropped in bulk once they dominate the list
+        self._fifo:      Dict[str, List[StockBatch]] = {}
+        self._fifo_head: Dict[str, int] = {}
         self._txns:      List[InventoryTransaction] = []
+        # Per-SKU numeric state as parallel arrays (SoA), addressed via _sku_idx
+        self._sku_idx:   Dict[str, int] = {}
+        self._n          = 0
+        cap              = self._INITIAL_CAPACITY
+        self._qty        = np.zeros(cap, dtype=np.float64)   # current stock
+        self._cost       = np.zeros(cap, dtype=np.float64)   # weighted avg cost
+        self._reorder    = np.zeros(cap, dtype=np.float64)   # reorder level
+        self._is_gold    = np.zeros(cap, dtype=bool)
+        # Bumped on every mutation; get_summary reuses its result until it changes
+        self._version    = 0
+        self._summary_cache: Optional[Tuple[int, InventorySummary]] = None
+        # (low-stock, out-of-stock) levels from the cached summary, for get_alerts
+        self._alert_levels: Tuple[List[StockLevel], List[StockLevel]] = ([], [])
+        self._handlers = {
+            TransactionType.PURCHASE:   self._apply_purchase,
+            TransactionType.RETURN_IN:  self._apply_purchase,
+            TransactionType.SALE:       self._apply_sale,
+            TransactionType.RETURN_OUT: self._apply_sale,
+            TransactionType.ADJUSTMENT: self._apply_adjust,
+            # TRANSFER moves stock between locations; SKU totals are unchanged
+        }
+
+    def _grow(self, needed: int) -> None:
+        cap = len(self._qty)
+        while cap < needed:
+            cap *= 2
+        if cap == len(self._qty):
+            return
+        pad = cap - len(self._qty)
+        self._qty     = np.concatenate((self._qty,     np.zeros(pad, dtype=np.float64)))
+        self._cost    = np.concatenate((self._cost,    np.zeros(pad, dtype=np.float64)))
+        self._reorder = np.concatenate((self._reorder, np.zeros(pad, dtype=np.float64)))
+        self._is_gold = np.concatenate((self._is_gold, np.zeros(pad, dtype=bool)))
+
+    def _slot(self, sku: str) -> int:
+        """Array index for *sku*, allocating a zeroed slot on first sight."""
+        idx = self._sku_idx.get(sku)
+        if idx is None:
+            idx = self._n
+            self._grow(idx + 1)
+            self._sku_idx[sku] = idx
+            self._n = idx + 1
+        return idx
+
+    def _reset_slot(self, product: Product) -> None:
+        idx = self._slot(product.sku)
+        self._qty[idx]     = 0.0
+        self._cost[idx]    = 0.0
+        self._reorder[idx] = product.reorder_level
+        self._is_gold[idx] = product.category == Category.GOLD
 
     def add_product(self, product: Product) -> None:
         self._products[product.sku] = product
-        self._stock[product.sku]    = 0.0
-        self._fifo[product.sku]     = deque()
-        self._wavg_cost[product.sku]= 0.0
+        self._fifo[product.sku]     = []
+        self._fifo_head[product.sku]= 0
+        self._reset_slot(product)
+        self._version += 1
+
+    def bulk_add_products(self, products: List[Product]) -> None:
+        """Register a whole catalog at once, growing the stock arrays a single time."""
+        self._products.update({p.sku: p for p in products})
+        self._grow(self._n + len(products))
+        for p in products:
+            self._fifo[p.sku] = []
+            self._fifo_head[p.sku] = 0
+            self._reset_slot(p)
+        self._version += 1
 
     def record_transaction(self, txn: InventoryTransaction) -> None:
         self._txns.append(txn)
+        handler = self._handlers.get(txn.txn_type)
+        if handler is not None:
+            handler(txn)
+        self._version += 1
+
+    def record_transactions(self, txns: List[InventoryTransaction]) -> None:
+        """
+        Record a batch of transactions in order.  Consecutive outward movements
+        (sale / return-out) of the same SKU are coalesced into a single stock
+        and FIFO update; every transaction is still kept in the audit log.
+        """
+        self._txns.extend(txns)
+        i, n = 0, len(txns)
+        while i < n:
+            txn = txns[i]
+            if txn.txn_type in _OUTWARD_TYPES:
+                sku, qty = txn.sku, txn.quantity
+                i += 1
+                while i < n and txns[i].sku == sku and txns[i].txn_type in _OUTWARD_TYPES:
+                    qty += txns[i].quantity
+                    i += 1
+                self._consume(sku, qty)
+                continue
+            handler = self._handlers.get(txn.txn_type)
+            if handler is not None:
+                handler(txn)
+            i += 1
+        self._version += 1
+
+    # -- per-type stock handlers (dispatched from record_transaction) --------
+
+    def _apply_purchase(self, txn: InventoryTransaction) -> None:
         sku = txn.sku
+        idx = self._slot(sku)
+        prev_qty = float(self._qty[idx])
+        new_qty  = prev_qty + txn.quantity
+        self._qty[idx] = new_qty
+        batch = StockBatch(
+            batch_id      = txn.txn_id,
+            purchase_date = txn.txn_date,
+            quantity      = txn.quantity,
+            cost_per_unit = txn.unit_price,
+        )
+        # Backdated receipts slot in by date so they are consumed first, but
+        # never ahead of batches that have already been consumed.
+        bisect.insort(
+            self._fifo.setdefault(sku, []), batch,
+            lo=self._fifo_head.get(sku, 0), key=_batch_date,
+        )
+        # Update weighted average
+        prev_cost = float(self._cost[idx])
+        self._cost[idx] = (
+            (prev_qty * prev_cost + txn.quantity * txn.unit_price) / new_qty
+            if new_qty else txn.unit_price
+        )
+
+    def _apply_sale(self, txn: InventoryTransaction) -> None:
+        self._consume(txn.sku, txn.quantity)
 
-        if txn.txn_type in (TransactionType.PURCHASE, TransactionType.RETURN_IN):
-            self._stock[sku] = self._stock.get(sku, 0) + txn.quantity
-            batch = StockBatch(
-                batch_id      = txn.txn_id,
-                purchase_date = txn.txn_date,
-                quantity      = txn.quantity,
-                cost_per_unit = txn.unit_price,
-            )
-            self._fifo.setdefault(sku, deque()).append(batch)
-            # Update weighted average
-            existing_qty  = self._stock[sku] - txn.quantity
-            existing_val  = existing_qty * self._wavg_cost.get(sku, 0)
-            new_val       = txn.quantity * txn.unit_price
-            total_qty     = self._stock[sku]
-            self._wavg_cost[sku] = (existing_val + new_val) / total_qty if total_qty else txn.unit_price
-
-        elif txn.txn_type in (TransactionType.SALE, TransactionType.RETURN_OUT):
-            qty = txn.quantity
-            self._stock[sku] = max(0.0, self._stock.get(sku, 0) - qty)
-            if self.valuation == ValuationMethod.FIFO:
-                self._dequeue_fifo(sku, qty)
-
-        elif txn.txn_type == TransactionType.ADJUSTMENT:
-            self._stock[sku] = max(0.0, self._stock.get(sku, 0) + txn.quantity)
+    def _consume(self, sku: str, qty: float) -> None:
+        idx = self._slot(sku)
+        self._qty[idx] = max(0.0, float(self._qty[idx]) - qty)
+        if self.valuation == ValuationMethod.FIFO:
+            self._dequeue_fifo(sku, qty)
+
+    def _apply_adjust(self, txn: InventoryTransaction) -> None:
+        idx = self._slot(txn.sku)
+        self._qty[idx] = max(0.0, float(self._qty[idx]) + txn.quantity)
 
     def _dequeue_fifo(self, sku: str, qty: float) -> None:
-        batches = self._fifo.get(sku, deque())
+        batches = self._fifo.get(sku)
+        if not batches:
+            return
+        head = self._fifo_head.get(sku, 0)
+        n = len(batches)
         remaining = qty
-        while remaining > 0 and batches:
-            batch = batches[0]
+        while remaining > 0 and head < n:
+            batch = batches[head]
             if batch.quantity <= remaining:
                 remaining -= batch.quantity
-                batches.popleft()
+                head += 1
             else:
                 batch.quantity -= remaining
-                remaining = 0
+                remaining = 0.0
+        if head >= _FIFO_COMPACT_MIN and head * 2 >= n:
+            del batches[:head]
+            head = 0
+        self._fifo_head[sku] = head
 
     def get_stock_level(self, sku: str) -> Optional[StockLevel]:
         product = self._products.get(sku)
         if not product:
             return None
-        qty      = self._stock.get(sku, 0)
-        avg_cost = self._get_avg_cost(sku)
+        qty = float(self._qty[self._sku_idx[sku]])
+        return self._build_level(product, qty, self._get_avg_cost(sku))
+
+    def _build_level(self, product: Product, qty: float, avg_cost: float) -> StockLevel:
+        sku      = product.sku
         last_txn = max((t.txn_date for t in self._txns if t.sku == sku), default=None)
         return StockLevel(
             sku             = sku,
@@ -216,45 +347,72 @@ class InventoryManager:
 
     def _get_avg_cost(self, sku: str) -> float:
         if self.valuation == ValuationMethod.WAVG:
-            return self._wavg_cost.get(sku, 0)
+            idx = self._sku_idx.get(sku)
+            return float(self._cost[idx]) if idx is not None else 0.0
         # FIFO: use earliest batch cost
-        batches = self._fifo.get(sku, deque())
-        if batches:
-            return batches[0].cost_per_unit
+        batches = self._fifo.get(sku)
+        head = self._fifo_head.get(sku, 0)
+        if batches and head < len(batches):
+            return batches[head].cost_per_unit
         return 0.0
 
-    def get_summary(self) -> InventorySummary:
-        levels = [self.get_stock_level(sku) for sku in self._products]
-        levels = [l for l in levels if l is not None]
+    def _cost_vector(self, skus: List[str], idx: np.ndarray) -> np.ndarray:
+        """Per-SKU valuation cost aligned with *idx* under the active method."""
+        if self.valuation == ValuationMethod.WAVG:
+            return self._cost[idx]
+        return np.fromiter(
+            (self._get_avg_cost(sku) for sku in skus), dtype=np.float64, count=len(skus)
+        )
 
-        total_value    = sum(l.total_value for l in levels)
-        low_stock      = [l for l in levels if l.needs_reorder and l.current_qty > 0]
-        out_of_stock   = [l for l in levels if l.current_qty == 0]
-        low_stock_alerts = [
-            f"LOW STOCK: {l.product_name} ({l.sku}) — {l.current_qty:.2f} {l.unit} remaining "
-            f"(reorder level: {l.reorder_level} {l.unit})."
-            for l in low_stock
-        ] + [
-            f"OUT OF STOCK: {l.product_name} ({l.sku}) — order {self._products[l.sku].reorder_qty} {l.unit}."
-            for l in out_of_stock
+    def get_summary(self) -> InventorySummary:
+        cached = self._summary_cache
+        if cached is not None and cached[0] == self._version:
+            return cached[1]
+        products = list(self._products.values())
+        skus     = [p.sku for p in products]
+        idx      = np.fromiter((self._sku_idx[s] for s in skus), dtype=np.intp, count=len(skus))
+
+        qty      = self._qty[idx]
+        cost     = self._cost_vector(skus, idx)
+        value    = qty * cost
+        is_gold  = self._is_gold[idx]
+
+        low_mask = (qty <= self._reorder[idx]) & (qty > 0)
+        oos_mask = qty == 0
+
+        levels = [
+            self._build_level(p, q, c)
+            for p, q, c in zip(products, qty.tolist(), cost.tolist())
         ]
+        low_stock    = [levels[i] for i in np.flatnonzero(low_mask)]
+        out_of_stock = [levels[i] for i in np.flatnonzero(oos_mask)]
 
-        # Gold-specific aggregation
-        gold_levels = [l for l in levels if self._products.get(l.sku, Product("","", Category.GENERAL,"",0,"",0,0)).category == Category.GOLD]
-        gold_grams  = sum(l.current_qty for l in gold_levels)
-        gold_value  = sum(l.total_value for l in gold_levels)
-
-        return InventorySummary(
+        summary = InventorySummary(
             total_skus          = len(levels),
-            total_stock_value   = total_value,
+            total_stock_value   = float(value.sum()),
             low_stock_count     = len(low_stock),
             out_of_stock_count  = len(out_of_stock),
             stock_levels        = levels,
-            low_stock_alerts    = low_stock_alerts,
             valuation_method    = self.valuation.value,
-            gold_stock_grams    = gold_grams,
-            gold_stock_value    = gold_value,
+            gold_stock_grams    = float(qty[is_gold].sum()),
+            gold_stock_value    = float(value[is_gold].sum()),
         )
+        self._summary_cache = (self._version, summary)
+        self._alert_levels  = (low_stock, out_of_stock)
+        return summary
+
+    def get_alerts(self) -> List[str]:
+        """Human-readable low / out-of-stock alerts, formatted only on request."""
+        self.get_summary()
+        low_stock, out_of_stock = self._alert_levels
+        return [
+            f"LOW STOCK: {l.product_name} ({l.sku}) — {l.current_qty:.2f} {l.unit} remaining "
+            f"(reorder level: {l.reorder_level} {l.unit})."
+            for l in low_stock
+        ] + [
+            f"OUT OF STOCK: {l.product_name} ({l.sku}) — order {self._products[l.sku].reorder_qty} {l.unit}."
+            for l in out_of_stock
+        ]
 
     def compute_gold_invoice(
         self,
@@ -265,26 +423,29 @@ class InventoryManager:
         purity_karat:    int   = 22,
     ) -> Dict:
         """Compute gold jewellery invoice with GST split (Sec 3% on gold, 5% on making)."""
-        gold_value       = weight_grams * rate_per_gram
-        making_charges   = weight_grams * making_per_gram
-        gold_gst         = gold_value * GOLD_GST_RATE
-        making_gst       = making_charges * MAKING_CHARGES_GST
-        total_taxable    = gold_value + making_charges + hallmarking_fee
-        total_gst        = gold_gst + making_gst
-        invoice_value    = total_taxable + total_gst
+        # Work in integer paise so line items and totals add up exactly and
+        # each amount is rounded once, not re-rounded at every step.
+        gold_value_p     = round(weight_grams * rate_per_gram * 100)
+        making_p         = round(weight_grams * making_per_gram * 100)
+        hallmarking_p    = round(hallmarking_fee * 100)
+        gold_gst_p       = round(gold_value_p * GOLD_GST_RATE)
+        making_gst_p     = round(making_p * MAKING_CHARGES_GST)
+        total_taxable_p  = gold_value_p + making_p + hallmarking_p
+        total_gst_p      = gold_gst_p + making_gst_p
+        invoice_value_p  = total_taxable_p + total_gst_p
 
         return {
             "purity_karat":      purity_karat,
             "weight_grams":      weight_grams,
             "rate_per_gram":     rate_per_gram,
-            "gold_value":        round(gold_value, 2),
-            "making_charges":    round(making_charges, 2),
+            "gold_value":        gold_value_p / 100,
+            "making_charges":    making_p / 100,
             "hallmarking_fee":   hallmarking_fee,
-            "total_taxable":     round(total_taxable, 2),
-            "gold_gst_3pct":     round(gold_gst, 2),
-            "making_gst_5pct":   round(making_gst, 2),
-            "total_gst":         round(total_gst, 2),
-            "invoice_value":     round(invoice_value, 2),
+            "total_taxable":     total_taxable_p / 100,
+            "gold_gst_3pct":     gold_gst_p / 100,
+            "making_gst_5pct":   making_gst_p / 100,
+            "total_gst":         total_gst_p / 100,
+            "invoice_value":     invoice_value_p / 100,
             "hsn_code_gold":     "7113",
             "hsn_code_making":   "9983",
         }
@@ -294,51 +455,111 @@ class InventoryManager:
 # Convenience wrapper
 # ---------------------------------------------------------------------------
 
-def manage_inventory(params: dict) -> dict:
-    """JSON wrapper for Flask endpoint."""
-    from datetime import datetime as _dt
+# Request-row schemas.  msgspec validates and coerces a whole list of rows in
+# C (enum values included); defaults mirror the documented payload defaults.
+# Built with defstruct rather than a class body because mypyc erases
+# Optional/Any class annotations, which msgspec reads at runtime.  Lax mode
+# never turns numbers into strings, so the text fields also take a JSON
+# number or null (the old parsing passed them through untouched) and are
+# stringified by _text / _opt_text, null becoming "" where the dataclass
+# field is a plain str; hallmarking_required keeps the old bool() truthiness.
+# Stricter than the old hand parsing: purity_karat must be a whole number.
+_TEXT: Any = Union[str, int, None]
+
+_ProductRow: Any = msgspec.defstruct("ProductRow", [
+    ("sku",                    _TEXT,           ""),
+    ("name",                   _TEXT,           ""),
+    ("category",               Category,        Category.GENERAL),
+    ("hsn_code",               _TEXT,           ""),
+    ("gst_rate",               float,           0.18),
+    ("unit",                   _TEXT,           "pcs"),
+    ("reorder_level",          float,           10.0),
+    ("reorder_qty",            float,           50.0),
+    ("purity_karat",           Optional[int],   None),
+    ("making_charge_per_gram", float,           0.0),
+    ("hallmarking_required",   Any,             False),
+])
+
+_TransactionRow: Any = msgspec.defstruct("TransactionRow", [
+    ("txn_id",         _TEXT,           None),
+    ("sku",            _TEXT,           ""),
+    ("txn_type",       TransactionType, TransactionType.PURCHASE),
+    ("txn_date",       Any,             ""),
+    ("quantity",       float,           0.0),
+    ("unit_price",     float,           0.0),
+    ("gst_amount",     float,           0.0),
+    ("party_name",     _TEXT,           None),
+    ("invoice_no",     _TEXT,           None),
+    ("weight_grams",   float,           0.0),
+    ("making_charges", float,           0.0),
+])
+
+_PRODUCT_ROWS:     Any = List[_ProductRow]
+_TRANSACTION_ROWS: Any = List[_TransactionRow]
+
+
+def _parse_date(s: Any) -> date:
+    for fmt in ("%Y-%m-%d", "%d-%m-%Y"):
+        try:
+            return datetime.strptime(s, fmt).date()
+        except (ValueError, TypeError, AttributeError):
+            pass
+    return date.today()
+
+
+def _text(v: Any) -> str:
+    return "" if v is None else str(v)
+
+
+def _opt_text(v: Any) -> Optional[str]:
+    return None if v is None else str(v)
+
+
+def _parse_products(rows: List[dict]) -> List[Product]:
+    return [
+        Product(
+            sku           = _text(r.sku),
+            name          = _text(r.name),
+            category      = r.category,
+            hsn_code      = _text(r.hsn_code),
+            gst_rate      = r.gst_rate,
+            unit          = _text(r.unit),
+            reorder_level = r.reorder_level,
+            reorder_qty   = r.reorder_qty,
+            purity_karat  = r.purity_karat,
+            making_charge_per_gram = r.making_charge_per_gram,
+            hallmarking_required   = bool(r.hallmarking_required),
+        )
+        for r in msgspec.convert(rows, type=_PRODUCT_ROWS, strict=False)
+    ]
+
+
+def _parse_transactions(rows: List[dict]) -> List[InventoryTransaction]:
+    return [
+        InventoryTransaction(
+            txn_id     = _text(r.txn_id) if r.txn_id is not None else str(id(r)),
+            sku        = _text(r.sku),
+            txn_type   = r.txn_type,
+            txn_date   = _parse_date(r.txn_date),
+            quantity   = r.quantity,
+            unit_price = r.unit_price,
+            gst_amount = r.gst_amount,
+            party_name = _opt_text(r.party_name),
+            invoice_no = _opt_text(r.invoice_no),
+            weight_grams    = r.weight_grams,
+            making_charges  = r.making_charges,
+        )
+        for r in msgspec.convert(rows, type=_TRANSACTION_ROWS, strict=False)
+    ]
 
-    def _d(s) -> date:
-        for fmt in ("%Y-%m-%d", "%d-%m-%Y"):
-            try:
-                return _dt.strptime(s, fmt).date()
-            except (ValueError, TypeError, AttributeError):
-                pass
-        return date.today()
 
+def manage_inventory(params: dict) -> dict:
+    """JSON wrapper for Flask endpoint."""
     mgr = InventoryManager(
         valuation=ValuationMethod(params.get("valuation", "weighted_average"))
     )
-
-    for p in params.get("products", []):
-        mgr.add_product(Product(
-            sku           = p.get("sku", ""),
-            name          = p.get("name", ""),
-            category      = Category(p.get("category", "general")),
-            hsn_code      = p.get("hsn_code", ""),
-            gst_rate      = float(p.get("gst_rate", 0.18)),
-            unit          = p.get("unit", "pcs"),
-            reorder_level = float(p.get("reorder_level", 10)),
-            reorder_qty   = float(p.get("reorder_qty", 50)),
-            purity_karat  = p.get("purity_karat"),
-            making_charge_per_gram = float(p.get("making_charge_per_gram", 0)),
-            hallmarking_required   = bool(p.get("hallmarking_required", False)),
-        ))
-
-    for t in params.get("transactions", []):
-        mgr.record_transaction(InventoryTransaction(
-            txn_id     = t.get("txn_id", str(id(t))),
-            sku        = t.get("sku", ""),
-            txn_type   = TransactionType(t.get("txn_type", "purchase")),
-            txn_date   = _d(t.get("txn_date", "")),
-            quantity   = float(t.get("quantity", 0)),
-            unit_price = float(t.get("unit_price", 0)),
-            gst_amount = float(t.get("gst_amount", 0)),
-            party_name = t.get("party_name"),
-            invoice_no = t.get("invoice_no"),
-            weight_grams    = float(t.get("weight_grams", 0)),
-            making_charges  = float(t.get("making_charges", 0)),
-        ))
+    mgr.bulk_add_products(_parse_products(params.get("products", [])))
+    mgr.record_transactions(_parse_transactions(params.get("transactions", [])))
 
     summary = mgr.get_summary()
 
@@ -350,9 +571,10 @@ def manage_inventory(params: dict) -> dict:
         "valuation_method":    summary.valuation_method,
         "gold_stock_grams":    summary.gold_stock_grams,
         "gold_stock_value":    summary.gold_stock_value,
-        "low_stock_alerts":    summary.low_stock_alerts,
         "stock_levels":        [asdict(l) for l in summary.stock_levels],
     }
+    if params.get("include_alerts", True):
+        result["low_stock_alerts"] = mgr.get_alerts()
 
     if params.get("gold_invoice"):
         gi = params["gold_invoice"]
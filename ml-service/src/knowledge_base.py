@@ -6,13 +6,29 @@ chunking utilities used to build the FAISS vector index.
 
 from __future__ import annotations
 
+import functools
+import hashlib
+import json
 import logging
+import mmap
+import os
+import shutil
+import sys
+import tempfile
 from dataclasses import dataclass, field
-from typing import List
+from pathlib import Path
+from typing import Iterable, Iterator, List, Sequence, Tuple
 
+import numpy as np
 from langchain.text_splitter import RecursiveCharacterTextSplitter
 from langchain.schema import Document
 
+try:
+    from semantic_text_splitter import TextSplitter
+    RUST_SPLITTER_AVAILABLE = True
+except ImportError:
+    RUST_SPLITTER_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 # ---------------------------------------------------------------------------
@@ -23,17 +39,24 @@ CHUNK_SIZE = 512          # characters per chunk
 CHUNK_OVERLAP = 64        # overlap to preserve context across boundaries
 SEPARATORS = ["\n\n", "\n", ". ", " ", ""]
 
+# Tokenizer used when ChunkConfig.token_mode measures chunks in tokens
+TIKTOKEN_MODEL = "gpt-3.5-turbo"        # cl100k_base
+TIKTOKEN_ENCODING = "cl100k_base"
+
+# Packed chunk stores are cached here, keyed by a hash of corpus + config
+KB_CACHE_DIR = os.environ.get("KB_CACHE_PATH", tempfile.gettempdir())
+
 
 # ---------------------------------------------------------------------------
 # Raw financial knowledge corpus
 # ---------------------------------------------------------------------------
 
-RAW_DOCUMENTS: List[dict] = [
+RAW_DOCUMENTS: Tuple[Tuple[str, str, str], ...] = (
     # ---- Budgeting & Savings -----------------------------------------------
-    {
-        "title": "50/30/20 Budgeting Rule",
-        "category": "budgeting",
-        "content": (
+    (
+        "50/30/20 Budgeting Rule",
+        "budgeting",
+        (
             "The 50/30/20 rule is a simple budgeting framework: allocate 50% of "
             "after-tax income to needs (rent, groceries, utilities, minimum debt "
             "payments), 30% to wants (dining, entertainment, subscriptions), and 20% "
@@ -42,11 +65,11 @@ RAW_DOCUMENTS: List[dict] = [
             "Automate savings transfers on payday to enforce the rule passively. "
             "Review your budget quarterly as income and expenses change."
         ),
-    },
-    {
-        "title": "Emergency Fund Basics",
-        "category": "savings",
-        "content": (
+    ),
+    (
+        "Emergency Fund Basics",
+        "savings",
+        (
             "An emergency fund is 3–6 months of essential living expenses held in a "
             "liquid, low-risk account such as a high-yield savings account (HYSA). "
             "Start with a $1,000 starter fund to cover minor emergencies, then build "
@@ -55,12 +78,12 @@ RAW_DOCUMENTS: List[dict] = [
             "target 6–12 months. Do not invest emergency funds in stocks — capital "
             "preservation and liquidity are the priorities."
         ),
-    },
+    ),
     # ---- Investing ------------------------------------------------------------
-    {
-        "title": "Index Fund Investing",
-        "category": "investing",
-        "content": (
+    (
+        "Index Fund Investing",
+        "investing",
+        (
             "Index funds track a market benchmark (e.g., S&P 500, total market) and "
             "offer broad diversification at very low cost. The average expense ratio "
             "of index funds is 0.03–0.10%, far below the 0.5–1.5% of actively managed "
@@ -70,11 +93,11 @@ RAW_DOCUMENTS: List[dict] = [
             "investor needs. Prefer funds from Vanguard, Fidelity, or Schwab for the "
             "lowest costs. Rebalance annually or when allocations drift more than 5%."
         ),
-    },
-    {
-        "title": "Dollar-Cost Averaging",
-        "category": "investing",
-        "content": (
+    ),
+    (
+        "Dollar-Cost Averaging",
+        "investing",
+        (
             "Dollar-cost averaging (DCA) means investing a fixed dollar amount at "
             "regular intervals regardless of market price. DCA removes the emotional "
             "temptation to time the market and automatically buys more shares when "
@@ -84,11 +107,11 @@ RAW_DOCUMENTS: List[dict] = [
             "contributions to your 401(k) or brokerage account to implement DCA "
             "effortlessly."
         ),
-    },
-    {
-        "title": "Asset Allocation by Age",
-        "category": "investing",
-        "content": (
+    ),
+    (
+        "Asset Allocation by Age",
+        "investing",
+        (
             "A common rule of thumb: subtract your age from 110 to get your stock "
             "allocation percentage (e.g., age 30 → 80% stocks, 20% bonds). Modern "
             "variants use 120 or 125 due to longer life expectancy. Target-date funds "
@@ -99,12 +122,12 @@ RAW_DOCUMENTS: List[dict] = [
             "during downturns needs a more conservative allocation than their age "
             "alone suggests."
         ),
-    },
+    ),
     # ---- Retirement ----------------------------------------------------------
-    {
-        "title": "401(k) and IRA Contribution Limits",
-        "category": "retirement",
-        "content": (
+    (
+        "401(k) and IRA Contribution Limits",
+        "retirement",
+        (
             "For 2024: 401(k) employee contribution limit is $23,000 ($30,500 if age "
             "50+). Traditional and Roth IRA limit is $7,000 ($8,000 if 50+). Roth IRA "
             "income phase-out: $146,000–$161,000 (single), $230,000–$240,000 (married "
@@ -113,11 +136,11 @@ RAW_DOCUMENTS: List[dict] = [
             "investment. Prioritize: (1) 401(k) to match, (2) max HSA if eligible, "
             "(3) max Roth IRA, (4) max 401(k) remainder, (5) taxable brokerage."
         ),
-    },
-    {
-        "title": "Roth vs Traditional IRA",
-        "category": "retirement",
-        "content": (
+    ),
+    (
+        "Roth vs Traditional IRA",
+        "retirement",
+        (
             "Traditional IRA: contributions may be tax-deductible (reduces taxable "
             "income now), growth is tax-deferred, withdrawals in retirement are taxed "
             "as ordinary income. Required minimum distributions (RMDs) start at age 73. "
@@ -127,11 +150,11 @@ RAW_DOCUMENTS: List[dict] = [
             "retirement, or if you want maximum tax diversification. Roth is generally "
             "superior for young, lower-income earners early in their careers."
         ),
-    },
-    {
-        "title": "Social Security Optimization",
-        "category": "retirement",
-        "content": (
+    ),
+    (
+        "Social Security Optimization",
+        "retirement",
+        (
             "You can claim Social Security as early as age 62 (reduced by up to 30%) "
             "or delay to age 70 (increased by 8% per year past full retirement age). "
             "Full retirement age (FRA) is 67 for those born after 1960. Delaying to 70 "
@@ -140,12 +163,12 @@ RAW_DOCUMENTS: List[dict] = [
             "survivor benefit. Working while claiming before FRA reduces benefits if "
             "earnings exceed the annual exempt amount ($22,320 in 2024)."
         ),
-    },
+    ),
     # ---- Debt Management -----------------------------------------------------
-    {
-        "title": "Debt Avalanche vs Snowball",
-        "category": "debt",
-        "content": (
+    (
+        "Debt Avalanche vs Snowball",
+        "debt",
+        (
             "Debt Avalanche: pay minimums on all debts, put extra cash toward the "
             "highest-interest debt first. Mathematically optimal — saves the most money "
             "in interest. Debt Snowball: pay minimums on all, attack the smallest balance "
@@ -155,11 +178,11 @@ RAW_DOCUMENTS: List[dict] = [
             "balance for a quick win, then switch to avalanche. Never skip minimum "
             "payments — late fees and credit score damage negate any strategy."
         ),
-    },
-    {
-        "title": "Mortgage and Housing Costs",
-        "category": "debt",
-        "content": (
+    ),
+    (
+        "Mortgage and Housing Costs",
+        "debt",
+        (
             "Total housing costs (mortgage P&I, taxes, insurance, HOA) should not "
             "exceed 28% of gross monthly income (front-end ratio). Total debt payments "
             "including housing should stay below 36–43% (back-end ratio, varies by "
@@ -169,12 +192,12 @@ RAW_DOCUMENTS: List[dict] = [
             "on a 30-year can significantly reduce total interest — even $100/month "
             "extra on a $300K loan saves ~$30K in interest."
         ),
-    },
+    ),
     # ---- Tax Planning ---------------------------------------------------------
-    {
-        "title": "Tax-Loss Harvesting",
-        "category": "tax",
-        "content": (
+    (
+        "Tax-Loss Harvesting",
+        "tax",
+        (
             "Tax-loss harvesting sells investments at a loss to offset capital gains, "
             "reducing your current tax bill. Losses offset short-term gains first "
             "(taxed as ordinary income), then long-term gains (taxed at 0%, 15%, or 20%). "
@@ -185,11 +208,11 @@ RAW_DOCUMENTS: List[dict] = [
             "to maintain market exposure. Particularly valuable in taxable brokerage "
             "accounts for high-income investors."
         ),
-    },
-    {
-        "title": "Health Savings Account (HSA) Strategy",
-        "category": "tax",
-        "content": (
+    ),
+    (
+        "Health Savings Account (HSA) Strategy",
+        "tax",
+        (
             "An HSA offers a triple tax advantage: contributions are pre-tax, growth "
             "is tax-free, and withdrawals for qualified medical expenses are tax-free. "
             "2024 contribution limits: $4,150 (self-only HDHP), $8,300 (family HDHP), "
@@ -200,12 +223,12 @@ RAW_DOCUMENTS: List[dict] = [
             "remain tax-free forever. The HSA is the only account with a triple tax "
             "advantage — max it out if eligible."
         ),
-    },
+    ),
     # ---- Insurance ------------------------------------------------------------
-    {
-        "title": "Term vs Whole Life Insurance",
-        "category": "insurance",
-        "content": (
+    (
+        "Term vs Whole Life Insurance",
+        "insurance",
+        (
             "Term life insurance provides coverage for a fixed period (10, 20, or 30 "
             "years) at low cost. A healthy 30-year-old can get $500K of 20-year term "
             "coverage for ~$25/month. Whole life insurance combines a death benefit with "
@@ -216,12 +239,12 @@ RAW_DOCUMENTS: List[dict] = [
             "10–12x annual income, or enough to replace income for dependents until "
             "they are self-sufficient."
         ),
-    },
+    ),
     # ---- Wealth Building ------------------------------------------------------
-    {
-        "title": "Net Worth Milestones",
-        "category": "wealth",
-        "content": (
+    (
+        "Net Worth Milestones",
+        "wealth",
+        (
             "Tracking net worth (assets minus liabilities) provides a holistic view of "
             "financial health. Key milestones: $0 net worth (debt-free), 1x salary saved "
             "by 30, 3x by 40, 6x by 50, 8x by 60 (Fidelity guidelines). The 4% rule "
@@ -231,11 +254,11 @@ RAW_DOCUMENTS: List[dict] = [
             "Focus on increasing income and savings rate, not just cutting expenses — "
             "there is a floor on expenses but no ceiling on income."
         ),
-    },
-    {
-        "title": "Diversification and Portfolio Theory",
-        "category": "investing",
-        "content": (
+    ),
+    (
+        "Diversification and Portfolio Theory",
+        "investing",
+        (
             "Modern Portfolio Theory (MPT) shows that combining assets with low "
             "correlation reduces portfolio volatility without sacrificing expected "
             "return. An S&P 500 index covers 500 large US companies but is still "
@@ -246,11 +269,11 @@ RAW_DOCUMENTS: List[dict] = [
             "weighting. REITs provide real estate exposure with REIT correlation to "
             "stocks rising during crises but offering diversification in stable periods."
         ),
-    },
-    {
-        "title": "Behavioral Finance and Investor Psychology",
-        "category": "investing",
-        "content": (
+    ),
+    (
+        "Behavioral Finance and Investor Psychology",
+        "investing",
+        (
             "Common cognitive biases that hurt investors: (1) Loss aversion — losses "
             "feel twice as painful as equivalent gains, causing panic selling. (2) "
             "Recency bias — over-weighting recent performance, chasing last year's "
@@ -262,70 +285,319 @@ RAW_DOCUMENTS: List[dict] = [
             "the market beats timing the market — missing the 10 best days in a decade "
             "can cut returns by half."
         ),
-    },
-]
+    ),
+)
+
+
+def raw_document_dicts() -> List[dict]:
+    """RAW_DOCUMENTS in the {"title", "category", "content"} dict shape."""
+    return [
+        {"title": title, "category": category, "content": content}
+        for title, category, content in RAW_DOCUMENTS
+    ]
 
 
 # ---------------------------------------------------------------------------
 # Document chunking
 # ---------------------------------------------------------------------------
 
+# SEPARATORS pruned to those that actually occur in the seed corpus (plus the
+# "" fallback).  A separator absent from a text never produces a split, so
+# chunking the seed corpus with this list gives identical chunks while
+# skipping the scans for e.g. "\n\n", which these single-paragraph entries
+# never contain.
+_SEED_SEPARATORS = [
+    sep for sep in SEPARATORS
+    if not sep or any(sep in content for _, _, content in RAW_DOCUMENTS)
+]
+
+
 @dataclass
 class ChunkConfig:
     chunk_size: int = CHUNK_SIZE
     chunk_overlap: int = CHUNK_OVERLAP
     separators: List[str] = field(default_factory=lambda: SEPARATORS)
+    # Measure chunk_size / chunk_overlap in cl100k_base tokens, not characters
+    token_mode: bool = False
+
+    def is_default(self) -> bool:
+        return (
+            self.chunk_size == CHUNK_SIZE
+            and self.chunk_overlap == CHUNK_OVERLAP
+            and self.separators in (SEPARATORS, _SEED_SEPARATORS)
+            and not self.token_mode
+        )
+
+
+# Splitters for the default config, built once at import; chunk_documents
+# only constructs a new splitter for a non-default ChunkConfig.
+_DEFAULT_SPLITTER = RecursiveCharacterTextSplitter(
+    chunk_size=CHUNK_SIZE,
+    chunk_overlap=CHUNK_OVERLAP,
+    separators=SEPARATORS,
+    length_function=len,
+)
+_SEED_SPLITTER = RecursiveCharacterTextSplitter(
+    chunk_size=CHUNK_SIZE,
+    chunk_overlap=CHUNK_OVERLAP,
+    separators=_SEED_SEPARATORS,
+    length_function=len,
+)
+_SEED_CONFIG = ChunkConfig(separators=_SEED_SEPARATORS)
+_DEFAULT_RUST_SPLITTER = (
+    TextSplitter(CHUNK_SIZE, overlap=CHUNK_OVERLAP) if RUST_SPLITTER_AVAILABLE else None
+)
 
 
-def build_documents(raw: List[dict] | None = None) -> List[Document]:
+@dataclass(slots=True, frozen=True)
+class Chunk:
     """
-    Convert raw knowledge-base entries into LangChain Document objects.
-    Each raw entry maps to one Document; metadata carries title and category.
+    One chunk of knowledge-base text.  A plain slotted record instead of a
+    LangChain Document (a pydantic model), since everything downstream only
+    reads page_content and metadata; convert at library boundaries with
+    as_langchain_document().
+    """
+    page_content: str
+    metadata: dict
+
+    def as_langchain_document(self) -> Document:
+        return Document(page_content=self.page_content, metadata=self.metadata)
+
+
+def _document_metadatas(titles: Sequence[str], categories: Sequence[str]) -> List[dict]:
+    """
+    Metadata dicts for parallel title/category sequences.  All source paths
+    are built in one batch pass, and every string is interned.
+    """
+    titles = list(map(sys.intern, titles))
+    categories = list(map(sys.intern, categories))
+    sources = list(map(sys.intern, map("knowledge_base/{}/{}".format, categories, titles)))
+    return [
+        {"title": title, "category": category, "source": source}
+        for title, category, source in zip(titles, categories, sources)
+    ]
+
+
+def build_documents(
+    raw: Sequence[Tuple[str, str, str]] | None = None,
+) -> List[Document]:
+    """
+    Convert raw (title, category, content) entries into LangChain Document
+    objects.  Each raw entry maps to one Document; metadata carries title
+    and category.
+    Metadata strings are interned, since every chunk of a document (and
+    every document in a category) repeats them.
     """
     corpus = raw or RAW_DOCUMENTS
-    docs = []
-    for entry in corpus:
-        doc = Document(
-            page_content=entry["content"],
-            metadata={
-                "title": entry["title"],
-                "category": entry["category"],
-                "source": f"knowledge_base/{entry['category']}/{entry['title']}",
-            },
-        )
-        docs.append(doc)
+    titles = [entry[0] for entry in corpus]
+    categories = [entry[1] for entry in corpus]
+    docs = [
+        Document(page_content=entry[2], metadata=metadata)
+        for entry, metadata in zip(corpus, _document_metadatas(titles, categories))
+    ]
     logger.info("Built %d documents from raw corpus", len(docs))
     return docs
 
 
-def chunk_documents(
-    docs: List[Document],
-    config: ChunkConfig | None = None,
-) -> List[Document]:
+def _rust_splitter(cfg: ChunkConfig) -> "TextSplitter":
+    if cfg.is_default():
+        return _DEFAULT_RUST_SPLITTER
+    if cfg.token_mode:
+        return TextSplitter.from_tiktoken_model(
+            TIKTOKEN_MODEL, cfg.chunk_size, overlap=cfg.chunk_overlap
+        )
+    return TextSplitter(cfg.chunk_size, overlap=cfg.chunk_overlap)
+
+
+class _CachedLengthSplitter(RecursiveCharacterTextSplitter):
     """
-    Split documents into fixed-size chunks with overlap using a
-    RecursiveCharacterTextSplitter.  Metadata is preserved on each chunk.
+    RecursiveCharacterTextSplitter that memoizes its length function.
+    _merge_splits measures the same pieces (and the separator) repeatedly,
+    and with a tiktoken length function every measurement is a full BPE
+    encode.  The cache is keyed by string value and cleared after each
+    top-level split_text call to bound memory.
     """
-    cfg = config or ChunkConfig()
-    splitter = RecursiveCharacterTextSplitter(
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        measure = self._length_function
+        cache: dict = {}
+
+        def _cached_length(text: str) -> int:
+            n = cache.get(text)
+            if n is None:
+                n = cache[text] = measure(text)
+            return n
+
+        self._length_cache = cache
+        self._length_function = _cached_length
+
+    def split_text(self, text: str) -> List[str]:
+        try:
+            return super().split_text(text)
+        finally:
+            self._length_cache.clear()
+
+
+def _langchain_splitter(cfg: ChunkConfig) -> RecursiveCharacterTextSplitter:
+    if cfg.is_default():
+        return _SEED_SPLITTER if cfg.separators is _SEED_SEPARATORS else _DEFAULT_SPLITTER
+    if cfg.token_mode:
+        # Requires the optional `tiktoken` package; token counts are cached
+        # per piece since each count is a full encode
+        return _CachedLengthSplitter.from_tiktoken_encoder(
+            encoding_name=TIKTOKEN_ENCODING,
+            chunk_size=cfg.chunk_size,
+            chunk_overlap=cfg.chunk_overlap,
+            separators=cfg.separators,
+        )
+    return RecursiveCharacterTextSplitter(
         chunk_size=cfg.chunk_size,
         chunk_overlap=cfg.chunk_overlap,
         separators=cfg.separators,
         length_function=len,
     )
-    chunks = splitter.split_documents(docs)
+
+
+def iter_chunks(
+    docs: Iterable[Document],
+    config: ChunkConfig | None = None,
+) -> Iterator[Chunk]:
+    """
+    Streaming variant of chunk_documents: splits one document at a time and
+    yields its chunks, so a large corpus never has to be held in memory as
+    a whole chunk list.  Accepts any iterable of documents.
+    """
+    cfg = config or ChunkConfig()
+    if RUST_SPLITTER_AVAILABLE and cfg.separators in (SEPARATORS, _SEED_SEPARATORS):
+        split = _rust_splitter(cfg).chunks
+    else:
+        split = _langchain_splitter(cfg).split_text
+    for doc in docs:
+        for text in split(doc.page_content):
+            yield Chunk(text, doc.metadata)
+
+
+def chunk_documents(
+    docs: List[Document],
+    config: ChunkConfig | None = None,
+) -> List[Chunk]:
+    """
+    Split documents into fixed-size chunks with overlap.  Chunks share their
+    parent document's metadata dict rather than each holding a copy, so
+    treat chunk metadata as read-only.
+
+    Uses the Rust ``semantic_text_splitter`` (splitting on the same
+    paragraph > line > sentence > word hierarchy) when it is installed and
+    the default separators are in effect; otherwise falls back to LangChain's
+    RecursiveCharacterTextSplitter.  Since the whole list is materialized
+    anyway, the Rust path splits the batch in one native call, returning
+    per-document chunk lists aligned with `docs`; the fallback is a thin
+    wrapper over iter_chunks.
+
+    With ``token_mode`` the sizes are counted in cl100k_base tokens; the
+    Rust path tokenizes natively (tiktoken-rs) without Python round-trips.
+    """
+    cfg = config or ChunkConfig()
+    if RUST_SPLITTER_AVAILABLE and cfg.separators in (SEPARATORS, _SEED_SEPARATORS):
+        per_doc = _rust_splitter(cfg).chunk_all([doc.page_content for doc in docs])
+        chunks = [
+            Chunk(text, doc.metadata)
+            for doc, texts in zip(docs, per_doc)
+            for text in texts
+        ]
+    else:
+        chunks = list(iter_chunks(docs, cfg))
     logger.info(
-        "Chunked %d docs → %d chunks (size=%d, overlap=%d)",
+        "Chunked %d docs → %d chunks (size=%d, overlap=%d, unit=%s)",
         len(docs), len(chunks), cfg.chunk_size, cfg.chunk_overlap,
+        "tokens" if cfg.token_mode else "chars",
     )
     return chunks
 
 
-def load_knowledge_base() -> List[Document]:
+def _corpus_fingerprint() -> str:
+    """SHA-256 over the corpus and chunking parameters that shape the output."""
+    payload = repr((RAW_DOCUMENTS, CHUNK_SIZE, CHUNK_OVERLAP, SEPARATORS, RUST_SPLITTER_AVAILABLE))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _write_chunk_store(store_dir: Path, chunks: List[Chunk]) -> None:
+    """
+    Persist chunks as a packed store: ``content.bin`` holds every page_content
+    back to back (UTF-8), ``offsets.npy`` the [start, end) byte range of each
+    chunk plus an index into the de-duplicated metadata table in
+    ``metadata.json``.  Written to a temp dir and renamed into place so
+    concurrently starting workers never see a partial store.
+    """
+    metas: List[dict] = []
+    meta_ids: dict = {}
+    rows = np.empty((len(chunks), 3), dtype=np.int64)
+    tmp_dir = Path(tempfile.mkdtemp(prefix=store_dir.name + ".", dir=store_dir.parent))
+    try:
+        pos = 0
+        with open(tmp_dir / "content.bin", "wb") as fh:
+            for i, chunk in enumerate(chunks):
+                data = chunk.page_content.encode("utf-8")
+                fh.write(data)
+                meta_idx = meta_ids.get(id(chunk.metadata))
+                if meta_idx is None:
+                    meta_idx = meta_ids[id(chunk.metadata)] = len(metas)
+                    metas.append(chunk.metadata)
+                rows[i] = (pos, pos + len(data), meta_idx)
+                pos += len(data)
+        np.save(tmp_dir / "offsets.npy", rows)
+        with open(tmp_dir / "metadata.json", "w", encoding="utf-8") as fh:
+            json.dump(metas, fh)
+        os.replace(tmp_dir, store_dir)
+    except OSError:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        if not (store_dir / "metadata.json").exists():
+            raise
+
+
+def _read_chunk_store(store_dir: Path) -> List[Chunk]:
+    """Rebuild chunks from a packed store, reading the content blob via mmap."""
+    rows = np.load(store_dir / "offsets.npy", mmap_mode="r")
+    with open(store_dir / "metadata.json", encoding="utf-8") as fh:
+        stored = json.load(fh)
+    metas = _document_metadatas(
+        [m["title"] for m in stored], [m["category"] for m in stored]
+    )
+    if not len(rows):
+        return []
+    with open(store_dir / "content.bin", "rb") as fh:
+        with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as blob:
+            return [
+                Chunk(blob[start:end].decode("utf-8"), metas[meta_idx])
+                for start, end, meta_idx in rows.tolist()
+            ]
+
+
+@functools.lru_cache(maxsize=1)
+def load_knowledge_base() -> List[Chunk]:
     """
     High-level helper: build + chunk the financial knowledge corpus.
-    Returns a list of LangChain Documents ready for embedding.
+    Returns a list of Chunks ready for embedding.
+
+    The corpus is static, so the result is memoized in-process and written
+    once to a packed, mmap-able store under KB_CACHE_DIR; every later worker
+    or cold start with an unchanged corpus reads that instead of chunking.
+    Callers share the returned list and must not mutate it.
     """
+    store_dir = Path(KB_CACHE_DIR) / f"kb_{_corpus_fingerprint()}"
+    if (store_dir / "metadata.json").exists():
+        try:
+            chunks = _read_chunk_store(store_dir)
+            logger.info("Loaded %d chunks from store: %s", len(chunks), store_dir)
+            return chunks
+        except Exception as exc:
+            logger.warning("Chunk store read error (%s): %s", store_dir, exc)
+
     raw_docs = build_documents()
-    chunks = chunk_documents(raw_docs)
+    chunks = chunk_documents(raw_docs, _SEED_CONFIG)
+    try:
+        _write_chunk_store(store_dir, chunks)
+    except Exception as exc:
+        logger.warning("Chunk store write error (%s): %s", store_dir, exc)
     return chunks
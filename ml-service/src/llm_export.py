@@ -0,0 +1,98 @@
+"""
+LLM int8 ONNX Export
+Exports the seq2seq LLM (LLM_MODEL) to ONNX and applies int8 dynamic
+quantization (weights int8, activations quantized on the fly) for ONNX
+Runtime on CPU.
+
+Run once at image build time (see ml-service/Dockerfile):
+
+    python llm_export.py /build/llm_onnx
+
+The RAG pipeline only loads the result from LLM_ONNX_PATH; it never exports
+at run time, where a cold export would run inside the first request.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import shutil
+import sys
+import tempfile
+from typing import Dict
+
+logger = logging.getLogger(__name__)
+
+LLM_MODEL = os.environ.get("LLM_MODEL", "google/flan-t5-base")
+
+# Quantization target: "auto" picks avx512_vnni or avx2 from this CPU's flags;
+# set it explicitly when the image is built on a different CPU than it runs on
+LLM_QUANT_ISA = os.environ.get("LLM_QUANT_ISA", "auto")
+
+ONNX_MODELS = ("encoder_model", "decoder_model", "decoder_with_past_model")
+
+# ONNX model name -> quantized file name, as ORTQuantizer writes it
+QUANTIZED_FILES: Dict[str, str] = {name: f"{name}_quantized.onnx" for name in ONNX_MODELS}
+
+
+def _cpu_flags() -> set:
+    """CPU feature flags from /proc/cpuinfo (empty where unavailable)."""
+    try:
+        with open("/proc/cpuinfo") as f:
+            for line in f:
+                if line.startswith("flags"):
+                    return set(line.split(":", 1)[1].split())
+    except OSError:
+        pass
+    return set()
+
+
+def quantization_isa(isa: str = LLM_QUANT_ISA) -> str:
+    """The AutoQuantizationConfig target: isa, or the host's best for "auto"."""
+    if isa != "auto":
+        return isa
+    flags = _cpu_flags()
+    if "avx512_vnni" in flags:
+        return "avx512_vnni"
+    if "avx512f" in flags:
+        return "avx512"
+    return "avx2"
+
+
+def is_exported(path: str) -> bool:
+    """True when every quantized model file is present under path."""
+    return all(os.path.exists(os.path.join(path, f)) for f in QUANTIZED_FILES.values())
+
+
+def export_int8(path: str, model: str = LLM_MODEL, isa: str = LLM_QUANT_ISA) -> None:
+    """
+    Export `model` to ONNX and quantize it into `path`.  The work is done in
+    a temporary directory next to `path` and moved into place at the end,
+    so an interrupted export never leaves a partial `path` behind.
+    """
+    from optimum.onnxruntime import ORTModelForSeq2SeqLM, ORTQuantizer  # noqa: PLC0415
+    from optimum.onnxruntime.configuration import AutoQuantizationConfig  # noqa: PLC0415
+
+    target = quantization_isa(isa)
+    qconfig = getattr(AutoQuantizationConfig, target)(is_static=False, per_channel=False)
+    logger.info("Exporting %s to ONNX int8 (%s) in %s …", model, target, path)
+
+    parent = os.path.dirname(os.path.abspath(path))
+    os.makedirs(parent, exist_ok=True)
+    work = tempfile.mkdtemp(prefix=".llm_onnx_", dir=parent)
+    try:
+        ORTModelForSeq2SeqLM.from_pretrained(model, export=True).save_pretrained(work)
+        for name in ONNX_MODELS:
+            quantizer = ORTQuantizer.from_pretrained(work, file_name=f"{name}.onnx")
+            quantizer.quantize(save_dir=work, quantization_config=qconfig)
+        if os.path.exists(path):
+            shutil.rmtree(path)
+        os.replace(work, path)
+    except BaseException:
+        shutil.rmtree(work, ignore_errors=True)
+        raise
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(name)s: %(message)s")
+    export_int8(sys.argv[1] if len(sys.argv) > 1 else os.environ.get("LLM_ONNX_PATH", "./llm_onnx"))
@@ -7,8 +7,10 @@ from __future__ import annotations
 
 import logging
 import os
+import threading
 import time
-from typing import Dict, Optional
+from collections import OrderedDict
+from typing import List, Optional
 
 from langchain.memory import ConversationBufferWindowMemory
 
@@ -17,41 +19,81 @@ logger = logging.getLogger(__name__)
 # Number of human/AI exchange pairs to retain (configurable via env)
 MEMORY_WINDOW_SIZE: int = int(os.environ.get("MEMORY_WINDOW_SIZE", "5"))
 
-# In-memory session store: session_id -> MemoryEntry
-_sessions: Dict[str, "MemoryEntry"] = {}
+# Hard cap on live sessions across all shards; beyond it the least-recently-
+# used session of the shard being inserted into is dropped
+MAX_SESSIONS: int = int(os.environ.get("MAX_SESSIONS", "10000"))
+
+# In-memory session store, split into shards by hash(session_id) so that
+# concurrent requests for different sessions rarely contend on one lock.
+# Each shard maps session_id -> MemoryEntry in LRU order (least recently
+# accessed first) so eviction only inspects stale entries.
+_NUM_SHARDS = 16
+_SHARD_MASK = _NUM_SHARDS - 1
+_shards: List["OrderedDict[str, MemoryEntry]"] = [OrderedDict() for _ in range(_NUM_SHARDS)]
+_shard_locks: List[threading.Lock] = [threading.Lock() for _ in range(_NUM_SHARDS)]
+
+# Live sessions across all shards.  Updated under _count_lock; taken while a
+# shard lock is held (never the other way round), so lock order is fixed.
+_session_count = 0
+_count_lock = threading.Lock()
+
+
+def _count_sessions(delta: int) -> int:
+    """Add delta to the live-session count and return the new count."""
+    global _session_count
+    with _count_lock:
+        _session_count += delta
+        return _session_count
 
 
 class MemoryEntry:
-    """Wraps a LangChain memory object with session metadata."""
+    """
+    Wraps a LangChain memory object with session metadata.
+
+    Timestamps come from time.monotonic(): age arithmetic is immune to
+    wall-clock jumps and one clock read serves both fields on creation.
+    """
+
+    __slots__ = ("session_id", "window_size", "created_at", "last_accessed", "_memory")
 
     def __init__(self, session_id: str, window_size: int = MEMORY_WINDOW_SIZE):
         self.session_id = session_id
         self.window_size = window_size
-        self.created_at = time.time()
-        self.last_accessed = time.time()
-        self.memory = ConversationBufferWindowMemory(
-            k=window_size,
-            memory_key="chat_history",
-            return_messages=True,
-            output_key="answer",
-            input_key="question",
-        )
+        self.created_at = self.last_accessed = time.monotonic()
+        self._memory: Optional[ConversationBufferWindowMemory] = None
+
+    @property
+    def memory(self) -> ConversationBufferWindowMemory:
+        """The session's LangChain memory, built on first access."""
+        if self._memory is None:
+            self._memory = ConversationBufferWindowMemory(
+                k=self.window_size,
+                memory_key="chat_history",
+                return_messages=True,
+                output_key="answer",
+                input_key="question",
+            )
+        return self._memory
 
     def touch(self) -> None:
         """Update the last-accessed timestamp."""
-        self.last_accessed = time.time()
+        self.last_accessed = time.monotonic()
 
     def age_seconds(self) -> float:
-        return time.time() - self.last_accessed
+        return time.monotonic() - self.last_accessed
 
     def to_dict(self) -> dict:
-        messages = self.memory.chat_memory.messages
+        message_count = (
+            len(self._memory.chat_memory.messages) if self._memory is not None else 0
+        )
+        age = time.monotonic() - self.last_accessed
         return {
             "session_id": self.session_id,
             "window_size": self.window_size,
-            "message_count": len(messages),
-            "last_accessed": self.last_accessed,
-            "age_seconds": round(self.age_seconds(), 1),
+            "message_count": message_count,
+            # Reported as a Unix timestamp, as before the switch to monotonic
+            "last_accessed": time.time() - age,
+            "age_seconds": round(age, 1),
         }
 
 
@@ -59,6 +101,10 @@ class MemoryEntry:
 # Session management API
 # ---------------------------------------------------------------------------
 
+def _shard_index(session_id: str) -> int:
+    return hash(session_id) & _SHARD_MASK
+
+
 def get_memory(
     session_id: str,
     window_size: int = MEMORY_WINDOW_SIZE,
@@ -70,28 +116,64 @@ def get_memory(
     The window retains the last `window_size` human/AI exchanges (default 5),
     providing contextual continuity without unbounded token growth.
     """
-    if session_id not in _sessions:
-        _sessions[session_id] = MemoryEntry(session_id, window_size)
-        logger.info(
-            "New session created: id=%s window=%d", session_id, window_size
-        )
-    entry = _sessions[session_id]
-    entry.touch()
+    i = _shard_index(session_id)
+    shard = _shards[i]
+    over = 0
+    with _shard_locks[i]:
+        entry = shard.get(session_id)
+        if entry is None:
+            entry = shard[session_id] = MemoryEntry(session_id, window_size)
+            logger.info(
+                "New session created: id=%s window=%d", session_id, window_size
+            )
+            over = _count_sessions(1) - MAX_SESSIONS
+            # Over the global cap: drop this shard's least-recently-used
+            # sessions (never the one just created)
+            while over > 0 and len(shard) > 1:
+                sid, _ = shard.popitem(last=False)
+                over = _count_sessions(-1) - MAX_SESSIONS
+                logger.info("Session dropped (capacity %d): id=%s", MAX_SESSIONS, sid)
+        else:
+            shard.move_to_end(session_id)
+        entry.touch()
+    if over > 0:
+        # This shard held only the new session; take the overflow elsewhere
+        _drop_lru_elsewhere(i, over)
     return entry.memory
 
 
+def _drop_lru_elsewhere(skip: int, n: int) -> None:
+    """
+    Drop up to n least-recently-used sessions from shards other than `skip`,
+    oldest shard front first.  Shards are locked one at a time.
+    """
+    for j, (shard, lock) in enumerate(zip(_shards, _shard_locks)):
+        if j == skip:
+            continue
+        with lock:
+            while n > 0 and shard:
+                sid, _ = shard.popitem(last=False)
+                _count_sessions(-1)
+                n -= 1
+                logger.info("Session dropped (capacity %d): id=%s", MAX_SESSIONS, sid)
+        if n <= 0:
+            return
+
+
 def clear_session(session_id: str) -> bool:
     """Remove a session's memory. Returns True if the session existed."""
-    if session_id in _sessions:
-        del _sessions[session_id]
-        logger.info("Session cleared: id=%s", session_id)
-        return True
-    return False
+    i = _shard_index(session_id)
+    with _shard_locks[i]:
+        if _shards[i].pop(session_id, None) is None:
+            return False
+        _count_sessions(-1)
+    logger.info("Session cleared: id=%s", session_id)
+    return True
 
 
 def get_session_info(session_id: str) -> Optional[dict]:
     """Return metadata for a session, or None if it does not exist."""
-    entry = _sessions.get(session_id)
+    entry = _shards[_shard_index(session_id)].get(session_id)
     return entry.to_dict() if entry else None
 
 
@@ -100,18 +182,27 @@ def evict_stale_sessions(max_age_seconds: float = 3600.0) -> int:
     Remove sessions that have not been accessed within `max_age_seconds`.
     Called periodically to prevent unbounded memory growth.
     Returns the number of sessions evicted.
+
+    Each shard is stored oldest-access first, so this pops from the front
+    of each shard and stops at its first fresh session: O(stale), not
+    O(total).  Shards are locked one at a time.
     """
-    stale = [
-        sid for sid, entry in _sessions.items()
-        if entry.age_seconds() > max_age_seconds
-    ]
-    for sid in stale:
-        del _sessions[sid]
-    if stale:
-        logger.info("Evicted %d stale sessions", len(stale))
-    return len(stale)
+    cutoff = time.monotonic() - max_age_seconds
+    count = 0
+    for shard, lock in zip(_shards, _shard_locks):
+        with lock:
+            while shard:
+                entry = next(iter(shard.values()))
+                if entry.last_accessed >= cutoff:
+                    break
+                shard.popitem(last=False)
+                _count_sessions(-1)
+                count += 1
+    if count:
+        logger.info("Evicted %d stale sessions", count)
+    return count
 
 
 def active_session_count() -> int:
     """Return the number of active (non-evicted) sessions."""
-    return len(_sessions)
+    return _session_count
@@ -0,0 +1,39 @@
+"""
+Money Rounding
+Paisa rounding shared by the rice-mill calculators: scalar and vectorized
+(NumPy) forms that agree bit for bit with CPython's round(x, 2), so a
+batch path produces the same rupee figures as the per-item path.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+
+def round_paise(rupees: float) -> int:
+    """round(rupees, 2) as integer paise."""
+    return round(round(rupees, 2) * 100)
+
+
+def round2_vec(x: np.ndarray) -> np.ndarray:
+    """
+    Elementwise round(x, 2) exactly as CPython computes it (half-even on the
+    exact binary value), where np.round rounds the already-rounded x * 100.
+    x * 100 is split exactly into hi + lo (Dekker's two-product) so ties in
+    hi are broken by the sign of lo.
+    """
+    hi = x * 100.0
+    c  = 134217729.0 * x                    # 2**27 + 1: split x into xh + xl
+    xh = c - (c - x)
+    xl = x - xh
+    lo = (xh * 100.0 - hi) + xl * 100.0
+    r  = np.rint(hi)
+    d  = hi - r
+    r += (d == 0.5) & (lo > 0.0)
+    r -= (d == -0.5) & (lo < 0.0)
+    return r / 100.0
+
+
+def round_paise_vec(x: np.ndarray) -> np.ndarray:
+    """Elementwise round_paise, as int64."""
+    return np.rint(round2_vec(x) * 100.0).astype(np.int64)
@@ -15,14 +15,36 @@ Entity types (paper §3.3):
 Architecture:
   Primary: spaCy NER pipeline with custom financial entity ruler patterns
   Fallback: regex + curated gazetteer for environments without spaCy
+            (gazetteers matched in one pass: Aho-Corasick when
+            pyahocorasick is installed, else a compiled alternation)
 """
 
 from __future__ import annotations
 
+import functools
+import importlib.util
 import logging
+import os
 import re
+import threading
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Set, Tuple
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+try:
+    import re2
+    RE2_AVAILABLE = True
+except ImportError:
+    RE2_AVAILABLE = False
+
+# spaCy itself is imported only when the first pipeline is built (the import
+# is slow); find_spec just checks that it is installed.
+SPACY_AVAILABLE = importlib.util.find_spec("spacy") is not None
 
 logger = logging.getLogger(__name__)
 
@@ -32,6 +54,9 @@ logger = logging.getLogger(__name__)
 
 ENTITY_TYPES = ["STOCK", "CRYPTO", "TAX_TERM", "ACCOUNT", "AMOUNT", "TIME_PERIOD", "FUND"]
 
+# Distinct query strings whose extraction results are memoized per NER
+EXTRACT_CACHE_SIZE = 4096
+
 # ---------------------------------------------------------------------------
 # Financial gazetteers
 # ---------------------------------------------------------------------------
@@ -100,58 +125,133 @@ _FUNDS = {
     "mutual fund": None,
 }
 
+
+def _index_gazetteers() -> Tuple[
+    List[Tuple[str, str, Optional[str]]], Dict[str, List[int]], Dict[str, List[int]]
+]:
+    """
+    Number every gazetteer entry, as (key, entity_type, canonical), in
+    emission order (stocks, crypto, tax terms, accounts, funds), and map each
+    match pattern to the entry ids it hits.  Patterns are lowercased here,
+    once, and matched against the lowercased query; tickers are
+    case-sensitive and matched against the raw query.
+    """
+    entries: List[Tuple[str, str, Optional[str]]] = []
+    lower_ids: Dict[str, List[int]] = {}
+    text_ids: Dict[str, List[int]] = {}
+
+    def _entry(key: str, etype: str, canonical: Optional[str]) -> int:
+        entries.append((key, etype, canonical))
+        return len(entries) - 1
+
+    for ticker, name in _STOCKS.items():
+        idx = _entry(ticker, "STOCK", name)
+        text_ids.setdefault(ticker, []).append(idx)
+        if name:
+            lower_ids.setdefault(name.lower(), []).append(idx)
+    # Crypto keys are matched as written against the lowered text
+    for symbol, name in _CRYPTO.items():
+        lower_ids.setdefault(symbol, []).append(_entry(symbol, "CRYPTO", name))
+    for etype, gazetteer in (
+        ("TAX_TERM", _TAX_TERMS), ("ACCOUNT", _ACCOUNTS), ("FUND", _FUNDS),
+    ):
+        for key, canonical in gazetteer.items():
+            lower_ids.setdefault(key.lower(), []).append(_entry(key, etype, canonical))
+    return entries, lower_ids, text_ids
+
+
+_GAZETTEER, _LOWER_PATTERN_IDS, _TEXT_PATTERN_IDS = _index_gazetteers()
+
+# (lowercased term, entity type) -> canonical name, for the spaCy ruler's
+# matches; the first gazetteer entry for a term wins, as in the fallback
+_CANONICAL: Dict[Tuple[str, str], Optional[str]] = {}
+for _key, _etype, _canonical in _GAZETTEER:
+    _CANONICAL.setdefault((_key.lower(), _etype), _canonical)
+for _name in filter(None, _STOCKS.values()):
+    _CANONICAL.setdefault((_name.lower(), "STOCK"), _name)
+del _key, _etype, _canonical, _name
+
 # ---------------------------------------------------------------------------
 # Regex patterns
 # ---------------------------------------------------------------------------
 
-_AMOUNT_RE = re.compile(
-    r"""
-    (?:
-        \$\s*[\d,]+(?:\.\d{1,2})?[kKmMbB]?  # $5,000  $10k  $1.5M
-        |
-        [\d,]+(?:\.\d{1,2})?\s*(?:dollars?|usd)  # 5000 dollars
-        |
-        \d+(?:\.\d+)?\s*%  # 10%  0.5%
-        |
-        \$[\d,]+(?:\.\d{1,2})?\s*/\s*(?:month|year|week)  # $500/month
-    )
-    """,
-    re.VERBOSE | re.IGNORECASE,
+# Sources are kept flat (no re.VERBOSE) and made case-insensitive by an inline
+# flag at compile time so the same strings compile under both `re` and RE2.
+_AMOUNT_SRC = (
+    r"(?:"
+    r"\$\s*[\d,]+(?:\.\d{1,2})?[kmb]?"                      # $5,000  $10k  $1.5M  $500(/month)
+    r"|[\d,]+(?:\.\d{1,2})?\s*(?:dollars?|usd)"            # 5000 dollars
+    r"|\d+(?:\.\d+)?\s*%"                                  # 10%  0.5%
+    r")"
 )
 
-_TIME_RE = re.compile(
-    r"""
-    (?:
-        (?:jan(?:uary)?|feb(?:ruary)?|mar(?:ch)?|apr(?:il)?|may|
-           jun(?:e)?|jul(?:y)?|aug(?:ust)?|sep(?:tember)?|oct(?:ober)?|
-           nov(?:ember)?|dec(?:ember)?)\s+\d{1,2}(?:st|nd|rd|th)?(?:,?\s+\d{4})?
-        |
-        april\s+15  # Tax deadline
-        |
-        Q[1-4]\s*\d{4}  # Q1 2024
-        |
-        (?:FY|fiscal\s+year)\s*\d{4}  # FY2024
-        |
-        \d{4}  # standalone year 2024
-        |
-        this\s+(?:year|month|quarter)
-        |
-        next\s+(?:year|month|quarter)
-        |
-        \d+\s+(?:year|month|week|day)s?
-    )
-    """,
-    re.VERBOSE | re.IGNORECASE,
+# Month names factored by shared prefix; "april 15" (the tax deadline) is
+# covered by the month-day branch.
+_TIME_SRC = (
+    r"(?:"
+    r"(?:jan(?:uary)?|feb(?:ruary)?|ma(?:r(?:ch)?|y)|apr(?:il)?|ju(?:ne?|ly?)|"
+    r"aug(?:ust)?|sep(?:tember)?|oct(?:ober)?|nov(?:ember)?|dec(?:ember)?)"
+    r"\s+\d{1,2}(?:st|nd|rd|th)?(?:,?\s+\d{4})?"            # March 5th, 2024
+    r"|Q[1-4]\s*\d{4}"                                      # Q1 2024
+    r"|(?:FY|fiscal\s+year)\s*\d{4}"                        # FY2024
+    r"|\d{4}"                                               # standalone year 2024
+    r"|(?:this|next)\s+(?:year|month|quarter)"
+    r"|\d+\s+(?:year|month|week|day)s?"
+    r")"
 )
 
-_TICKER_RE = re.compile(r"\b([A-Z]{1,5})(?:\.[A-Z])?\b")
+# RE2 matches in guaranteed linear time (no backtracking) on untrusted
+# query text; `re` is the fallback when google-re2 is not installed.
+_compile_regex = re2.compile if RE2_AVAILABLE else re.compile
+
+# AMOUNT and TIME_PERIOD are scanned in separate passes: their matches may
+# overlap ("May 5 1000 dollars" holds both "May 5 1000" and "1000 dollars"),
+# and a single alternation would let one swallow the other.
+_AMOUNT_RE = _compile_regex(f"(?i){_AMOUNT_SRC}")
+_TIME_RE = _compile_regex(f"(?i){_TIME_SRC}")
+
+
+def _build_automaton(pattern_ids: Dict[str, List[int]]):
+    automaton = ahocorasick.Automaton()
+    for pattern, ids in pattern_ids.items():
+        automaton.add_word(pattern, tuple(ids))
+    automaton.make_automaton()
+    return automaton
+
+
+def _build_lookahead_re(
+    pattern_ids: Dict[str, List[int]],
+) -> Tuple[re.Pattern, Dict[str, Tuple[int, ...]]]:
+    """
+    Compile gazetteer patterns into one alternation for a single finditer
+    pass.  The alternation sits in a lookahead so every start position is
+    tried (overlapping terms such as "roth ira" / "ira" are all found);
+    longer patterns come first, so group 1 is the longest pattern starting
+    there, and its id list is closed over the shorter patterns that are its
+    prefixes ("1099-nec" also reports "1099").  Patterns are grouped under
+    their first character, so at each position the engine tests one literal
+    per distinct first character instead of every pattern.
+    """
+    patterns = sorted(pattern_ids, key=len, reverse=True)
+    tails_by_first: Dict[str, List[str]] = {}
+    for p in patterns:
+        tails_by_first.setdefault(p[0], []).append(re.escape(p[1:]))
+    regex = re.compile("(?=(" + "|".join(
+        re.escape(first) + "(?:" + "|".join(tails) + ")"
+        for first, tails in tails_by_first.items()
+    ) + "))")
+    closure = {
+        p: tuple(i for q in patterns if p.startswith(q) for i in pattern_ids[q])
+        for p in patterns
+    }
+    return regex, closure
 
 
 # ---------------------------------------------------------------------------
 # Entity dataclass
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class FinancialEntity:
     text: str
     entity_type: str
@@ -160,7 +260,7 @@ class FinancialEntity:
     end: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class NERResult:
     entities: List[FinancialEntity] = field(default_factory=list)
     entity_map: Dict[str, List[str]] = field(default_factory=dict)
@@ -175,6 +275,49 @@ class NERResult:
         return "; ".join(parts)
 
 
+@functools.lru_cache(maxsize=1)
+def _financial_spacy_pipeline():
+    """
+    spaCy blank-English pipeline with the financial entity rulers, built
+    once per process and shared by every FinancialNER.  Raises if spaCy is
+    unavailable (failures are not cached).
+    """
+    import spacy  # noqa: PLC0415
+    nlp = spacy.blank("en")
+
+    patterns = []
+    for ticker in _STOCKS:
+        patterns.append({"label": "STOCK", "pattern": ticker})
+    for name in _STOCKS.values():
+        patterns.append({"label": "STOCK", "pattern": name})
+    for symbol in _CRYPTO:
+        patterns.append({"label": "CRYPTO", "pattern": symbol})
+    for term in _TAX_TERMS:
+        patterns.append({"label": "TAX_TERM", "pattern": term})
+    for acct in _ACCOUNTS:
+        patterns.append({"label": "ACCOUNT", "pattern": acct})
+    for fund in _FUNDS:
+        patterns.append({"label": "FUND", "pattern": fund})
+
+    # Names and terms match on lowercased tokens ("Roth IRA" hits
+    # "roth ira"); all-caps tickers and acronyms stay exact so
+    # "V", "AMT" or "DOT" do not fire on ordinary words.  The
+    # case-insensitive ruler runs second and only adds entities
+    # that do not overlap the first's ("1099-NEC" beats "1099").
+    exact = [p for p in patterns if p["pattern"].isupper()]
+    folded = [p for p in patterns if not p["pattern"].isupper()]
+    nlp.add_pipe(
+        "entity_ruler", name="financial_symbols",
+        config={"validate": False},
+    ).add_patterns(exact)
+    nlp.add_pipe(
+        "entity_ruler", name="financial_terms",
+        config={"phrase_matcher_attr": "LOWER", "validate": False},
+    ).add_patterns(folded)
+    logger.info("spaCy financial EntityRuler loaded (%d patterns).", len(patterns))
+    return nlp
+
+
 # ---------------------------------------------------------------------------
 # NER engine
 # ---------------------------------------------------------------------------
@@ -191,66 +334,74 @@ class FinancialNER:
     def __init__(self):
         self._nlp = None
         self._try_load_spacy()
+        self._build_gazetteer_matchers()
+        self._extract_cached = functools.lru_cache(maxsize=EXTRACT_CACHE_SIZE)(
+            self._extract_uncached
+        )
+
+    def _build_gazetteer_matchers(self) -> None:
+        """Aho-Corasick automata when available, else lookahead regexes."""
+        self._ac_lower = self._ac_text = None
+        if AHOCORASICK_AVAILABLE:
+            self._ac_lower = _build_automaton(_LOWER_PATTERN_IDS)
+            self._ac_text = _build_automaton(_TEXT_PATTERN_IDS)
+        else:
+            self._re_lower, self._re_lower_ids = _build_lookahead_re(_LOWER_PATTERN_IDS)
+            self._re_text, self._re_text_ids = _build_lookahead_re(_TEXT_PATTERN_IDS)
+
+    def _gazetteer_hits(self, text: str, lower: str) -> Set[int]:
+        """Ids of every gazetteer entry occurring in the text."""
+        hits: Set[int] = set()
+        if self._ac_lower is not None:
+            for _, ids in self._ac_lower.iter(lower):
+                hits.update(ids)
+            for _, ids in self._ac_text.iter(text):
+                hits.update(ids)
+        else:
+            for m in self._re_lower.finditer(lower):
+                hits.update(self._re_lower_ids[m.group(1)])
+            for m in self._re_text.finditer(text):
+                hits.update(self._re_text_ids[m.group(1)])
+        return hits
 
     def _try_load_spacy(self) -> None:
+        if not SPACY_AVAILABLE:
+            logger.warning("spaCy not installed; using regex/gazetteer fallback.")
+            self._nlp = None
+            return
         try:
-            import spacy  # noqa: PLC0415
-            self._nlp = spacy.blank("en")
-            ruler = self._nlp.add_pipe("entity_ruler")
-
-            patterns = []
-            for ticker in _STOCKS:
-                patterns.append({"label": "STOCK", "pattern": ticker})
-            for name in _STOCKS.values():
-                patterns.append({"label": "STOCK", "pattern": name})
-            for symbol in _CRYPTO:
-                patterns.append({"label": "CRYPTO", "pattern": symbol})
-            for term in _TAX_TERMS:
-                patterns.append({"label": "TAX_TERM", "pattern": term})
-            for acct in _ACCOUNTS:
-                patterns.append({"label": "ACCOUNT", "pattern": acct})
-            for fund in _FUNDS:
-                patterns.append({"label": "FUND", "pattern": fund})
-
-            ruler.add_patterns(patterns)
-            logger.info("spaCy financial EntityRuler loaded (%d patterns).", len(patterns))
+            self._nlp = _financial_spacy_pipeline()
         except Exception as exc:
             logger.warning("spaCy unavailable (%s); using regex/gazetteer fallback.", exc)
             self._nlp = None
 
-    def _gazetteer_lookup(self, text: str) -> List[FinancialEntity]:
-        """Scan text against all gazetteers and regex patterns."""
+    def _gazetteer_lookup(
+        self, text: str, seen: Set[Tuple[str, str]], terms: bool = True
+    ) -> List[FinancialEntity]:
+        """
+        Scan text against all gazetteers (skipped when terms is False) and
+        the AMOUNT / TIME_PERIOD regexes.  Matches whose (lowercased text,
+        type) is already in seen are skipped before an entity is built; seen
+        is updated with every entity emitted.
+        """
         lower = text.lower()
         entities: List[FinancialEntity] = []
 
         def _add(match_text: str, etype: str, canonical: Optional[str] = None):
+            key = (match_text.lower(), etype)
+            if key in seen:
+                return
+            seen.add(key)
             entities.append(FinancialEntity(text=match_text, entity_type=etype, canonical=canonical))
 
-        # Gazetteers
-        for ticker, name in _STOCKS.items():
-            if ticker in text or (name and name.lower() in lower):
-                _add(ticker, "STOCK", name)
-
-        for symbol, name in _CRYPTO.items():
-            if symbol in lower:
-                _add(symbol, "CRYPTO", name)
-
-        for term, definition in _TAX_TERMS.items():
-            if term.lower() in lower:
-                _add(term, "TAX_TERM", definition)
-
-        for acct, canonical in _ACCOUNTS.items():
-            if acct.lower() in lower:
-                _add(acct, "ACCOUNT", canonical)
-
-        for fund, name in _FUNDS.items():
-            if fund.lower() in lower:
-                _add(fund, "FUND", name)
+        # Gazetteers, emitted in gazetteer order
+        if terms:
+            for idx in sorted(self._gazetteer_hits(text, lower)):
+                _add(*_GAZETTEER[idx])
 
-        # Regex patterns
+        # Regex patterns: amounts first, then time periods
         for m in _AMOUNT_RE.finditer(text):
             _add(m.group(), "AMOUNT")
-
         for m in _TIME_RE.finditer(text):
             _add(m.group(), "TIME_PERIOD")
 
@@ -260,47 +411,85 @@ class FinancialNER:
         """
         Extract financial entities from a query string.
 
+        Results are memoized per exact query text (ticker matching is
+        case-sensitive and spans refer to the original string, so the text
+        is not normalized).  Each call gets fresh lists around the shared,
+        frozen FinancialEntity objects.
+
         Returns:
             NERResult with entity list and entity_map (type → [texts]) dict.
         """
         if not text.strip():
             return NERResult()
 
-        entities: List[FinancialEntity] = []
-        method = "regex_gazetteer"
+        cached = self._extract_cached(text)
+        return NERResult(
+            entities=list(cached.entities),
+            entity_map={etype: list(texts) for etype, texts in cached.entity_map.items()},
+            method=cached.method,
+        )
 
+    def extract_batch(self, texts: List[str], batch_size: int = 64) -> List[NERResult]:
+        """
+        Extract entities from many queries at once.  With spaCy loaded the
+        texts are streamed through nlp.pipe, amortizing per-call pipeline
+        overhead; otherwise this is equivalent to calling extract() on each.
+        """
+        if not self._nlp:
+            return [self.extract(text) for text in texts]
+        try:
+            docs = list(self._nlp.pipe(texts, batch_size=batch_size))
+        except Exception as exc:
+            logger.warning("spaCy batch extraction failed (%s); falling back.", exc)
+            return [self.extract(text) for text in texts]
+        return [
+            self._build_result(text, doc) if text.strip() else NERResult()
+            for text, doc in zip(texts, docs)
+        ]
+
+    def _extract_uncached(self, text: str) -> NERResult:
+        doc = None
         if self._nlp:
             try:
                 doc = self._nlp(text)
-                for ent in doc.ents:
-                    entities.append(FinancialEntity(
-                        text=ent.text,
-                        entity_type=ent.label_,
-                        start=ent.start_char,
-                        end=ent.end_char,
-                    ))
-                method = "spacy_ruler"
             except Exception as exc:
                 logger.warning("spaCy extraction failed (%s); falling back.", exc)
+        return self._build_result(text, doc)
 
-        if not entities:
-            entities = self._gazetteer_lookup(text)
-
-        # Deduplicate by (text, entity_type)
-        seen = set()
-        unique = []
-        for ent in entities:
-            key = (ent.text.lower(), ent.entity_type)
-            if key not in seen:
+    def _build_result(self, text: str, doc) -> NERResult:
+        """NERResult from a spaCy doc (None if spaCy is unavailable or failed)."""
+        entities: List[FinancialEntity] = []
+        method = "regex_gazetteer"
+        # (lowercased text, type) pairs already emitted; duplicates are
+        # dropped before an entity is built
+        seen: Set[Tuple[str, str]] = set()
+
+        if doc is not None:
+            for ent in doc.ents:
+                key = (ent.text.lower(), ent.label_)
+                if key in seen:
+                    continue
                 seen.add(key)
-                unique.append(ent)
+                entities.append(FinancialEntity(
+                    text=ent.text,
+                    entity_type=ent.label_,
+                    canonical=_CANONICAL.get(key),
+                    start=ent.start_char,
+                    end=ent.end_char,
+                ))
+            method = "spacy_ruler"
+
+        # The rulers only know gazetteer terms: the gazetteer scan stands in
+        # for them when they found nothing, and amounts / time periods are
+        # always scanned
+        entities.extend(self._gazetteer_lookup(text, seen, terms=not entities))
 
         # Build entity_map
         entity_map: Dict[str, List[str]] = {}
-        for ent in unique:
+        for ent in entities:
             entity_map.setdefault(ent.entity_type, []).append(ent.text)
 
-        return NERResult(entities=unique, entity_map=entity_map, method=method)
+        return NERResult(entities=entities, entity_map=entity_map, method=method)
 
 
 # ---------------------------------------------------------------------------
@@ -308,15 +497,24 @@ class FinancialNER:
 # ---------------------------------------------------------------------------
 
 _ner: Optional[FinancialNER] = None
+_ner_lock = threading.Lock()
 
 
 def get_ner() -> FinancialNER:
     global _ner
     if _ner is None:
-        _ner = FinancialNER()
+        with _ner_lock:
+            if _ner is None:
+                _ner = FinancialNER()
     return _ner
 
 
 def extract_entities(text: str) -> NERResult:
     """Module-level convenience wrapper for entity extraction."""
     return get_ner().extract(text)
+
+
+# Opt-in warm start: build the extractor (and spaCy pipeline) at import so
+# the first request does not pay for it.
+if os.environ.get("EAGER_NER_LOAD", "0") == "1":
+    get_ner()
@@ -13,8 +13,18 @@ Computes:
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field, asdict
-from typing import Dict, List, Optional
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+import msgspec
+import numpy as np
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    prange = range
+    NUMBA_AVAILABLE = False
 
 
 # ---------------------------------------------------------------------------
@@ -64,7 +74,7 @@ STANDARD_DEDUCTION_OLD = 50_000
 # Data structures
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class SalaryStructure:
     """Input salary structure for an employee."""
     employee_id:       str
@@ -97,7 +107,7 @@ class SalaryStructure:
         return self.gross_monthly * 12
 
 
-@dataclass
+@dataclass(slots=True)
 class EPFBreakdown:
     employee_contribution: float
     employer_epf:          float   # 3.67% to EPF
@@ -107,7 +117,7 @@ class EPFBreakdown:
     total_epf_outflow:     float   # Employer cost (employer PF + admin)
 
 
-@dataclass
+@dataclass(slots=True)
 class ESICBreakdown:
     applicable:            bool
     employee_contribution: float
@@ -115,7 +125,7 @@ class ESICBreakdown:
     total:                 float
 
 
-@dataclass
+@dataclass(slots=True)
 class TDSBreakdown:
     annual_gross:          float
     standard_deduction:    float
@@ -129,7 +139,7 @@ class TDSBreakdown:
     effective_tds_rate:    float
 
 
-@dataclass
+@dataclass(slots=True)
 class Payslip:
     """Monthly payslip for an employee."""
     employee_id:       str
@@ -164,7 +174,7 @@ class Payslip:
     tds_detail:        TDSBreakdown
 
 
-@dataclass
+@dataclass(slots=True)
 class PayrollRunResult:
     month:            str
     payslips:         List[Payslip]
@@ -183,6 +193,228 @@ class PayrollRunResult:
     alerts:           List[str]
 
 
+# ---------------------------------------------------------------------------
+# Payroll arithmetic — integer paise, compiled with Numba if present
+# ---------------------------------------------------------------------------
+#
+# Every amount is an integer number of paise and every rate an integer number
+# of basis points, so products are exact and each rounding to the paisa is a
+# single half-even integer division (_div_round).  Rupees come back only when
+# the payslip is built.
+
+_BP = 10_000    # basis points per unit rate
+
+
+def _bp(rate: float) -> int:
+    return round(rate * _BP)
+
+
+def _paise(rupees: float) -> int:
+    return round(rupees * 100)
+
+
+_EPF_EE_BP    = _bp(EPF_EMPLOYEE_RATE)
+_EPS_ER_BP    = _bp(0.0833)
+_EPF_ER_BP    = _bp(0.0367)
+_EPF_ADMIN_BP = _bp(EPF_ADMIN_CHARGE)
+_ESIC_EE_BP   = _bp(ESIC_EMPLOYEE_RATE)
+_ESIC_ER_BP   = _bp(ESIC_EMPLOYER_RATE)
+_CESS_BP      = _bp(0.04)
+
+_EPF_WAGE_CAP_P  = _paise(EPF_WAGE_CAP)
+_EPS_CAP_P       = _paise(1_250)           # EPS capped ₹1,250
+_ESIC_LIMIT_P    = _paise(ESIC_WAGE_LIMIT)
+_STD_DED_NEW_P   = _paise(STANDARD_DEDUCTION_NEW)
+_STD_DED_OLD_P   = _paise(STANDARD_DEDUCTION_OLD)
+_SEC80C_CAP_P    = _paise(150_000)
+_SEC80D_CAP_P    = _paise(25_000)
+_REBATE_LIMIT_NEW_P, _REBATE_CAP_NEW_P = _paise(700_000), _paise(25_000)
+_REBATE_LIMIT_OLD_P, _REBATE_CAP_OLD_P = _paise(500_000), _paise(12_500)
+
+
+def _slab_tables(slabs: List[tuple]) -> Tuple[tuple, tuple, tuple]:
+    """
+    (upper bounds in paise, cumulative tax below each slab in paise x bp,
+    rates in bp) as int tuples (Numba can read tuples, not lists, as
+    globals).  The open-ended top slab has no bound.  cum_tax[i] is the tax
+    on all income up to the previous bound, so the tax on any income is one
+    lookup plus one multiply.
+    """
+    bounds = tuple(_paise(t) for t, _ in slabs[:-1])
+    rates = tuple(_bp(r) for _, r in slabs)
+    cum_tax = [0]
+    prev = 0
+    for bound, rate in zip(bounds, rates):
+        cum_tax.append(cum_tax[-1] + (bound - prev) * rate)
+        prev = bound
+    return bounds, tuple(cum_tax), rates
+
+
+_NEW_BOUNDS, _NEW_CUM_TAX, _NEW_RATES = _slab_tables(NEW_REGIME_ANNUAL_SLABS)
+_OLD_BOUNDS, _OLD_CUM_TAX, _OLD_RATES = _slab_tables(OLD_REGIME_ANNUAL_SLABS)
+
+# Width of the tuple returned by _payroll_row
+_N_OUTPUTS = 24
+
+
+def _div_round(num: int, den: int) -> int:
+    """num / den rounded half-even to an integer (den > 0)."""
+    q = num // den
+    r2 = 2 * (num - q * den)
+    if r2 > den or (r2 == den and q % 2 == 1):
+        q += 1
+    return q
+
+
+def _slab_tax(taxable: int, bounds, cum_tax, rates) -> int:
+    """Slab tax (paise x bp) on `taxable` paise: binary search, then closed form."""
+    lo, hi = 0, len(bounds)
+    while lo < hi:                      # first bound >= taxable
+        mid = (lo + hi) // 2
+        if bounds[mid] < taxable:
+            lo = mid + 1
+        else:
+            hi = mid
+    floor = bounds[lo - 1] if lo else 0
+    return cum_tax[lo] + (taxable - floor) * rates[lo]
+
+
+def _tds_row(
+    annual_gross: int, epf_ee_monthly: int, is_new: int, is_old: int,
+    sec80c: int, sec80d: int, hra_exemption: int, other_deductions: int,
+):
+    """
+    Sec 192 TDS for one employee, in paise.  Returns (std_ded, chapter_vi,
+    taxable, basic_tax, rebate, cess, annual_tds, monthly_tds, eff_rate),
+    with eff_rate in hundredths of a percent.
+    """
+    std_ded = _STD_DED_NEW_P if is_new else _STD_DED_OLD_P
+
+    chapter_vi = 0
+    if is_old:
+        chapter_vi = (min(sec80c + epf_ee_monthly * 12, _SEC80C_CAP_P)
+                      + min(sec80d, _SEC80D_CAP_P)
+                      + hra_exemption
+                      + other_deductions)
+
+    taxable = max(0, annual_gross - std_ded - chapter_vi)
+
+    # Tax in paise x bp; cess and the annual total in paise x bp^2
+    if is_new:
+        basic_tax = _slab_tax(taxable, _NEW_BOUNDS, _NEW_CUM_TAX, _NEW_RATES)
+    else:
+        basic_tax = _slab_tax(taxable, _OLD_BOUNDS, _OLD_CUM_TAX, _OLD_RATES)
+
+    # Rebate 87A
+    rebate_limit = _REBATE_LIMIT_NEW_P if is_new else _REBATE_LIMIT_OLD_P
+    rebate_cap   = _REBATE_CAP_NEW_P   if is_new else _REBATE_CAP_OLD_P
+    rebate       = min(basic_tax, rebate_cap * _BP) if taxable <= rebate_limit else 0
+    basic_tax   -= rebate
+
+    cess       = basic_tax * _CESS_BP
+    annual_tds = basic_tax * _BP + cess
+    eff_rate   = _div_round(annual_tds, annual_gross * _BP) if annual_gross else 0
+
+    return (
+        std_ded, chapter_vi, taxable,
+        _div_round(basic_tax, _BP), _div_round(rebate, _BP),
+        _div_round(cess, _BP * _BP), _div_round(annual_tds, _BP * _BP),
+        _div_round(annual_tds, 12 * _BP * _BP), eff_rate,
+    )
+
+
+def _payroll_row(
+    basic: int, hra: int, special: int, lta: int, medical: int,
+    other: int, vpf: int, pt: int, is_new: int, is_old: int,
+    sec80c: int, sec80d: int, hra_exemption: int, other_deductions: int,
+):
+    """
+    All statutory arithmetic for one employee, in integer paise.  Returns a
+    flat tuple of _N_OUTPUTS ints, unpacked by PayrollEngine._build_payslip.
+    """
+    # EPF
+    epf_basic = min(basic, _EPF_WAGE_CAP_P)
+    epf_ee    = _div_round(basic * _EPF_EE_BP, _BP) + vpf
+    eps_er    = min(_div_round(epf_basic * _EPS_ER_BP, _BP), _EPS_CAP_P)
+    epf_er_to_epf = _div_round(epf_basic * _EPF_ER_BP, _BP)
+    epf_er_total  = eps_er + epf_er_to_epf
+    admin     = _div_round(basic * _EPF_ADMIN_BP, _BP)
+    epf_outflow = epf_er_total + admin
+
+    # ESIC
+    gross_m = basic + hra + special + lta + medical + other
+    esic_applicable = gross_m <= _ESIC_LIMIT_P
+    esic_ee    = _div_round(gross_m * _ESIC_EE_BP, _BP) if esic_applicable else 0
+    esic_er    = _div_round(gross_m * _ESIC_ER_BP, _BP) if esic_applicable else 0
+    esic_total = (_div_round(gross_m * (_ESIC_EE_BP + _ESIC_ER_BP), _BP)
+                  if esic_applicable else 0)
+
+    # TDS
+    annual_gross = gross_m * 12
+    (std_ded, chapter_vi, taxable, basic_tax, rebate, cess,
+     annual_tds, monthly_tds, eff_rate) = _tds_row(
+        annual_gross, epf_ee, is_new, is_old,
+        sec80c, sec80d, hra_exemption, other_deductions,
+    )
+
+    # Deductions from gross
+    total_ded = epf_ee + esic_ee + pt + monthly_tds
+    net       = gross_m - total_ded
+
+    # CTC
+    ctc_monthly = gross_m + epf_outflow + esic_er
+
+    return (
+        gross_m,
+        epf_ee, epf_er_to_epf, eps_er, epf_er_total, admin, epf_outflow,
+        1 if esic_applicable else 0, esic_ee, esic_er, esic_total,
+        annual_gross, std_ded, chapter_vi, taxable, basic_tax, rebate, cess,
+        annual_tds, monthly_tds, eff_rate,
+        total_ded, net, ctc_monthly,
+    )
+
+
+def _payroll_kernel(inputs: np.ndarray) -> np.ndarray:
+    """
+    _payroll_row over every row of an (n, 14) int64 input matrix.  Rows are
+    independent, so the compiled kernel spreads them across threads.
+    """
+    n = inputs.shape[0]
+    out = np.empty((n, _N_OUTPUTS), dtype=np.int64)
+    for i in prange(n):
+        x = inputs[i]
+        row = _payroll_row(x[0], x[1], x[2], x[3], x[4], x[5], x[6],
+                           x[7], x[8], x[9], x[10], x[11], x[12], x[13])
+        for j in range(_N_OUTPUTS):
+            out[i, j] = row[j]
+    return out
+
+
+if NUMBA_AVAILABLE:
+    # Compiled versions replace the Python ones; globals referenced inside
+    # them (_div_round, _slab_tax, ...) resolve to these dispatchers at
+    # compile time.  cache=True persists the machine code across processes.
+    _div_round = njit(cache=True)(_div_round)
+    _slab_tax = njit(cache=True)(_slab_tax)
+    _tds_row = njit(cache=True)(_tds_row)
+    _payroll_row = njit(cache=True)(_payroll_row)
+    _payroll_kernel = njit(cache=True, parallel=True)(_payroll_kernel)
+
+
+def _salary_inputs(emp: SalaryStructure) -> Tuple[int, ...]:
+    """An employee's kernel input row in paise (column order of _payroll_row)."""
+    return (
+        _paise(emp.basic_monthly), _paise(emp.hra_monthly),
+        _paise(emp.special_allowance), _paise(emp.lta_monthly),
+        _paise(emp.medical_allowance), _paise(emp.other_allowances),
+        _paise(emp.voluntary_pf), _paise(emp.professional_tax_monthly),
+        1 if emp.regime == "new" else 0,
+        1 if emp.regime == "old" else 0,
+        _paise(emp.sec80c), _paise(emp.sec80d),
+        _paise(emp.hra_exemption), _paise(emp.other_deductions),
+    )
+
+
 # ---------------------------------------------------------------------------
 # Payroll Engine
 # ---------------------------------------------------------------------------
@@ -205,17 +437,21 @@ class PayrollEngine:
         self._employees.append(emp)
 
     def run(self) -> PayrollRunResult:
-        payslips = [self._process_employee(emp) for emp in self._employees]
-
-        total_gross  = sum(p.gross_earnings for p in payslips)
-        total_tds    = sum(p.tds for p in payslips)
-        total_epf_ee = sum(p.epf_employee for p in payslips)
-        total_epf_er = sum(p.epf_employer for p in payslips)
-        total_esic_ee= sum(p.esic_employee for p in payslips)
-        total_esic_er= sum(p.esic_employer for p in payslips)
-        total_pt     = sum(p.professional_tax for p in payslips)
-        total_net    = sum(p.net_take_home for p in payslips)
-        total_ctc    = sum(p.total_ctc_monthly for p in payslips)
+        payslips = self._compute_payslips()
+
+        # Accumulate every total in one pass over the payslips
+        total_gross = total_tds = total_epf_ee = total_epf_er = 0.0
+        total_esic_ee = total_esic_er = total_pt = total_net = total_ctc = 0.0
+        for p in payslips:
+            total_gross  += p.gross_earnings
+            total_tds    += p.tds
+            total_epf_ee += p.epf_employee
+            total_epf_er += p.epf_employer
+            total_esic_ee+= p.esic_employee
+            total_esic_er+= p.esic_employer
+            total_pt     += p.professional_tax
+            total_net    += p.net_take_home
+            total_ctc    += p.total_ctc_monthly
 
         alerts = []
         if total_tds > 0:
@@ -252,14 +488,35 @@ class PayrollEngine:
             alerts          = alerts,
         )
 
+    def _compute_payslips(self) -> List[Payslip]:
+        """
+        Run the payroll arithmetic for every employee.  With Numba the
+        inputs are packed into one int64 paise matrix and processed by the
+        compiled, multi-threaded kernel in a single call; otherwise
+        _payroll_row runs per employee in Python.  Both paths give identical
+        payslips.  Every output column is hundredths of its unit (paise,
+        hundredths of a percent, 0/1 flag), so one division by 100 turns a
+        row into rupees.
+        """
+        emps = self._employees
+        if NUMBA_AVAILABLE and emps:
+            inputs = np.array([_salary_inputs(emp) for emp in emps], dtype=np.int64)
+            rows = (_payroll_kernel(inputs) / 100).tolist()
+        else:
+            rows = [[v / 100 for v in _payroll_row(*_salary_inputs(emp))] for emp in emps]
+        return [self._build_payslip(emp, row) for emp, row in zip(emps, rows)]
+
     def _process_employee(self, emp: SalaryStructure) -> Payslip:
-        # EPF
-        epf_basic = min(emp.basic_monthly, EPF_WAGE_CAP)
-        epf_ee    = round(emp.basic_monthly * EPF_EMPLOYEE_RATE + emp.voluntary_pf, 2)
-        eps_er    = min(round(epf_basic * 0.0833, 2), 1_250)   # EPS capped ₹1,250
-        epf_er_to_epf = round(epf_basic * 0.0367, 2)
-        epf_er_total  = round(eps_er + epf_er_to_epf, 2)
-        admin     = round(emp.basic_monthly * EPF_ADMIN_CHARGE, 2)
+        row = [v / 100 for v in _payroll_row(*_salary_inputs(emp))]
+        return self._build_payslip(emp, row)
+
+    def _build_payslip(self, emp: SalaryStructure, row) -> Payslip:
+        (gross_m,
+         epf_ee, epf_er_to_epf, eps_er, epf_er_total, admin, epf_outflow,
+         esic_applicable, esic_ee, esic_er, esic_total,
+         annual_gross, std_ded, chapter_vi, taxable, basic_tax, rebate, cess,
+         annual_tds, monthly_tds, eff_rate,
+         total_ded, net, ctc_monthly) = row
 
         epf = EPFBreakdown(
             employee_contribution = epf_ee,
@@ -267,30 +524,28 @@ class PayrollEngine:
             employer_eps          = eps_er,
             employer_total        = epf_er_total,
             admin_charge          = admin,
-            total_epf_outflow     = epf_er_total + admin,
+            total_epf_outflow     = epf_outflow,
         )
 
-        # ESIC
-        gross_m = emp.gross_monthly
-        esic_applicable = gross_m <= ESIC_WAGE_LIMIT
         esic = ESICBreakdown(
-            applicable            = esic_applicable,
-            employee_contribution = round(gross_m * ESIC_EMPLOYEE_RATE, 2) if esic_applicable else 0.0,
-            employer_contribution = round(gross_m * ESIC_EMPLOYER_RATE, 2) if esic_applicable else 0.0,
-            total                 = round(gross_m * (ESIC_EMPLOYEE_RATE + ESIC_EMPLOYER_RATE), 2) if esic_applicable else 0.0,
+            applicable            = bool(esic_applicable),
+            employee_contribution = esic_ee,
+            employer_contribution = esic_er,
+            total                 = esic_total,
         )
 
-        # TDS
-        tds_detail = self._compute_tds(emp, epf_ee)
-
-        # Deductions from gross
-        total_ded = round(epf_ee + esic.employee_contribution
-                          + emp.professional_tax_monthly + tds_detail.monthly_tds, 2)
-        net       = round(gross_m - total_ded, 2)
-
-        # CTC
-        employer_extras = epf.total_epf_outflow + esic.employer_contribution
-        ctc_monthly     = round(gross_m + employer_extras, 2)
+        tds_detail = TDSBreakdown(
+            annual_gross          = annual_gross,
+            standard_deduction    = std_ded,
+            chapter_vi_deductions = chapter_vi,
+            taxable_income        = taxable,
+            basic_tax             = basic_tax,
+            rebate_87a            = rebate,
+            cess                  = cess,
+            annual_tds            = annual_tds,
+            monthly_tds           = monthly_tds,
+            effective_tds_rate    = eff_rate,
+        )
 
         return Payslip(
             employee_id       = emp.employee_id,
@@ -306,14 +561,14 @@ class PayrollEngine:
             other_allowances  = emp.other_allowances,
             gross_earnings    = gross_m,
             epf_employee      = epf_ee,
-            esic_employee     = esic.employee_contribution,
+            esic_employee     = esic_ee,
             professional_tax  = emp.professional_tax_monthly,
-            tds               = tds_detail.monthly_tds,
+            tds               = monthly_tds,
             voluntary_pf      = emp.voluntary_pf,
             total_deductions  = total_ded,
             net_take_home     = net,
             epf_employer      = epf_er_total,
-            esic_employer     = esic.employer_contribution,
+            esic_employer     = esic_er,
             epf_admin         = admin,
             total_ctc_monthly = ctc_monthly,
             epf               = epf,
@@ -321,60 +576,72 @@ class PayrollEngine:
             tds_detail        = tds_detail,
         )
 
-    def _compute_tds(self, emp: SalaryStructure, epf_ee_monthly: float) -> TDSBreakdown:
-        annual_gross = emp.gross_annual
-        slabs        = NEW_REGIME_ANNUAL_SLABS if emp.regime == "new" else OLD_REGIME_ANNUAL_SLABS
-        std_ded      = STANDARD_DEDUCTION_NEW  if emp.regime == "new" else STANDARD_DEDUCTION_OLD
-
-        chapter_vi = 0.0
-        if emp.regime == "old":
-            chapter_vi = (min(emp.sec80c + epf_ee_monthly * 12, 150_000)
-                          + min(emp.sec80d, 25_000)
-                          + emp.hra_exemption
-                          + emp.other_deductions)
-
-        taxable = max(0.0, annual_gross - std_ded - chapter_vi)
-
-        prev = 0.0
-        basic_tax = 0.0
-        for threshold, rate in slabs:
-            if taxable <= prev:
-                break
-            slab_income = min(taxable, threshold if threshold != float("inf") else taxable) - prev
-            basic_tax  += slab_income * rate
-            prev        = threshold if threshold != float("inf") else taxable
-
-        # Rebate 87A
-        rebate_limit = 700_000 if emp.regime == "new" else 500_000
-        rebate_cap   = 25_000  if emp.regime == "new" else 12_500
-        rebate       = min(basic_tax, rebate_cap) if taxable <= rebate_limit else 0.0
-        basic_tax   -= rebate
-
-        cess       = max(0.0, basic_tax) * 0.04
-        annual_tds = max(0.0, basic_tax) + cess
-        monthly_tds= round(annual_tds / 12, 2)
-        eff_rate   = (annual_tds / annual_gross * 100) if annual_gross else 0.0
-
-        return TDSBreakdown(
-            annual_gross          = annual_gross,
-            standard_deduction    = std_ded,
-            chapter_vi_deductions = chapter_vi,
-            taxable_income        = taxable,
-            basic_tax             = round(max(0.0, basic_tax), 2),
-            rebate_87a            = round(rebate, 2),
-            cess                  = round(cess, 2),
-            annual_tds            = round(annual_tds, 2),
-            monthly_tds           = monthly_tds,
-            effective_tds_rate    = round(eff_rate, 2),
-        )
-
 
 # ---------------------------------------------------------------------------
 # Convenience wrapper
 # ---------------------------------------------------------------------------
 
-def run_payroll(params: dict) -> dict:
-    """JSON wrapper for Flask endpoint."""
+def _payslip_to_dict(p: Payslip) -> dict:
+    """
+    Payslip as a JSON-ready dict, keys in field order.  Written out by hand
+    instead of dataclasses.asdict, which recurses through every field and
+    deep-copies each value.
+    """
+    epf, esic, tds = p.epf, p.esic, p.tds_detail
+    return {
+        "employee_id":       p.employee_id,
+        "employee_name":     p.employee_name,
+        "designation":       p.designation,
+        "pan":               p.pan,
+        "month":             p.month,
+        "basic":             p.basic,
+        "hra":               p.hra,
+        "special_allowance": p.special_allowance,
+        "lta":               p.lta,
+        "medical_allowance": p.medical_allowance,
+        "other_allowances":  p.other_allowances,
+        "gross_earnings":    p.gross_earnings,
+        "epf_employee":      p.epf_employee,
+        "esic_employee":     p.esic_employee,
+        "professional_tax":  p.professional_tax,
+        "tds":               p.tds,
+        "voluntary_pf":      p.voluntary_pf,
+        "total_deductions":  p.total_deductions,
+        "net_take_home":     p.net_take_home,
+        "epf_employer":      p.epf_employer,
+        "esic_employer":     p.esic_employer,
+        "epf_admin":         p.epf_admin,
+        "total_ctc_monthly": p.total_ctc_monthly,
+        "epf": {
+            "employee_contribution": epf.employee_contribution,
+            "employer_epf":          epf.employer_epf,
+            "employer_eps":          epf.employer_eps,
+            "employer_total":        epf.employer_total,
+            "admin_charge":          epf.admin_charge,
+            "total_epf_outflow":     epf.total_epf_outflow,
+        },
+        "esic": {
+            "applicable":            esic.applicable,
+            "employee_contribution": esic.employee_contribution,
+            "employer_contribution": esic.employer_contribution,
+            "total":                 esic.total,
+        },
+        "tds_detail": {
+            "annual_gross":          tds.annual_gross,
+            "standard_deduction":    tds.standard_deduction,
+            "chapter_vi_deductions": tds.chapter_vi_deductions,
+            "taxable_income":        tds.taxable_income,
+            "basic_tax":             tds.basic_tax,
+            "rebate_87a":            tds.rebate_87a,
+            "cess":                  tds.cess,
+            "annual_tds":            tds.annual_tds,
+            "monthly_tds":           tds.monthly_tds,
+            "effective_tds_rate":    tds.effective_tds_rate,
+        },
+    }
+
+
+def _run_from_params(params: dict) -> PayrollRunResult:
     engine = PayrollEngine(month=params.get("month", "Mar-2025"))
 
     for emp_data in params.get("employees", []):
@@ -398,7 +665,10 @@ def run_payroll(params: dict) -> dict:
             other_deductions  = float(emp_data.get("other_deductions", 0)),
         ))
 
-    result = engine.run()
+    return engine.run()
+
+
+def _result_summary(result: PayrollRunResult, payslips: list) -> dict:
     return {
         "month":            result.month,
         "total_gross":      result.total_gross,
@@ -414,5 +684,21 @@ def run_payroll(params: dict) -> dict:
         "epf_challan":      result.epf_challan,
         "esic_challan":     result.esic_challan,
         "alerts":           result.alerts,
-        "payslips":         [asdict(p) for p in result.payslips],
+        "payslips":         payslips,
     }
+
+
+def run_payroll(params: dict) -> dict:
+    """JSON wrapper for Flask endpoint."""
+    result = _run_from_params(params)
+    return _result_summary(result, [_payslip_to_dict(p) for p in result.payslips])
+
+
+def run_payroll_json(params: dict) -> bytes:
+    """
+    run_payroll encoded straight to JSON bytes.  msgspec serializes the
+    Payslip dataclasses natively in C, so no per-payslip dicts are built;
+    decoding the bytes gives exactly run_payroll(params).
+    """
+    result = _run_from_params(params)
+    return msgspec.json.encode(_result_summary(result, result.payslips))
@@ -1,22 +1,41 @@
 """
 RAG Pipeline
 Full Retrieval-Augmented Generation pipeline combining FAISS retrieval,
-LangChain ConversationalRetrievalChain, and session-scoped memory.
+the LangChain conversational-retrieval flow (question condensing, stuffed
+context prompt), and session-scoped memory.
 """
 
 from __future__ import annotations
 
+import hashlib
 import logging
 import os
-from typing import Any, Dict, List, Optional
+import itertools
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
-from langchain.chains import ConversationalRetrievalChain
+from langchain.chains.conversational_retrieval.prompts import CONDENSE_QUESTION_PROMPT
 from langchain.prompts import PromptTemplate
+import torch
 from langchain_community.llms import HuggingFacePipeline
-from transformers import AutoModelForSeq2SeqLM, AutoTokenizer, pipeline
+from transformers import (
+    AutoModelForSeq2SeqLM,
+    AutoTokenizer,
+    TextIteratorStreamer,
+    pipeline,
+)
+
+try:
+    from optimum.onnxruntime import ORTModelForSeq2SeqLM
+    ORT_AVAILABLE = True
+except ImportError:
+    ORT_AVAILABLE = False
 
 from embeddings import get_embeddings
-from memory import get_memory, evict_stale_sessions
+from llm_export import QUANTIZED_FILES, is_exported
+from memory import clear_session, get_memory, evict_stale_sessions
 from vector_store import build_vector_store, get_retriever
 
 logger = logging.getLogger(__name__)
@@ -48,12 +67,65 @@ User question: {question}
 WealthAdvisor AI answer:""",
 )
 
+# The prompt templates as plain str.format strings, for the query path:
+# same text, without LangChain's per-call input validation and merging
+_FINANCE_PROMPT_FMT = FINANCE_PROMPT.template
+_CONDENSE_PROMPT_FMT = CONDENSE_QUESTION_PROMPT.template
+
 # ---------------------------------------------------------------------------
 # RAG Pipeline class
 # ---------------------------------------------------------------------------
 
 LLM_MODEL = os.environ.get("LLM_MODEL", "google/flan-t5-base")
 
+# Serve the LLM as a dynamically int8-quantized ONNX Runtime model when
+# optimum[onnxruntime] is installed and the export (made at image build by
+# llm_export.py) is present here; otherwise PyTorch FP32.
+LLM_INT8 = os.environ.get("LLM_INT8", "1") == "1"
+LLM_ONNX_PATH = os.environ.get("LLM_ONNX_PATH", "./llm_onnx")
+
+# torch.compile the PyTorch model's forward (the ONNX Runtime path has its
+# own graph optimizer).  Off by default: the CPU backend needs a C++
+# compiler at run time, which the slim runtime image does not ship.
+LLM_COMPILE = os.environ.get("LLM_COMPILE", "0") == "1"
+
+# Allow TF32 matmuls on GPUs that have them; no effect on CPU
+torch.set_float32_matmul_precision("high")
+
+# Run one throwaway query at the end of initialization so the first real
+# request does not pay for lazy model / tokenizer / FAISS warm-up.  On by
+# default only when app.py builds the pipeline at worker startup
+# (RAG_EAGER_LOAD); otherwise initialization runs inside the first request.
+RAG_WARMUP = os.environ.get("RAG_WARMUP", os.environ.get("RAG_EAGER_LOAD", "1")) == "1"
+_WARMUP_SESSION = "__warmup__"
+
+# Appended to a streamed answer when generation fails part-way, after text
+# has already been sent (the HTTP status can no longer change)
+STREAM_ERROR_MARKER = "\n\n[error: answer generation failed — please try again]"
+
+# Stale-session eviction cadence, in queries
+EVICT_EVERY_N_QUERIES = 100
+
+# Answers to opening questions (no chat history yet), keyed by the
+# normalized question; 0 disables the cache
+ANSWER_CACHE_SIZE: int = int(os.environ.get("ANSWER_CACHE_SIZE", "512"))
+
+
+def _question_key(question: str) -> bytes:
+    """SHA-1 of the question, lower-cased with whitespace collapsed."""
+    return hashlib.sha1(" ".join(question.lower().split()).encode("utf-8")).digest()
+
+
+_ROLE_PREFIX = {"human": "Human: ", "ai": "Assistant: "}
+
+
+def _format_chat_history(messages: List[Any]) -> str:
+    """Chat messages as ConversationalRetrievalChain renders them."""
+    return "".join(
+        f"\n{_ROLE_PREFIX.get(m.type, f'{m.type}: ')}{m.content}"
+        for m in messages if m.content
+    )
+
 
 class RAGPipeline:
     """
@@ -63,21 +135,26 @@ class RAGPipeline:
     1. Load / build FAISS vector store from the financial knowledge base
     2. Initialize HuggingFace LLM (flan-t5-base by default; swap for GPT-4
        by setting LLM_MODEL env var and providing an OpenAI key)
-    3. Build ConversationalRetrievalChain with MMR retriever + memory
-
-    Per-query:
-    1. Embed the user question (cache-first via CachedHuggingFaceEmbeddings)
-    2. MMR-retrieve top-k relevant chunks from FAISS
-    3. Inject retrieved context + session chat history into the prompt
-    4. Generate an answer with the LLM
-    5. Update session memory with this exchange
+
+    Per-query (the ConversationalRetrievalChain flow, run directly):
+    1. With chat history, condense the follow-up into a standalone question
+    2. Embed the question (cache-first via CachedHuggingFaceEmbeddings)
+    3. MMR-retrieve top-k relevant chunks from FAISS
+    4. Inject retrieved context + session chat history into the prompt
+    5. Generate an answer with the LLM
+    6. Update session memory with this exchange
     """
 
     def __init__(self):
         self._vector_store = None
         self._retriever = None
         self._llm = None
+        self._tokenizer = None
         self._ready = False
+        self._answers: "OrderedDict[bytes, Dict[str, Any]]" = OrderedDict()
+        self._answers_lock = threading.Lock()
+        # itertools.count: next() is atomic under the GIL, unlike `n += 1`
+        self._query_count = itertools.count(1)
         self._initialize()
 
     def _initialize(self) -> None:
@@ -92,6 +169,8 @@ class RAGPipeline:
             self._llm = self._build_llm()
 
             self._ready = True
+            if RAG_WARMUP:
+                self._warm_up()
             logger.info("RAG pipeline ready.")
         except Exception as exc:
             logger.error("RAG pipeline initialization failed: %s", exc)
@@ -100,37 +179,181 @@ class RAGPipeline:
 
     def _build_llm(self):
         """
-        Build a lightweight seq2seq LLM pipeline (flan-t5-base).
-        In production, replace with an OpenAI or Anthropic client by
+        Build a lightweight seq2seq LLM pipeline (flan-t5-base), served
+        from the int8 ONNX export when LLM_INT8 is on and optimum is
+        installed, else PyTorch FP32 (torch.compile'd when LLM_COMPILE is
+        on).  In production, replace with an OpenAI or Anthropic client by
         switching LLM_MODEL and providing the appropriate API key.
         """
-        tokenizer = AutoTokenizer.from_pretrained(LLM_MODEL)
-        model = AutoModelForSeq2SeqLM.from_pretrained(LLM_MODEL)
+        self._tokenizer = AutoTokenizer.from_pretrained(LLM_MODEL)
+        model = None
+        if LLM_INT8 and ORT_AVAILABLE:
+            try:
+                model = self._load_int8_model()
+            except Exception as exc:
+                logger.warning("int8 ONNX model unavailable (%s); using PyTorch FP32.", exc)
+        if model is None:
+            model = self._load_torch_model(self._tokenizer)
         hf_pipeline = pipeline(
             "text2text-generation",
             model=model,
-            tokenizer=tokenizer,
+            tokenizer=self._tokenizer,
             max_new_tokens=512,
-            temperature=0.3,
-            do_sample=True,
+            # Greedy decoding: deterministic answers, no sampling step;
+            # the n-gram block keeps greedy output from looping
+            do_sample=False,
+            num_beams=1,
+            no_repeat_ngram_size=3,
         )
         return HuggingFacePipeline(pipeline=hf_pipeline)
 
+    @staticmethod
+    def _load_torch_model(tokenizer):
+        """
+        LLM_MODEL in PyTorch, in eval mode.  Only forward() is compiled:
+        the pipeline needs the PreTrainedModel itself (config, generate()),
+        and generate() calls forward() once per decode step, which is where
+        the per-op dispatch overhead is.
+
+        torch.compile is lazy, so a short trial generate() runs here: a
+        backend that cannot compile (e.g. no C++ toolchain) fails now and
+        the eager forward() is put back, rather than failing every request.
+        dynamic=True because the decoder's sequence length grows each step.
+        """
+        model = AutoModelForSeq2SeqLM.from_pretrained(LLM_MODEL).eval()
+        if LLM_COMPILE:
+            eager_forward = model.forward
+            try:
+                model.forward = torch.compile(eager_forward, dynamic=True)
+                with torch.inference_mode():
+                    model.generate(**tokenizer("warm-up", return_tensors="pt"), max_new_tokens=4)
+            except Exception as exc:
+                model.forward = eager_forward
+                logger.warning("torch.compile unavailable (%s); running eager.", exc)
+        return model
+
+    @staticmethod
+    def _load_int8_model():
+        """
+        LLM_MODEL exported to ONNX with int8 dynamic quantization (weights
+        int8, activations quantized on the fly), for ONNX Runtime on CPU.
+        Only loads: the export is made ahead of time by llm_export.py (a
+        Dockerfile step), never inside a request.
+        """
+        if not is_exported(LLM_ONNX_PATH):
+            raise FileNotFoundError(
+                f"no int8 export in {LLM_ONNX_PATH}; run `python llm_export.py {LLM_ONNX_PATH}`"
+            )
+        return ORTModelForSeq2SeqLM.from_pretrained(
+            LLM_ONNX_PATH,
+            encoder_file_name           = QUANTIZED_FILES["encoder_model"],
+            decoder_file_name           = QUANTIZED_FILES["decoder_model"],
+            decoder_with_past_file_name = QUANTIZED_FILES["decoder_with_past_model"],
+            provider                    = "CPUExecutionProvider",
+        )
+
+    def _warm_up(self) -> None:
+        """
+        Push one question through the full pipeline (embedding, retrieval,
+        generation) and discard the throwaway session.  Failures are logged,
+        never raised: a cold first request is better than no service.
+        """
+        start = time.perf_counter()
+        try:
+            self.query("What is an emergency fund?", session_id=_WARMUP_SESSION)
+        except Exception as exc:
+            logger.warning("RAG warm-up query failed: %s", exc)
+        finally:
+            clear_session(_WARMUP_SESSION)
+        logger.info("RAG warm-up took %.0f ms", (time.perf_counter() - start) * 1000)
+
     def is_ready(self) -> bool:
         return self._ready
 
-    def _build_chain(self, session_id: str) -> ConversationalRetrievalChain:
-        """Build a ConversationalRetrievalChain with session memory."""
-        memory = get_memory(session_id)
-        chain = ConversationalRetrievalChain.from_llm(
-            llm=self._llm,
-            retriever=self._retriever,
-            memory=memory,
-            combine_docs_chain_kwargs={"prompt": FINANCE_PROMPT},
-            return_source_documents=True,
-            verbose=False,
+    def _prepare(self, question: str, memory) -> Tuple[str, List[Any]]:
+        """
+        Everything before answer generation, as ConversationalRetrievalChain
+        does it: condense a follow-up against the session's chat history
+        (skipped for an opening question), retrieve on the standalone
+        question, and fill FINANCE_PROMPT with the stuffed context.  Called
+        directly so a query is a retriever call plus one or two LLM calls,
+        without chain construction, callbacks or input validation.
+
+        Returns (answer prompt, retrieved documents).
+        """
+        history = _format_chat_history(memory.load_memory_variables({})["chat_history"])
+        if history:
+            question = self._llm.invoke(
+                _CONDENSE_PROMPT_FMT.format(question=question, chat_history=history)
+            )
+        docs = self._retriever.invoke(question)
+        prompt = _FINANCE_PROMPT_FMT.format(
+            context="\n\n".join(doc.page_content for doc in docs),
+            chat_history=history,
+            question=question,
         )
-        return chain
+        return prompt, docs
+
+    def _cache_key(self, question: str, memory) -> Optional[bytes]:
+        """
+        Answer-cache key for the question, or None when it cannot be cached.
+        With no chat history the question is answered as asked (no
+        condensing step) and decoding is greedy, so the answer depends on
+        the question alone and can be shared across sessions.
+        """
+        if ANSWER_CACHE_SIZE > 0 and not memory.chat_memory.messages:
+            return _question_key(question)
+        return None
+
+    def _cached_answer(self, key: Optional[bytes]) -> Optional[Dict[str, Any]]:
+        if key is None:
+            return None
+        with self._answers_lock:
+            cached = self._answers.get(key)
+            if cached is not None:
+                self._answers.move_to_end(key)
+        return cached
+
+    def _cache_answer(self, key: Optional[bytes], answer: str, sources: List[Dict]) -> None:
+        if key is None:
+            return
+        with self._answers_lock:
+            self._answers[key] = {
+                "answer": answer,
+                "sources": [dict(src) for src in sources],
+            }
+            self._answers.move_to_end(key)
+            while len(self._answers) > ANSWER_CACHE_SIZE:
+                self._answers.popitem(last=False)
+
+    def _start_query(self) -> None:
+        """Per-query bookkeeping shared by query() and query_stream()."""
+        if not self._ready:
+            raise RuntimeError("RAG pipeline not initialized")
+
+        # Periodically evict stale sessions (every EVICT_EVERY_N_QUERIES)
+        if next(self._query_count) % EVICT_EVERY_N_QUERIES == 0:
+            evict_stale_sessions()
+
+    @staticmethod
+    def _unique_sources(source_docs: List[Any]) -> List[Dict[str, str]]:
+        """Source entries for the retrieved docs, keeping the first doc per title."""
+        seen_titles = set()
+        unique_sources = []
+        for doc in source_docs:
+            metadata = doc.metadata
+            title = metadata.get("title", "Unknown")
+            if title in seen_titles:
+                continue
+            seen_titles.add(title)
+            content = doc.page_content
+            unique_sources.append({
+                "title": title,
+                "category": metadata.get("category", "general"),
+                "source": metadata.get("source", ""),
+                "snippet": content[:200] + "…" if len(content) > 200 else content,
+            })
+        return unique_sources
 
     def query(self, question: str, session_id: str = "default") -> Dict[str, Any]:
         """
@@ -147,49 +370,108 @@ class RAGPipeline:
               - sources (list[dict]): retrieved document metadata
               - session_id (str)
         """
-        if not self._ready:
-            raise RuntimeError("RAG pipeline not initialized")
+        self._start_query()
 
-        # Periodically evict stale sessions (every ~100 queries is fine)
-        import random
-        if random.random() < 0.01:
-            evict_stale_sessions()
-
-        chain = self._build_chain(session_id)
+        memory = get_memory(session_id)
+        key = self._cache_key(question, memory)
+        cached = self._cached_answer(key)
+        if cached is not None:
+            memory.save_context({"question": question}, {"answer": cached["answer"]})
+            return {
+                "answer": cached["answer"],
+                "sources": [dict(src) for src in cached["sources"]],
+                "session_id": session_id,
+            }
 
         try:
-            result = chain({"question": question})
+            prompt, source_docs = self._prepare(question, memory)
+            answer: str = self._llm.invoke(prompt)
         except Exception as exc:
             logger.error(
-                "Chain invocation failed (session=%s): %s", session_id, exc
+                "RAG query failed (session=%s): %s", session_id, exc
             )
             raise
+        memory.save_context({"question": question}, {"answer": answer})
 
-        answer: str = result.get("answer", "I'm unable to answer that right now.")
-        source_docs: List[Any] = result.get("source_documents", [])
-
-        sources = [
-            {
-                "title": doc.metadata.get("title", "Unknown"),
-                "category": doc.metadata.get("category", "general"),
-                "source": doc.metadata.get("source", ""),
-                "snippet": doc.page_content[:200] + "…"
-                if len(doc.page_content) > 200
-                else doc.page_content,
-            }
-            for doc in source_docs
-        ]
-
-        # Deduplicate sources by title
-        seen_titles = set()
-        unique_sources = []
-        for s in sources:
-            if s["title"] not in seen_titles:
-                unique_sources.append(s)
-                seen_titles.add(s["title"])
+        unique_sources = self._unique_sources(source_docs)
+        self._cache_answer(key, answer, unique_sources)
 
         return {
             "answer": answer,
             "sources": unique_sources,
             "session_id": session_id,
         }
+
+    def query_stream(self, question: str, session_id: str = "default") -> Iterator[str]:
+        """
+        Run a RAG query and return an iterator over the answer text as the
+        LLM decodes it.
+
+        Not a generator: the readiness check, session eviction, answer-cache
+        lookup and the pre-generation steps (condense + retrieve) run before
+        this returns, so their errors raise here and the caller can still
+        answer with an error status.  A cached opening answer is returned
+        whole.
+
+        Generation runs in a background thread with a TextIteratorStreamer
+        handed to the answer call only, so the first words reach the caller
+        after one decode step.  If generation fails before any text was
+        produced, the iterator raises; after that, it yields
+        STREAM_ERROR_MARKER and stops, so a failure is never mistaken for a
+        short answer.  Session memory (and the answer cache) are updated when
+        generation completes, as with query().
+        """
+        self._start_query()
+
+        memory = get_memory(session_id)
+        key = self._cache_key(question, memory)
+        cached = self._cached_answer(key)
+        if cached is not None:
+            memory.save_context({"question": question}, {"answer": cached["answer"]})
+            return iter((cached["answer"],))
+
+        try:
+            prompt, source_docs = self._prepare(question, memory)
+        except Exception as exc:
+            logger.error(
+                "RAG query failed (session=%s): %s", session_id, exc
+            )
+            raise
+        return self._stream_answer(question, session_id, memory, key, prompt, source_docs)
+
+    def _stream_answer(
+        self, question: str, session_id: str, memory, key: Optional[bytes],
+        prompt: str, source_docs: List[Any],
+    ) -> Iterator[str]:
+        """query_stream's generation step (see there)."""
+        streamer = TextIteratorStreamer(
+            self._tokenizer, skip_prompt=True, skip_special_tokens=True
+        )
+        errors: List[Exception] = []
+
+        def _run() -> None:
+            try:
+                answer = self._llm.invoke(
+                    prompt, pipeline_kwargs={"streamer": streamer}
+                )
+                memory.save_context({"question": question}, {"answer": answer})
+                self._cache_answer(key, answer, self._unique_sources(source_docs))
+            except Exception as exc:
+                logger.error(
+                    "RAG query failed (session=%s): %s", session_id, exc
+                )
+                errors.append(exc)
+                streamer.end()      # unblock the consumer
+
+        worker = threading.Thread(target=_run, daemon=True)
+        worker.start()
+        sent = False
+        for text in streamer:
+            if text:
+                sent = True
+                yield text
+        worker.join()
+        if errors:
+            if not sent:
+                raise errors[0]
+            yield STREAM_ERROR_MARKER
@@ -38,10 +38,19 @@ product (milled rice) and all by-products, for:
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field
 from datetime import date
 from typing import Dict, List, Optional
 from enum import Enum
+import math
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
 
 
 # ---------------------------------------------------------------------------
@@ -71,6 +80,17 @@ VARIETY_OUTTURN = {
     "common":        0.67,
 }
 
+# Standard shares, as fractions: head rice and 5% / 25% / D-grade broken of
+# total milled rice, then bran and husk of paddy
+_STANDARD_SHARES = (STANDARD_HEAD_RICE_PCT, 0.05, 0.08, 0.02, STANDARD_BRAN_PCT, STANDARD_HUSK_PCT)
+
+# Variety -> (outturn, *_STANDARD_SHARES), in _milling_figures argument order,
+# so record_milling resolves every standard with one lookup
+_VARIETY_PROFILE: Dict[str, tuple] = {
+    variety: (outturn, *_STANDARD_SHARES) for variety, outturn in VARIETY_OUTTURN.items()
+}
+_DEFAULT_PROFILE = (STANDARD_OUTTURN, *_STANDARD_SHARES)
+
 # Market prices (₹/quintal, AP/TS wholesale, Feb 2025 reference)
 MARKET_PRICES = {
     "sona_masoori_raw":   3200,
@@ -88,6 +108,14 @@ MARKET_PRICES = {
     "common_raw":          2200,
 }
 
+# Prices as the milling kernel takes them (floats), resolved once: rice price
+# by market key, and the by-product prices in _milling_figures argument order
+_RICE_PRICES: Dict[str, float] = {market: float(price) for market, price in MARKET_PRICES.items()}
+_DEFAULT_RICE_PRICE = _RICE_PRICES["common_raw"]
+_BYPRODUCT_PRICES = tuple(
+    _RICE_PRICES[k] for k in ("broken_5pct", "broken_25pct", "broken_d_grade", "rice_bran", "husk")
+)
+
 # Enums
 class PaddyVariety(str, Enum):
     SONA_MASOORI = "sona_masoori"
@@ -113,7 +141,7 @@ class LotStatus(str, Enum):
 # Data structures
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class PaddyLot:
     lot_id:           str
     receipt_date:     str
@@ -126,8 +154,22 @@ class PaddyLot:
     status:           LotStatus    = LotStatus.PENDING
     milled_date:      Optional[str]= None
 
+    def to_dict(self) -> dict:
+        """Fields as a flat dict (dataclasses.asdict without the deep copy)."""
+        return {
+            "lot_id":              self.lot_id,
+            "receipt_date":        self.receipt_date,
+            "variety":             self.variety,
+            "milling_type":        self.milling_type,
+            "paddy_qtl":           self.paddy_qtl,
+            "moisture_pct":        self.moisture_pct,
+            "effective_paddy_qtl": self.effective_paddy_qtl,
+            "status":              self.status,
+            "milled_date":         self.milled_date,
+        }
+
 
-@dataclass
+@dataclass(slots=True)
 class MillingOutput:
     lot_id:           str
     paddy_qtl_processed: float
@@ -159,8 +201,34 @@ class MillingOutput:
     husk_value:          float
     total_revenue_potential: float
 
+    def to_dict(self) -> dict:
+        """Fields as a flat dict (dataclasses.asdict without the deep copy)."""
+        return {
+            "lot_id":                  self.lot_id,
+            "paddy_qtl_processed":     self.paddy_qtl_processed,
+            "head_rice_qtl":           self.head_rice_qtl,
+            "broken_5pct_qtl":         self.broken_5pct_qtl,
+            "broken_25pct_qtl":        self.broken_25pct_qtl,
+            "broken_d_qtl":            self.broken_d_qtl,
+            "total_rice_qtl":          self.total_rice_qtl,
+            "bran_qtl":                self.bran_qtl,
+            "husk_qtl":                self.husk_qtl,
+            "milling_loss_qtl":        self.milling_loss_qtl,
+            "actual_outturn_pct":      self.actual_outturn_pct,
+            "head_rice_pct":           self.head_rice_pct,
+            "bran_recovery_pct":       self.bran_recovery_pct,
+            "husk_recovery_pct":       self.husk_recovery_pct,
+            "milling_loss_pct":        self.milling_loss_pct,
+            "outturn_variance":        self.outturn_variance,
+            "head_rice_value":         self.head_rice_value,
+            "broken_value":            self.broken_value,
+            "bran_value":              self.bran_value,
+            "husk_value":              self.husk_value,
+            "total_revenue_potential": self.total_revenue_potential,
+        }
 
-@dataclass
+
+@dataclass(slots=True)
 class ConversionReport:
     mill_id:          str
     report_period:    str
@@ -181,11 +249,135 @@ class ConversionReport:
     efficiency_alerts:List[str]
     lots:             List[Dict]
 
+    def to_dict(self) -> dict:
+        """
+        Fields as a dict.  The reconciliation, alerts and lots containers
+        are shallow-copied; their contents are plain values already.
+        """
+        return {
+            "mill_id":                 self.mill_id,
+            "report_period":           self.report_period,
+            "total_paddy_qtl":         self.total_paddy_qtl,
+            "total_rice_qtl":          self.total_rice_qtl,
+            "total_bran_qtl":          self.total_bran_qtl,
+            "total_husk_qtl":          self.total_husk_qtl,
+            "total_broken_qtl":        self.total_broken_qtl,
+            "total_loss_qtl":          self.total_loss_qtl,
+            "avg_outturn_pct":         self.avg_outturn_pct,
+            "avg_head_rice_pct":       self.avg_head_rice_pct,
+            "total_revenue_potential": self.total_revenue_potential,
+            "reconciliation":          dict(self.reconciliation),
+            "efficiency_alerts":       list(self.efficiency_alerts),
+            "lots":                    list(self.lots),
+        }
+
+
+# ---------------------------------------------------------------------------
+# Milling arithmetic — plain-float functions, compiled with Numba if present
+# ---------------------------------------------------------------------------
+
+def _round2(x: float) -> float:
+    return round(x, 2)
+
+
+def _round2_exact(x: float) -> float:
+    """
+    round(x, 2) exactly as CPython computes it (half-even on the exact
+    binary value of x), for use under Numba, whose round() rounds the
+    already-rounded product x * 100 and so is sometimes 0.01 off.
+    x * 100 is split exactly into hi + lo (Dekker's two-product).
+    """
+    hi = x * 100.0
+    c = 134217729.0 * x                     # 2**27 + 1: split x into xh + xl
+    xh = c - (c - x)
+    xl = x - xh
+    lo = (xh * 100.0 - hi) + xl * 100.0
+    r = np.rint(hi)
+    d = hi - r
+    if d == 0.5 and lo > 0.0:
+        r += 1.0
+    elif d == -0.5 and lo < 0.0:
+        r -= 1.0
+    return r / 100.0
+
+
+def _milling_figures(
+    paddy: float, std_outturn: float,
+    head_share: float, b5_share: float, b25_share: float, bd_share: float,
+    bran_share: float, husk_share: float,
+    head_rice: float, broken_5: float, broken_25: float, broken_d: float,
+    bran: float, husk: float,
+    rice_price: float, price_5: float, price_25: float, price_d: float,
+    price_bran: float, price_husk: float,
+):
+    """
+    Output quantities, KPIs and revenue for one milled lot.  head_rice,
+    bran and husk are NaN when not measured and are then taken from the
+    standard outturn and shares (see _VARIETY_PROFILE).  Returns (head_rice, broken_5, broken_25, broken_d,
+    total_rice, bran, husk, loss, outturn %, head rice %, bran %, husk %,
+    loss %, outturn variance, head rice value, broken value, bran value,
+    husk value, total revenue).
+    """
+    # If actuals not provided, compute from standard
+    if math.isnan(head_rice):
+        total_rice = _round2(paddy * std_outturn)
+        head_rice  = _round2(total_rice * head_share)
+        broken_5   = _round2(total_rice * b5_share)
+        broken_25  = _round2(total_rice * b25_share)
+        broken_d   = _round2(total_rice * bd_share)
+    total_rice = head_rice + broken_5 + broken_25 + broken_d
+
+    if math.isnan(bran):
+        bran = _round2(paddy * bran_share)
+    if math.isnan(husk):
+        husk = _round2(paddy * husk_share)
+
+    accounted = total_rice + bran + husk
+    loss      = max(0.0, _round2(paddy - accounted))
+
+    # KPIs
+    actual_outturn = _round2(total_rice / max(0.01, paddy) * 100)
+    outturn_var    = _round2(actual_outturn - std_outturn * 100)
+    head_rice_pct  = _round2(head_rice / max(0.01, total_rice) * 100)
+    bran_pct       = _round2(bran / max(0.01, paddy) * 100)
+    husk_pct       = _round2(husk / max(0.01, paddy) * 100)
+    loss_pct       = _round2(loss / max(0.01, paddy) * 100)
+
+    # Revenue potential
+    head_rice_val = _round2(head_rice * rice_price)
+    broken_val    = (
+        _round2(broken_5  * price_5) +
+        _round2(broken_25 * price_25) +
+        _round2(broken_d  * price_d)
+    )
+    bran_val      = _round2(bran * price_bran)
+    husk_val      = _round2(husk * price_husk)
+    total_rev     = head_rice_val + broken_val + bran_val + husk_val
+
+    return (
+        head_rice, broken_5, broken_25, broken_d, _round2(total_rice),
+        bran, husk, loss,
+        actual_outturn, head_rice_pct, bran_pct, husk_pct, loss_pct, outturn_var,
+        head_rice_val, broken_val, bran_val, husk_val, total_rev,
+    )
+
+
+if NUMBA_AVAILABLE:
+    # Compiled versions replace the Python ones; _milling_figures picks up
+    # the exact-rounding _round2 at compile time.  No fastmath, so results
+    # match the Python path bit for bit.
+    _round2 = njit(cache=True)(_round2_exact)
+    _milling_figures = njit(cache=True)(_milling_figures)
+
 
 # ---------------------------------------------------------------------------
 # Tracker
 # ---------------------------------------------------------------------------
 
+# Width of ConversionTracker's per-lot report matrix (one row per milled lot):
+# paddy, rice, bran, husk, broken, loss, outturn %, head rice %, revenue
+_N_REPORT_COLS = 9
+
 class ConversionTracker:
     """
     Tracks paddy-to-rice conversion for a rice mill.
@@ -193,8 +385,15 @@ class ConversionTracker:
 
     def __init__(self, mill_id: str):
         self.mill_id   = mill_id
-        self._lots:    Dict[str, PaddyLot]     = {}
-        self._outputs: Dict[str, MillingOutput] = {}
+        # Append-only lists in first-seen order, with lot_id -> position;
+        # receiving or milling a lot again replaces its entry in place.
+        self._lot_index:    Dict[str, int]      = {}
+        self._lot_list:     List[PaddyLot]      = []
+        self._output_index: Dict[str, int]      = {}
+        self._output_list:  List[MillingOutput] = []
+        # Report columns, row i for _output_list[i]; capacity doubles as
+        # lots are milled.
+        self._report_cols = np.zeros((16, _N_REPORT_COLS))
 
     def receive_paddy(
         self,
@@ -221,7 +420,11 @@ class ConversionTracker:
             moisture_pct     = moisture_pct,
             effective_paddy_qtl = effective_qtl,
         )
-        self._lots[lot_id] = lot
+        i = self._lot_index.setdefault(lot_id, len(self._lot_list))
+        if i == len(self._lot_list):
+            self._lot_list.append(lot)
+        else:
+            self._lot_list[i] = lot
         return lot
 
     def record_milling(
@@ -238,51 +441,28 @@ class ConversionTracker:
         rice_market:      str             = "common_raw",
     ) -> MillingOutput:
 
-        lot = self._lots.get(lot_id)
-        if not lot:
+        i = self._lot_index.get(lot_id)
+        if i is None:
             raise KeyError(f"Lot {lot_id} not found")
+        lot = self._lot_list[i]
 
         paddy = lot.effective_paddy_qtl
         var   = variety or lot.variety
-        std_outturn = VARIETY_OUTTURN.get(var, STANDARD_OUTTURN)
-
-        # If actuals not provided, compute from standard
-        total_rice  = head_rice_qtl or round(paddy * std_outturn, 2)
-        if head_rice_qtl is None:
-            head_rice_qtl = round(total_rice * STANDARD_HEAD_RICE_PCT, 2)
-            broken_5pct_qtl  = round(total_rice * 0.05, 2)
-            broken_25pct_qtl = round(total_rice * 0.08, 2)
-            broken_d_qtl     = round(total_rice * 0.02, 2)
-            total_rice       = head_rice_qtl + broken_5pct_qtl + broken_25pct_qtl + broken_d_qtl
-        else:
-            total_rice = head_rice_qtl + broken_5pct_qtl + broken_25pct_qtl + broken_d_qtl
-
-        bran_qtl_v = bran_qtl if bran_qtl is not None else round(paddy * STANDARD_BRAN_PCT, 2)
-        husk_qtl_v = husk_qtl if husk_qtl is not None else round(paddy * STANDARD_HUSK_PCT, 2)
-
-        accounted  = total_rice + bran_qtl_v + husk_qtl_v
-        loss_qtl   = max(0.0, round(paddy - accounted, 2))
-
-        # KPIs
-        actual_outturn   = round(total_rice / max(0.01, paddy) * 100, 2)
-        std_outturn_pct  = std_outturn * 100
-        outturn_var      = round(actual_outturn - std_outturn_pct, 2)
-        head_rice_pct    = round(head_rice_qtl / max(0.01, total_rice) * 100, 2)
-        bran_pct         = round(bran_qtl_v / max(0.01, paddy) * 100, 2)
-        husk_pct         = round(husk_qtl_v / max(0.01, paddy) * 100, 2)
-        loss_pct         = round(loss_qtl / max(0.01, paddy) * 100, 2)
-
-        # Revenue potential
-        rice_price       = MARKET_PRICES.get(rice_market, MARKET_PRICES["common_raw"])
-        head_rice_val    = round(head_rice_qtl * rice_price, 2)
-        broken_val       = (
-            round(broken_5pct_qtl  * MARKET_PRICES["broken_5pct"], 2) +
-            round(broken_25pct_qtl * MARKET_PRICES["broken_25pct"], 2) +
-            round(broken_d_qtl     * MARKET_PRICES["broken_d_grade"], 2)
+        profile     = _VARIETY_PROFILE.get(var, _DEFAULT_PROFILE)
+        rice_price  = _RICE_PRICES.get(rice_market, _DEFAULT_RICE_PRICE)
+
+        nan = math.nan
+        (head_rice_qtl, broken_5pct_qtl, broken_25pct_qtl, broken_d_qtl, total_rice,
+         bran_qtl_v, husk_qtl_v, loss_qtl,
+         actual_outturn, head_rice_pct, bran_pct, husk_pct, loss_pct, outturn_var,
+         head_rice_val, broken_val, bran_val, husk_val, total_rev) = _milling_figures(
+            float(paddy), *profile,
+            nan if head_rice_qtl is None else float(head_rice_qtl),
+            float(broken_5pct_qtl), float(broken_25pct_qtl), float(broken_d_qtl),
+            nan if bran_qtl is None else float(bran_qtl),
+            nan if husk_qtl is None else float(husk_qtl),
+            rice_price, *_BYPRODUCT_PRICES,
         )
-        bran_val         = round(bran_qtl_v * MARKET_PRICES["rice_bran"], 2)
-        husk_val         = round(husk_qtl_v * MARKET_PRICES["husk"], 2)
-        total_rev        = head_rice_val + broken_val + bran_val + husk_val
 
         output = MillingOutput(
             lot_id               = lot_id,
@@ -291,7 +471,7 @@ class ConversionTracker:
             broken_5pct_qtl      = broken_5pct_qtl,
             broken_25pct_qtl     = broken_25pct_qtl,
             broken_d_qtl         = broken_d_qtl,
-            total_rice_qtl       = round(total_rice, 2),
+            total_rice_qtl       = total_rice,
             bran_qtl             = bran_qtl_v,
             husk_qtl             = husk_qtl_v,
             milling_loss_qtl     = loss_qtl,
@@ -307,33 +487,51 @@ class ConversionTracker:
             husk_value           = husk_val,
             total_revenue_potential = total_rev,
         )
-        self._outputs[lot_id] = output
+        self._record_output(output)
         lot.status     = LotStatus.COMPLETED
         lot.milled_date= milled_date or date.today().isoformat()
         return output
 
-    def generate_report(self, period: str = "") -> ConversionReport:
-        outputs = list(self._outputs.values())
-        lots    = list(self._lots.values())
+    def _record_output(self, o: MillingOutput) -> None:
+        row = self._output_index.setdefault(o.lot_id, len(self._output_list))
+        if row == len(self._output_list):
+            self._output_list.append(o)
+        else:
+            self._output_list[row] = o
+        if row == len(self._report_cols):
+            self._report_cols = np.resize(self._report_cols, (2 * row, _N_REPORT_COLS))
+        self._report_cols[row] = (
+            o.paddy_qtl_processed, o.total_rice_qtl, o.bran_qtl, o.husk_qtl,
+            o.broken_5pct_qtl + o.broken_25pct_qtl + o.broken_d_qtl,
+            o.milling_loss_qtl, o.actual_outturn_pct, o.head_rice_pct,
+            o.total_revenue_potential,
+        )
 
-        if not outputs:
+    def generate_report(self, period: str = "", include_lots: bool = True) -> ConversionReport:
+        """
+        Aggregate volumes, KPIs and reconciliation over all milled lots.
+        With include_lots=False the per-lot detail is left out (lots=[])
+        for callers that only need the headline figures.
+        """
+        n_outputs = len(self._output_list)
+        lots    = [l.to_dict() for l in self._lot_list] if include_lots else []
+
+        if not n_outputs:
             return ConversionReport(
                 mill_id=self.mill_id, report_period=period or date.today().isoformat(),
                 total_paddy_qtl=0, total_rice_qtl=0, total_bran_qtl=0, total_husk_qtl=0,
                 total_broken_qtl=0, total_loss_qtl=0, avg_outturn_pct=0, avg_head_rice_pct=0,
                 total_revenue_potential=0, reconciliation={}, efficiency_alerts=[],
-                lots=[asdict(l) for l in lots],
+                lots=lots,
             )
 
-        total_paddy    = sum(o.paddy_qtl_processed for o in outputs)
-        total_rice     = sum(o.total_rice_qtl for o in outputs)
-        total_bran     = sum(o.bran_qtl for o in outputs)
-        total_husk     = sum(o.husk_qtl for o in outputs)
-        total_broken   = sum(o.broken_5pct_qtl + o.broken_25pct_qtl + o.broken_d_qtl for o in outputs)
-        total_loss     = sum(o.milling_loss_qtl for o in outputs)
-        avg_outturn    = round(sum(o.actual_outturn_pct for o in outputs) / len(outputs), 2)
-        avg_head_rice  = round(sum(o.head_rice_pct for o in outputs) / len(outputs), 2)
-        total_rev      = sum(o.total_revenue_potential for o in outputs)
+        # All column totals in one reduction over the filled rows
+        (total_paddy, total_rice, total_bran, total_husk, total_broken,
+         total_loss, sum_outturn, sum_head_rice, total_rev) = (
+            self._report_cols[:n_outputs].sum(axis=0).tolist()
+        )
+        avg_outturn    = round(sum_outturn / n_outputs, 2)
+        avg_head_rice  = round(sum_head_rice / n_outputs, 2)
 
         # Reconciliation
         total_output   = total_rice + total_bran + total_husk + total_loss
@@ -375,7 +573,7 @@ class ConversionTracker:
             total_revenue_potential = round(total_rev, 2),
             reconciliation        = recon,
             efficiency_alerts     = alerts,
-            lots                  = [asdict(l) for l in lots],
+            lots                  = lots,
         )
 
 
@@ -402,7 +600,7 @@ def ricemill_conversion(params: dict) -> dict:
                 moisture_pct = float(params.get("moisture_pct", 13.5)),
                 receipt_date = params.get("receipt_date"),
             )
-            return asdict(lot)
+            return lot.to_dict()
         elif action == "mill":
             output = tracker.record_milling(
                 lot_id           = params["lot_id"],
@@ -414,9 +612,12 @@ def ricemill_conversion(params: dict) -> dict:
                 husk_qtl         = float(params["husk_qtl"]) if "husk_qtl" in params else None,
                 rice_market      = params.get("rice_market", "common_raw"),
             )
-            return asdict(output)
+            return output.to_dict()
         elif action == "report":
-            return asdict(tracker.generate_report(params.get("period", "")))
+            return tracker.generate_report(
+                period       = params.get("period", ""),
+                include_lots = bool(params.get("include_lots", True)),
+            ).to_dict()
         elif action == "prices":
             return {"market_prices_per_qtl": MARKET_PRICES, "variety_outturns": VARIETY_OUTTURN}
         else:
@@ -34,12 +34,15 @@ Alerts:
 
 from __future__ import annotations
 
-import json
-from dataclasses import dataclass, field, asdict
+import hashlib
+from dataclasses import dataclass, field
 from datetime import date
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional, Union
 from enum import Enum
 
+import msgspec
+import numpy as np
+
 
 # ---------------------------------------------------------------------------
 # Enums
@@ -54,6 +57,20 @@ class PaymentMode(str, Enum):
     DD        = "demand_draft"
 
 
+# value -> member, so parsing a mode is a dict lookup rather than Enum(value)
+_PAYMENT_MODES: Dict[str, PaymentMode] = {m.value: m for m in PaymentMode}
+
+
+def _payment_mode(value: str) -> PaymentMode:
+    """PaymentMode(value.lower()), including its ValueError for unknown modes."""
+    mode = _PAYMENT_MODES.get(value)
+    if mode is None:
+        mode = _PAYMENT_MODES.get(value.lower())
+        if mode is None:
+            raise ValueError(f"{value.lower()!r} is not a valid PaymentMode")
+    return mode
+
+
 class ComplianceStatus(str, Enum):
     OK       = "ok"
     WARNING  = "warning"
@@ -69,13 +86,103 @@ PAN_THRESHOLD              = 50_000     # Form 60 mandatory above ₹50K without
 FORM_31A_THRESHOLD         = 1_00_00_000  # ₹1 Cr aggregate cash
 SEC_269ST_LIMIT            = 2_00_000   # Cash receipt limit
 WARNING_THRESHOLD          = 1_80_000   # Alert at 90% of ₹2L limit
+AADHAAR_REMINDER_THRESHOLD = 1_00_000   # Suggest Aadhaar linkage above ₹1L
+
+# The same limits in paise: payments are compared as integer paise
+_CASH_LIMIT_PAISE       = CASH_LIMIT_PER_TRANSACTION * 100
+_PAN_THRESHOLD_PAISE    = PAN_THRESHOLD * 100
+_FORM_31A_PAISE         = FORM_31A_THRESHOLD * 100
+_SEC_269ST_PAISE        = SEC_269ST_LIMIT * 100
+_WARNING_PAISE          = WARNING_THRESHOLD * 100
+_AADHAAR_REMINDER_PAISE = AADHAAR_REMINDER_THRESHOLD * 100
+
+# Compliance flags: record_payment stores only the code; the text is rendered
+# from the payment when it is serialized
+_FLAG_TEXT: Dict[str, str] = {
+    "40a3_violation": (
+        "VIOLATION u/s 40A(3): Cash payment ₹{amount:,.0f} exceeds ₹2L limit. "
+        "₹{excess:,.0f} will be DISALLOWED."
+    ),
+    "cash_warning": (
+        "WARNING: Cash payment ₹{amount:,.0f} approaching ₹2L limit. "
+        "Use bank transfer for amounts >₹2L."
+    ),
+    "form_60": (
+        "Form 60 required: Payment ₹{amount:,.0f} ≥ ₹50,000 without PAN. "
+        "Collect Form 60 from farmer {farmer_name}."
+    ),
+    "269st_violation": (
+        "VIOLATION u/s 269ST: Cash receipt by farmer >₹2L. "
+        "Farmer may face penalty equal to amount received."
+    ),
+    "aadhaar_link": (
+        "Recommend linking farmer Aadhaar for PM-KISAN / PMFBY eligibility "
+        "and for bank-linked payment traceability."
+    ),
+}
+
+# FarmerPaymentTracker ledger money columns (paise): total paid, cash paid, bank paid
+_N_LEDGER_COLS = 3
+
+
+def _paise(rupees: float) -> int:
+    return round(rupees * 100)
+
+
+# ---------------------------------------------------------------------------
+# Compliance checks
+# ---------------------------------------------------------------------------
+
+def check_compliance(
+    amount_paise:   int,
+    is_cash:        bool,
+    has_pan:        bool,
+    aadhaar_linked: bool,
+) -> tuple:
+    """
+    Compliance checks for one payment of `amount_paise` paise.
+
+    Returns (status, deductible, flag_codes), flag_codes being _FLAG_TEXT
+    keys.  Depends only on its arguments, so it can be reused outside the
+    tracker (or compiled on its own).
+    """
+    flag_codes = []
+    status     = ComplianceStatus.OK
+    deductible = True
+
+    # 1. Cash limit check
+    if is_cash:
+        if amount_paise > _CASH_LIMIT_PAISE:
+            flag_codes.append("40a3_violation")
+            status     = ComplianceStatus.VIOLATION
+            deductible = False
+        elif amount_paise >= _WARNING_PAISE:
+            flag_codes.append("cash_warning")
+            status = ComplianceStatus.WARNING
+
+    # 2. PAN / Form 60 check
+    if amount_paise >= _PAN_THRESHOLD_PAISE and not has_pan:
+        flag_codes.append("form_60")
+        if status is ComplianceStatus.OK:
+            status = ComplianceStatus.WARNING
+
+    # 3. Section 269ST — cash receipt >₹2L
+    if is_cash and amount_paise > _SEC_269ST_PAISE:
+        flag_codes.append("269st_violation")
+        status = ComplianceStatus.VIOLATION
+
+    # 4. Aadhaar linkage reminder for large payments
+    if not aadhaar_linked and amount_paise > _AADHAAR_REMINDER_PAISE:
+        flag_codes.append("aadhaar_link")
+
+    return status, deductible, flag_codes
 
 
 # ---------------------------------------------------------------------------
 # Data structures
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class FarmerPayment:
     payment_id:     str
     farmer_id:      str
@@ -92,11 +199,43 @@ class FarmerPayment:
     bank_ref:       Optional[str]   = None
     form_60_filed:  bool            = False
     status:         ComplianceStatus= ComplianceStatus.OK
-    flags:          List[str]       = field(default_factory=list)
+    flag_codes:     List[str]       = field(default_factory=list)   # _FLAG_TEXT keys
     deductible:     bool            = True   # 40A(3) compliance
 
-
-@dataclass
+    @property
+    def flags(self) -> List[str]:
+        """The compliance flags as text."""
+        values = {
+            "amount":      self.gross_amount,
+            "excess":      self.gross_amount - CASH_LIMIT_PER_TRANSACTION,
+            "farmer_name": self.farmer_name,
+        }
+        return [_FLAG_TEXT[code].format(**values) for code in self.flag_codes]
+
+    def to_dict(self) -> dict:
+        """Fields as a dict of plain JSON types: enums as their values, flags as text."""
+        return {
+            "payment_id":     self.payment_id,
+            "farmer_id":      self.farmer_id,
+            "farmer_name":    self.farmer_name,
+            "village":        self.village,
+            "mobile":         self.mobile,
+            "pan":            self.pan,
+            "aadhaar_linked": self.aadhaar_linked,
+            "payment_date":   self.payment_date,
+            "paddy_qtl":      self.paddy_qtl,
+            "rate_per_qtl":   self.rate_per_qtl,
+            "gross_amount":   self.gross_amount,
+            "payment_mode":   self.payment_mode.value,
+            "bank_ref":       self.bank_ref,
+            "form_60_filed":  self.form_60_filed,
+            "status":         self.status.value,
+            "flags":          self.flags,
+            "deductible":     self.deductible,
+        }
+
+
+@dataclass(slots=True)
 class FarmerLedger:
     farmer_id:      str
     farmer_name:    str
@@ -109,8 +248,23 @@ class FarmerLedger:
     bank_paid:      float   = 0.0
     payments:       List[str] = field(default_factory=list)   # payment_ids
 
-
-@dataclass
+    def to_dict(self) -> dict:
+        """Fields as a dict; the payment id list is shallow-copied."""
+        return {
+            "farmer_id":       self.farmer_id,
+            "farmer_name":     self.farmer_name,
+            "village":         self.village,
+            "mobile":          self.mobile,
+            "pan":             self.pan,
+            "total_paddy_qtl": self.total_paddy_qtl,
+            "total_paid":      self.total_paid,
+            "cash_paid":       self.cash_paid,
+            "bank_paid":       self.bank_paid,
+            "payments":        list(self.payments),
+        }
+
+
+@dataclass(slots=True)
 class ComplianceReport:
     mill_id:          str
     mill_name:        str
@@ -125,6 +279,23 @@ class ComplianceReport:
     form_31a_required: bool
     recommendations:  List[str]
 
+    def to_dict(self) -> dict:
+        """Fields as a dict, with violations and warnings serialized."""
+        return {
+            "mill_id":           self.mill_id,
+            "mill_name":         self.mill_name,
+            "report_date":       self.report_date,
+            "total_payments":    self.total_payments,
+            "total_amount":      self.total_amount,
+            "cash_total":        self.cash_total,
+            "bank_total":        self.bank_total,
+            "violations":        [p.to_dict() for p in self.violations],
+            "warnings":          [p.to_dict() for p in self.warnings],
+            "aggregate_summary": dict(self.aggregate_summary),
+            "form_31a_required": self.form_31a_required,
+            "recommendations":   list(self.recommendations),
+        }
+
 
 # ---------------------------------------------------------------------------
 # Tracker
@@ -139,9 +310,34 @@ class FarmerPaymentTracker:
     def __init__(self, mill_id: str, mill_name: str):
         self.mill_id   = mill_id
         self.mill_name = mill_name
-        self._payments: Dict[str, FarmerPayment] = {}
-        self._ledgers:  Dict[str, FarmerLedger]  = {}
+        # Payments in recording order, plus payment_id -> position for lookups
+        self._payments:       List[FarmerPayment] = []
+        self._payments_by_id: Dict[str, int]      = {}
+        # Farmer ledgers, one row per farmer in first-payment order: identity
+        # (farmer_id, name, village, mobile, pan) and payment ids in lists,
+        # running totals in _ledger_qtl and _ledger_paise; capacity doubles
+        # as farmers are added.
+        self._farmer_index:    Dict[str, int]  = {}
+        self._farmers:         List[tuple]     = []
+        self._farmer_payments: List[List[str]] = []
+        self._ledger_qtl   = np.zeros(16)
+        self._ledger_paise = np.zeros((16, _N_LEDGER_COLS), dtype=np.int64)
         self._seq       = 0
+        # (farmer_name, village, mobile) -> derived farmer_id
+        self._fid_cache: Dict[tuple, str] = {}
+        # Compliance aggregates, kept up to date by record_payment (payments
+        # are never modified after recording); money in integer paise, so the
+        # totals are exact
+        self._total_paise        = 0
+        self._total_paddy_qtl    = 0.0
+        self._cash_paise         = 0
+        self._disallowance_paise = 0   # 40A(3): cash paid over the limit on violations
+        self._violations:  List[FarmerPayment] = []
+        self._warnings:    List[FarmerPayment] = []
+        self._missing_pan: List[FarmerPayment] = []
+        # Per-day rollup keyed by ISO payment date:
+        # [payments, cash paise, bank paise, violations]
+        self._daily: Dict[str, List[int]] = {}
 
     def record_payment(
         self,
@@ -158,61 +354,20 @@ class FarmerPaymentTracker:
         bank_ref:     Optional[str] = None,
     ) -> FarmerPayment:
 
-        import hashlib, time
         self._seq      += 1
         pid            = f"PAY{self.mill_id}{self._seq:05d}"
-        fid            = farmer_id or hashlib.md5(f"{farmer_name}{village}{mobile}".encode()).hexdigest()[:8]
+        fid            = farmer_id or self._derive_farmer_id(farmer_name, village, mobile)
         amount         = round(paddy_qtl * rate_per_qtl, 2)
+        amount_paise   = _paise(amount)     # exact: amount is whole paise
         pdate          = payment_date or date.today().isoformat()
-        mode           = PaymentMode(payment_mode.lower())
+        mode           = _payment_mode(payment_mode)
+        is_cash        = mode is PaymentMode.CASH
 
-        flags          = []
-        status         = ComplianceStatus.OK
-        deductible     = True
+        status, deductible, flag_codes = check_compliance(
+            amount_paise, is_cash, bool(pan), aadhaar_linked
+        )
         form_60_filed  = False
 
-        # ── Compliance checks ────────────────────────────────────────────
-
-        # 1. Cash limit check
-        if mode == PaymentMode.CASH:
-            if amount > CASH_LIMIT_PER_TRANSACTION:
-                flags.append(
-                    f"VIOLATION u/s 40A(3): Cash payment ₹{amount:,.0f} exceeds ₹2L limit. "
-                    f"₹{amount - CASH_LIMIT_PER_TRANSACTION:,.0f} will be DISALLOWED."
-                )
-                status     = ComplianceStatus.VIOLATION
-                deductible = False
-            elif amount >= WARNING_THRESHOLD:
-                flags.append(
-                    f"WARNING: Cash payment ₹{amount:,.0f} approaching ₹2L limit. "
-                    f"Use bank transfer for amounts >₹2L."
-                )
-                status = ComplianceStatus.WARNING
-
-        # 2. PAN / Form 60 check
-        if amount >= PAN_THRESHOLD and not pan:
-            flags.append(
-                f"Form 60 required: Payment ₹{amount:,.0f} ≥ ₹50,000 without PAN. "
-                f"Collect Form 60 from farmer {farmer_name}."
-            )
-            if status == ComplianceStatus.OK:
-                status = ComplianceStatus.WARNING
-
-        # 3. Section 269ST — cash receipt >₹2L
-        if mode == PaymentMode.CASH and amount > SEC_269ST_LIMIT:
-            flags.append(
-                f"VIOLATION u/s 269ST: Cash receipt by farmer >₹2L. "
-                f"Farmer may face penalty equal to amount received."
-            )
-            status = ComplianceStatus.VIOLATION
-
-        # 4. Aadhaar linkage reminder for large payments
-        if not aadhaar_linked and amount > 1_00_000:
-            flags.append(
-                f"Recommend linking farmer Aadhaar for PM-KISAN / PMFBY eligibility "
-                f"and for bank-linked payment traceability."
-            )
-
         payment = FarmerPayment(
             payment_id     = pid,
             farmer_id      = fid,
@@ -229,49 +384,98 @@ class FarmerPaymentTracker:
             bank_ref       = bank_ref,
             form_60_filed  = form_60_filed,
             status         = status,
-            flags          = flags,
+            flag_codes     = flag_codes,
             deductible     = deductible,
         )
 
-        self._payments[pid] = payment
+        self._payments_by_id[pid] = len(self._payments)
+        self._payments.append(payment)
+
+        # Update compliance aggregates
+        self._total_paise += amount_paise
+        self._total_paddy_qtl += paddy_qtl
+        if is_cash:
+            self._cash_paise += amount_paise
+        if status is ComplianceStatus.VIOLATION:
+            self._violations.append(payment)
+            if is_cash:
+                self._disallowance_paise += amount_paise - _CASH_LIMIT_PAISE
+        elif status is ComplianceStatus.WARNING:
+            self._warnings.append(payment)
+        if amount_paise >= _PAN_THRESHOLD_PAISE and not pan:
+            self._missing_pan.append(payment)
+
+        day = self._daily.get(pdate)
+        if day is None:
+            day = self._daily[pdate] = [0, 0, 0, 0]
+        day[0] += 1
+        day[1 if is_cash else 2] += amount_paise
+        if status is ComplianceStatus.VIOLATION:
+            day[3] += 1
 
         # Update ledger
-        if fid not in self._ledgers:
-            self._ledgers[fid] = FarmerLedger(
-                farmer_id   = fid,
-                farmer_name = farmer_name,
-                village     = village,
-                mobile      = mobile,
-                pan         = pan,
-            )
-        ledger = self._ledgers[fid]
-        ledger.total_paddy_qtl += paddy_qtl
-        ledger.total_paid      += amount
-        if mode == PaymentMode.CASH:
-            ledger.cash_paid   += amount
-        else:
-            ledger.bank_paid   += amount
-        ledger.payments.append(pid)
+        i = self._farmer_index.get(fid)
+        if i is None:
+            i = self._farmer_index[fid] = len(self._farmers)
+            self._farmers.append((fid, farmer_name, village, mobile, pan))
+            self._farmer_payments.append([])
+            if i == len(self._ledger_qtl):
+                qtl = np.zeros(2 * i)
+                qtl[:i] = self._ledger_qtl
+                self._ledger_qtl = qtl
+                money = np.zeros((2 * i, _N_LEDGER_COLS), dtype=np.int64)
+                money[:i] = self._ledger_paise
+                self._ledger_paise = money
+        self._ledger_qtl[i] += paddy_qtl
+        row = self._ledger_paise[i]
+        row[0] += amount_paise
+        row[1 if is_cash else 2] += amount_paise
+        self._farmer_payments[i].append(pid)
 
         return payment
 
+    def _derive_farmer_id(self, farmer_name: str, village: str, mobile: str) -> str:
+        """Stable 8-hex-digit id for a farmer, hashed once per farmer."""
+        key = (farmer_name, village, mobile)
+        fid = self._fid_cache.get(key)
+        if fid is None:
+            fid = self._fid_cache[key] = hashlib.md5(
+                f"{farmer_name}{village}{mobile}".encode()
+            ).hexdigest()[:8]
+        return fid
+
+    def record_batch(self, rows: List[Dict]) -> List[FarmerPayment]:
+        """
+        Record several payments in order; each row holds record_payment's
+        keyword arguments.  Every row's payment mode is checked before any
+        is recorded, so a batch with an unknown mode records nothing.  Rows
+        without a payment_date all get the date the batch started.
+        """
+        for i, row in enumerate(rows):
+            try:
+                _payment_mode(row["payment_mode"])
+            except (KeyError, ValueError, AttributeError) as exc:
+                raise ValueError(f"payments[{i}]: invalid payment_mode ({exc})") from exc
+        today = date.today().isoformat()
+        return [
+            self.record_payment(**{**row, "payment_date": row.get("payment_date") or today})
+            for row in rows
+        ]
+
     def get_compliance_report(self) -> ComplianceReport:
-        payments   = list(self._payments.values())
         today      = date.today().isoformat()
-        violations = [p for p in payments if p.status == ComplianceStatus.VIOLATION]
-        warnings   = [p for p in payments if p.status == ComplianceStatus.WARNING]
+        violations = list(self._violations)
+        warnings   = list(self._warnings)
 
-        total_amount   = sum(p.gross_amount for p in payments)
-        cash_total     = sum(p.gross_amount for p in payments if p.payment_mode == PaymentMode.CASH)
-        bank_total     = total_amount - cash_total
-        disallowed     = sum(p.gross_amount for p in violations)
-        non_deductible = sum(p.gross_amount - CASH_LIMIT_PER_TRANSACTION
-                             for p in violations if p.payment_mode == PaymentMode.CASH)
+        total_amount   = self._total_paise / 100
+        cash_total     = self._cash_paise / 100
+        bank_total     = (self._total_paise - self._cash_paise) / 100
+        non_deductible = self._disallowance_paise / 100
 
-        form_31a_req   = cash_total >= FORM_31A_THRESHOLD
+        form_31a_req   = self._cash_paise >= _FORM_31A_PAISE
 
         # Missing PAN/Form 60
-        missing_pan    = [p for p in payments if p.gross_amount >= PAN_THRESHOLD and not p.pan]
+        missing_pan    = self._missing_pan
 
         recommendations = []
         if violations:
@@ -300,38 +504,83 @@ class FarmerPaymentTracker:
             mill_id           = self.mill_id,
             mill_name         = self.mill_name,
             report_date       = today,
-            total_payments    = len(payments),
-            total_amount      = round(total_amount, 2),
-            cash_total        = round(cash_total, 2),
-            bank_total        = round(bank_total, 2),
+            total_payments    = len(self._payments),
+            total_amount      = total_amount,
+            cash_total        = cash_total,
+            bank_total        = bank_total,
             violations        = violations,
             warnings          = warnings,
             aggregate_summary = {
-                "total_farmers":          len(self._ledgers),
-                "total_paddy_qtl":        round(sum(l.total_paddy_qtl for l in self._ledgers.values()), 2),
-                "total_amount":           round(total_amount, 2),
+                "total_farmers":          len(self._farmers),
+                "total_paddy_qtl":        round(self._total_paddy_qtl, 2),
+                "total_amount":           total_amount,
                 "cash_pct":               round(cash_total / max(1, total_amount) * 100, 1),
                 "bank_pct":               round(bank_total / max(1, total_amount) * 100, 1),
                 "violation_count":        len(violations),
                 "missing_pan_count":      len(missing_pan),
-                "estimated_disallowance": round(non_deductible, 2),
+                "estimated_disallowance": non_deductible,
             },
             form_31a_required = form_31a_req,
             recommendations   = recommendations,
         )
 
+    def get_daily_report(self, start: str = "", end: str = "") -> List[Dict]:
+        """
+        Per-day payment totals for payment dates in [start, end] (ISO dates,
+        either bound optional), oldest first.  Read from the daily rollup,
+        so the cost depends on the number of days, not payments.
+        """
+        rows = []
+        for pdate in sorted(self._daily):
+            if (start and pdate < start) or (end and pdate > end):
+                continue
+            n, cash, bank, violations = self._daily[pdate]
+            rows.append({
+                "date":            pdate,
+                "payments":        n,
+                "total_amount":    (cash + bank) / 100,
+                "cash_total":      cash / 100,
+                "bank_total":      bank / 100,
+                "violation_count": violations,
+            })
+        return rows
+
     def list_payments(self, status_filter: Optional[str] = None) -> List[Dict]:
-        payments = list(self._payments.values())
-        if status_filter:
-            payments = [p for p in payments if p.status.value == status_filter]
-        return [asdict(p) for p in payments]
+        if status_filter == ComplianceStatus.VIOLATION.value:
+            payments = self._violations
+        elif status_filter == ComplianceStatus.WARNING.value:
+            payments = self._warnings
+        elif status_filter:
+            payments = [p for p in self._payments if p.status.value == status_filter]
+        else:
+            payments = self._payments
+        return [p.to_dict() for p in payments]
+
+    def _ledger(self, i: int) -> FarmerLedger:
+        """FarmerLedger for ledger row i, with its totals in rupees."""
+        fid, farmer_name, village, mobile, pan = self._farmers[i]
+        paid, cash, bank = self._ledger_paise[i].tolist()
+        return FarmerLedger(
+            farmer_id       = fid,
+            farmer_name     = farmer_name,
+            village         = village,
+            mobile          = mobile,
+            pan             = pan,
+            total_paddy_qtl = float(self._ledger_qtl[i]),
+            total_paid      = paid / 100,
+            cash_paid       = cash / 100,
+            bank_paid       = bank / 100,
+            payments        = list(self._farmer_payments[i]),
+        )
 
     def get_farmer_summary(self, farmer_id: str) -> Optional[Dict]:
-        ledger = self._ledgers.get(farmer_id)
-        if not ledger:
+        i = self._farmer_index.get(farmer_id)
+        if i is None:
             return None
-        payments = [asdict(self._payments[pid]) for pid in ledger.payments if pid in self._payments]
-        return {**asdict(ledger), "payment_details": payments}
+        ledger = self._ledger(i)
+        by_id    = self._payments_by_id
+        payments = [self._payments[by_id[pid]].to_dict() for pid in ledger.payments if pid in by_id]
+        return {**ledger.to_dict(), "payment_details": payments}
 
 
 # ---------------------------------------------------------------------------
@@ -340,41 +589,103 @@ class FarmerPaymentTracker:
 
 _trackers: Dict[str, FarmerPaymentTracker] = {}
 
-def ricemill_farmer_payments(params: dict) -> dict:
-    mill_id   = params.get("mill_id", "RM001")
-    mill_name = params.get("mill_name", "Rice Mill")
-    if mill_id not in _trackers:
-        _trackers[mill_id] = FarmerPaymentTracker(mill_id, mill_name)
-    tracker = _trackers[mill_id]
+# Request schema for one payment: record_payment's keyword arguments.  msgspec
+# validates and coerces a payload (or a batch of them) in C; defaults mirror
+# the documented payload defaults.  payment_mode stays a string so that
+# record_payment keeps its case-insensitive parsing.  Lax mode turns numeric
+# strings into numbers but never numbers into strings, so a JSON-number
+# mobile is accepted as Union[str, int] and stringified in _payment_kwargs,
+# and aadhaar_linked keeps the old bool() truthiness ("yes" is True).
+# Stricter than the old hand parsing: farmer_name, village, payment_mode,
+# payment_date, pan and bank_ref must be strings (or null where Optional).
+_PaymentRow: Any = msgspec.defstruct("PaymentRow", [
+    ("farmer_name",    str),
+    ("paddy_qtl",      float),
+    ("rate_per_qtl",   float),
+    ("village",        str,              ""),
+    ("mobile",         Union[str, int],  ""),
+    ("payment_mode",   str,              "cash"),
+    ("payment_date",   Optional[str],    None),
+    ("pan",            Optional[str],    None),
+    ("aadhaar_linked", Any,              False),
+    ("bank_ref",       Optional[str],    None),
+])
+
+_PAYMENT_ROWS: Any = List[_PaymentRow]
+
+
+# Query parameters of every action (the mill) and of the read-only actions,
+# validated the same way so that a wrongly typed value is a {"error": ...}
+# response rather than a TypeError
+_MillQuery: Any = msgspec.defstruct("MillQuery", [
+    ("mill_id",        str,              "RM001"),
+    ("mill_name",      str,              "Rice Mill"),
+])
+
+_DailyQuery: Any = msgspec.defstruct("DailyQuery", [
+    ("start",          str,              ""),     # ISO dates, inclusive
+    ("end",            str,              ""),
+])
+
+_ListQuery: Any = msgspec.defstruct("ListQuery", [
+    ("status",         Optional[str],    None),
+])
+
+_FarmerQuery: Any = msgspec.defstruct("FarmerQuery", [
+    ("farmer_id",      str,              ""),
+])
+
+
+def _payment_kwargs(row: Any) -> dict:
+    """record_payment keyword arguments from a validated _PaymentRow."""
+    kwargs = msgspec.structs.asdict(row)
+    kwargs["mobile"]         = str(row.mobile)
+    kwargs["aadhaar_linked"] = bool(row.aadhaar_linked)
+    return kwargs
 
+def ricemill_farmer_payments(params: dict) -> dict:
     action = params.get("action", "record")
     try:
+        mill = msgspec.convert(params, type=_MillQuery, strict=False)
+        if mill.mill_id not in _trackers:
+            _trackers[mill.mill_id] = FarmerPaymentTracker(mill.mill_id, mill.mill_name)
+        tracker = _trackers[mill.mill_id]
+
         if action == "record":
-            payment = tracker.record_payment(
-                farmer_name    = params["farmer_name"],
-                village        = params.get("village", ""),
-                mobile         = params.get("mobile", ""),
-                paddy_qtl      = float(params["paddy_qtl"]),
-                rate_per_qtl   = float(params["rate_per_qtl"]),
-                payment_mode   = params.get("payment_mode", "cash"),
-                payment_date   = params.get("payment_date"),
-                pan            = params.get("pan"),
-                aadhaar_linked = bool(params.get("aadhaar_linked", False)),
-                bank_ref       = params.get("bank_ref"),
-            )
-            return asdict(payment)
-        elif action == "report":
-            report = tracker.get_compliance_report()
+            row     = msgspec.convert(params, type=_PaymentRow, strict=False)
+            payment = tracker.record_payment(**_payment_kwargs(row))
+            return payment.to_dict()
+        elif action == "record_batch":
+            rows     = [
+                _payment_kwargs(row)
+                for row in msgspec.convert(params.get("payments", []), type=_PAYMENT_ROWS, strict=False)
+            ]
+            payments = tracker.record_batch(rows)
             return {
-                **asdict(report),
-                "violations": [asdict(v) for v in report.violations],
-                "warnings":   [asdict(w) for w in report.warnings],
+                "recorded": len(payments),
+                "payments": [p.to_dict() for p in payments],
             }
+        elif action == "report":
+            return tracker.get_compliance_report().to_dict()
+        elif action == "daily":
+            query = msgspec.convert(params, type=_DailyQuery, strict=False)
+            return {"days": tracker.get_daily_report(query.start, query.end)}
         elif action == "list":
-            return {"payments": tracker.list_payments(params.get("status"))}
+            query = msgspec.convert(params, type=_ListQuery, strict=False)
+            return {"payments": tracker.list_payments(query.status)}
         elif action == "farmer":
-            return tracker.get_farmer_summary(params["farmer_id"]) or {"error": "Farmer not found"}
+            query = msgspec.convert(params, type=_FarmerQuery, strict=False)
+            return tracker.get_farmer_summary(query.farmer_id) or {"error": "Farmer not found"}
         else:
             return {"error": f"Unknown action: {action}"}
-    except Exception as e:
+    except ValueError as e:     # bad payload; msgspec.ValidationError is a ValueError
         return {"error": str(e)}
+
+
+def ricemill_farmer_payments_json(params: dict) -> bytes:
+    """
+    ricemill_farmer_payments encoded straight to JSON bytes.  The response
+    holds only plain str/float/bool/list/dict values, so msgspec encodes it
+    without per-value type dispatch.
+    """
+    return msgspec.json.encode(ricemill_farmer_payments(params))
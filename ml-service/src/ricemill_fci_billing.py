@@ -31,10 +31,15 @@ Integration:
 from __future__ import annotations
 
 from dataclasses import dataclass, field, asdict
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional, Union
 from datetime import date
 from enum import Enum
 
+import msgspec
+import numpy as np
+
+from money_rounding import round2_vec, round_paise, round_paise_vec
+
 
 # ---------------------------------------------------------------------------
 # FCI milling rates by AP / TS district (₹ per quintal paddy, 2024-25)
@@ -83,6 +88,20 @@ FCI_TRANSPORT_OUTWARD: Dict[str, float] = {
     "default": 10.0,
 }
 
+# District -> (milling rate, inward transport, outward transport), resolved
+# once so a bill needs a single lookup; unknown districts get the defaults
+_DEFAULT_DISTRICT_RATES = (
+    FCI_MILLING_RATES["default"], FCI_TRANSPORT_INWARD["default"], FCI_TRANSPORT_OUTWARD["default"],
+)
+_DISTRICT_RATES: Dict[str, tuple] = {
+    d: (
+        FCI_MILLING_RATES.get(d, _DEFAULT_DISTRICT_RATES[0]),
+        FCI_TRANSPORT_INWARD.get(d, _DEFAULT_DISTRICT_RATES[1]),
+        FCI_TRANSPORT_OUTWARD.get(d, _DEFAULT_DISTRICT_RATES[2]),
+    )
+    for d in {*FCI_MILLING_RATES, *FCI_TRANSPORT_INWARD, *FCI_TRANSPORT_OUTWARD}
+}
+
 # CMR specifications
 CMR_OUTTURN_RATIO      = 0.67    # 67 kg rice per 100 kg paddy (standard)
 CMR_OUTTURN_PREMIUM    = 0.68    # 68% for grade A paddy
@@ -116,7 +135,7 @@ class MoistureAction(str, Enum):
 # Data structures
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class FCIMillingBill:
     bill_no:            str
     mill_id:            str
@@ -163,6 +182,23 @@ class FCIMillingBill:
     notes:              List[str] = field(default_factory=list)
 
 
+# ---------------------------------------------------------------------------
+# Money helpers
+# ---------------------------------------------------------------------------
+#
+# Each charge is rounded to the paisa (CPython round(x, 2) semantics, see
+# money_rounding) and then carried as integer paise, so bill totals and season
+# totals are exact sums; rupees come back only when a bill or summary is built.
+
+def _seq_sum(x: np.ndarray) -> float:
+    """Left-to-right sum, as the builtin sum() adds (np.sum is pairwise)."""
+    return float(np.cumsum(x)[-1]) if len(x) else 0.0
+
+
+def _lot_column(lots: List[Dict], key: str, default, dtype) -> np.ndarray:
+    return np.fromiter((lot.get(key, default) for lot in lots), dtype=dtype, count=len(lots))
+
+
 # ---------------------------------------------------------------------------
 # Calculator
 # ---------------------------------------------------------------------------
@@ -189,43 +225,48 @@ class FCIMillingCalculator:
         bag_damage_bags: int = 0,       # number of damaged bags
         other_deductions: float = 0.0,
         bill_no:       str   = "",
+        bill_date:     str   = "",      # ISO date; defaults to today
     ) -> FCIMillingBill:
 
-        today    = date.today().isoformat()
+        today    = bill_date or date.today().isoformat()
         district = district.lower().strip()
-        rate     = FCI_MILLING_RATES.get(district, FCI_MILLING_RATES["default"])
+        rate, inward_rate, outward_rate = _DISTRICT_RATES.get(district, _DEFAULT_DISTRICT_RATES)
 
         # Outturn
         outturn  = CMR_OUTTURN_PREMIUM if is_grade_a_paddy else CMR_OUTTURN_RATIO
         cmr_qtl  = round(paddy_qtl * outturn, 2)
         cmr_bags = int(cmr_qtl * 2)   # 50 kg bag = 0.5 qtl; bags = cmr_qtl / 0.5
 
-        # Moisture
+        # Moisture (money below in integer paise)
         if moisture_pct <= MOISTURE_TOLERANCE:
             moisture_action  = MoistureAction.ACCEPTED
-            moisture_dockage = 0.0
+            dockage_p        = 0
         elif moisture_pct <= 17.0:
             excess           = moisture_pct - MOISTURE_TOLERANCE
-            moisture_dockage = round(paddy_qtl * MOISTURE_DOCKAGE_PER_PCT * excess, 2)
+            dockage_p        = round_paise(paddy_qtl * MOISTURE_DOCKAGE_PER_PCT * excess)
             moisture_action  = MoistureAction.DOCKAGE
         else:
-            moisture_dockage = 0.0
+            dockage_p        = 0
             moisture_action  = MoistureAction.REJECTED
 
         # Milling charges
-        gross_milling = round(paddy_qtl * rate, 2)
-        inward_trans  = round(paddy_qtl * FCI_TRANSPORT_INWARD.get(district, FCI_TRANSPORT_INWARD["default"]), 2) if include_inward_transport else 0.0
-        outward_trans = round(cmr_qtl * FCI_TRANSPORT_OUTWARD.get(district, FCI_TRANSPORT_OUTWARD["default"]), 2) if include_outward_transport else 0.0
-        storage_charge= round(paddy_qtl * 0.50 * storage_days, 2)  # ₹0.50/qtl/day
-        bag_charge    = round(cmr_bags * GUNNY_BAG_COST, 2)
+        milling_p     = round_paise(paddy_qtl * rate)
+        inward_p      = round_paise(paddy_qtl * inward_rate) if include_inward_transport else 0
+        outward_p     = round_paise(cmr_qtl * outward_rate) if include_outward_transport else 0
+        storage_p     = round_paise(paddy_qtl * 0.50 * storage_days)  # ₹0.50/qtl/day
+        bag_charge_p  = round_paise(cmr_bags * GUNNY_BAG_COST)
 
-        gross_bill    = gross_milling + inward_trans + outward_trans + storage_charge + bag_charge
+        gross_bill_p  = milling_p + inward_p + outward_p + storage_p + bag_charge_p
 
         # Deductions
-        tds           = round(gross_milling * TDS_RATE_FCI, 2)
-        bag_damage    = round(bag_damage_bags * GUNNY_BAG_COST, 2)
-        total_ded     = tds + moisture_dockage + bag_damage + other_deductions
-        net_payable   = round(gross_bill - total_ded, 2)
+        tds_p         = round_paise(milling_p / 100 * TDS_RATE_FCI)
+        bag_damage_p  = round_paise(bag_damage_bags * GUNNY_BAG_COST)
+        total_ded_p   = tds_p + dockage_p + bag_damage_p + round_paise(other_deductions)
+        net_payable_p = gross_bill_p - total_ded_p
+
+        moisture_dockage = dockage_p / 100
+        storage_charge   = storage_p / 100
+        tds              = tds_p / 100
 
         notes = []
         if moisture_action == MoistureAction.DOCKAGE:
@@ -238,7 +279,7 @@ class FCIMillingCalculator:
         notes.append("GST: Nil — milling service to government entity (FCI) under Notification 12/2017-CT(Rate)")
         notes.append(f"TDS u/s 194C @ 2% deducted by FCI: ₹{tds:,.0f} (Form 16A will be issued)")
 
-        auto_bill_no = bill_no or f"FCI/{mill_id}/{today[:7].replace('-', '')}/{lot_no}"
+        auto_bill_no = bill_no or f"FCI/{mill_id}/{today[:4]}{today[5:7]}/{lot_no}"   # FCI/<mill>/YYYYMM/<lot>
 
         return FCIMillingBill(
             bill_no               = auto_bill_no,
@@ -257,17 +298,17 @@ class FCIMillingCalculator:
             cmr_qtl               = cmr_qtl,
             cmr_bags              = cmr_bags,
             milling_rate_qtl      = rate,
-            gross_milling_charge  = gross_milling,
-            inward_transport      = inward_trans,
-            outward_transport     = outward_trans,
+            gross_milling_charge  = milling_p / 100,
+            inward_transport      = inward_p / 100,
+            outward_transport     = outward_p / 100,
             storage_charge        = storage_charge,
-            gunny_bag_charge      = bag_charge,
+            gunny_bag_charge      = bag_charge_p / 100,
             tds_2pct              = tds,
-            bag_damage_deduction  = bag_damage,
+            bag_damage_deduction  = bag_damage_p / 100,
             other_deductions      = other_deductions,
-            gross_bill            = gross_bill,
-            total_deductions      = round(total_ded, 2),
-            net_payable           = net_payable,
+            gross_bill            = gross_bill_p / 100,
+            total_deductions      = total_ded_p / 100,
+            net_payable           = net_payable_p / 100,
             gst_amount            = 0.0,
             gst_note              = "Nil — FCI milling service to government",
             notes                 = notes,
@@ -279,11 +320,26 @@ class FCIMillingCalculator:
         mill_name: str,
         district:  str,
         lots:      List[Dict],
+        include_bills: bool = True,
     ) -> Dict:
-        """Compute total FCI billing for multiple lots in a season."""
+        """
+        Compute total FCI billing for multiple lots in a season.  With
+        include_bills=False no per-lot bills are built: the season summary
+        comes from _season_summary_vec over the lots as NumPy columns, with
+        the same figures, and "bills" is empty.
+        """
+        if not include_bills:
+            return {
+                "mill_id":        mill_id,
+                "season_summary": self._season_summary_vec(district, lots),
+                "bills":          [],
+            }
+
+        today  = date.today().isoformat()     # one date for the whole season's bills
         bills  = []
         for lot in lots:
-            b = self.compute_bill(mill_id=mill_id, mill_name=mill_name, district=district, **lot)
+            b = self.compute_bill(mill_id=mill_id, mill_name=mill_name, district=district,
+                                  bill_date=today, **lot)
             bills.append(b)
 
         return {
@@ -292,14 +348,73 @@ class FCIMillingCalculator:
                 "total_lots":         len(bills),
                 "total_paddy_qtl":    round(sum(b.paddy_qtl for b in bills), 2),
                 "total_cmr_qtl":      round(sum(b.cmr_qtl for b in bills), 2),
-                "gross_milling_total":round(sum(b.gross_milling_charge for b in bills), 2),
-                "total_tds":          round(sum(b.tds_2pct for b in bills), 2),
-                "total_net_payable":  round(sum(b.net_payable for b in bills), 2),
+                # bill amounts are whole paise, so these sums are exact
+                "gross_milling_total":sum(round(b.gross_milling_charge * 100) for b in bills) / 100,
+                "total_tds":          sum(round(b.tds_2pct * 100) for b in bills) / 100,
+                "total_net_payable":  sum(round(b.net_payable * 100) for b in bills) / 100,
                 "rejected_lots":      sum(1 for b in bills if b.moisture_action == MoistureAction.REJECTED),
             },
             "bills": [asdict(b) for b in bills],
         }
 
+    @staticmethod
+    def _season_summary_vec(district: str, lots: List[Dict]) -> Dict:
+        """
+        compute_seasonal_total's season_summary, evaluated over all lots at
+        once.  Follows compute_bill step for step (same operation order,
+        CPython rounding, money in paise, left-to-right quantity totals) so
+        the figures are identical.
+        """
+        district = district.lower().strip()
+        rate, inward, outward = _DISTRICT_RATES.get(district, _DEFAULT_DISTRICT_RATES)
+
+        paddy    = np.fromiter((lot["paddy_qtl"] for lot in lots), dtype=np.float64, count=len(lots))
+        moisture = _lot_column(lots, "moisture_pct", 13.5, np.float64)
+        grade_a  = np.fromiter((bool(l.get("is_grade_a_paddy", False)) for l in lots), dtype=bool, count=len(lots))
+        inward_on  = np.fromiter((bool(l.get("include_inward_transport", True)) for l in lots), dtype=bool, count=len(lots))
+        outward_on = np.fromiter((bool(l.get("include_outward_transport", True)) for l in lots), dtype=bool, count=len(lots))
+        storage_days = _lot_column(lots, "storage_days", 0, np.float64)
+        damaged_bags = _lot_column(lots, "bag_damage_bags", 0, np.float64)
+        other_ded    = _lot_column(lots, "other_deductions", 0.0, np.float64)
+
+        # Outturn
+        outturn  = np.where(grade_a, CMR_OUTTURN_PREMIUM, CMR_OUTTURN_RATIO)
+        cmr_qtl  = round2_vec(paddy * outturn)
+        cmr_bags = np.trunc(cmr_qtl * 2)
+
+        # Moisture (money below in int64 paise)
+        dockage_band = (moisture > MOISTURE_TOLERANCE) & (moisture <= 17.0)
+        dockage  = np.where(
+            dockage_band,
+            round_paise_vec(paddy * MOISTURE_DOCKAGE_PER_PCT * (moisture - MOISTURE_TOLERANCE)),
+            0,
+        )
+        rejected = moisture > 17.0
+
+        # Milling charges
+        milling     = round_paise_vec(paddy * rate)
+        inward_p    = np.where(inward_on, round_paise_vec(paddy * inward), 0)
+        outward_p   = np.where(outward_on, round_paise_vec(cmr_qtl * outward), 0)
+        storage     = round_paise_vec(paddy * 0.50 * storage_days)
+        bag_charge  = round_paise_vec(cmr_bags * GUNNY_BAG_COST)
+        gross_bill  = milling + inward_p + outward_p + storage + bag_charge
+
+        # Deductions
+        tds         = round_paise_vec(milling / 100 * TDS_RATE_FCI)
+        bag_damage  = round_paise_vec(damaged_bags * GUNNY_BAG_COST)
+        total_ded   = tds + dockage + bag_damage + round_paise_vec(other_ded)
+        net_payable = gross_bill - total_ded
+
+        return {
+            "total_lots":         len(lots),
+            "total_paddy_qtl":    round(_seq_sum(paddy), 2),
+            "total_cmr_qtl":      round(_seq_sum(cmr_qtl), 2),
+            "gross_milling_total":int(milling.sum()) / 100,
+            "total_tds":          int(tds.sum()) / 100,
+            "total_net_payable":  int(net_payable.sum()) / 100,
+            "rejected_lots":      int(rejected.sum()),
+        }
+
 
 # ---------------------------------------------------------------------------
 # Singleton + API wrapper
@@ -307,38 +422,80 @@ class FCIMillingCalculator:
 
 _calc = FCIMillingCalculator()
 
+# Request schema for one lot: compute_bill's per-lot arguments.  msgspec
+# validates and coerces a payload (or a season's list of lots) in C, enum
+# values included; defaults mirror the documented payload defaults.  Lax
+# mode never turns numbers into strings, so lot_no also takes a JSON number
+# and is stringified in _lot_kwargs; the flags keep the old bool()
+# truthiness and a null bill_no means "generate one".  Stricter than the
+# old hand parsing: paddy_variety must be a string, cmr_grade a CMRGrade
+# value, storage_days / bag_damage_bags whole numbers, and mill_id,
+# mill_name and district strings.
+_LOT_FIELDS = [
+    ("lot_no",                    Union[str, int],  "LOT001"),
+    ("paddy_qtl",                 float,            0.0),
+    ("paddy_variety",             str,              "Common"),
+    ("moisture_pct",              float,            13.5),
+    ("cmr_grade",                 CMRGrade,         CMRGrade.RAW),
+    ("is_grade_a_paddy",          Any,              False),
+    ("include_inward_transport",  Any,              True),
+    ("include_outward_transport", Any,              True),
+    ("storage_days",              int,              0),
+    ("bag_damage_bags",           int,              0),
+    ("other_deductions",          float,            0.0),
+    ("bill_no",                   Optional[str],    ""),
+]
+
+_MILL_FIELDS = [
+    ("mill_id",                   str,              "RM001"),
+    ("mill_name",                 str,              "Rice Mill"),
+    ("district",                  str,              "default"),
+]
+
+_LotRow: Any = msgspec.defstruct("LotRow", _LOT_FIELDS)
+
+_LOT_ROWS: Any = List[_LotRow]
+
+# Whole payloads of the compute_bill and seasonal_total actions
+_BillRequest: Any = msgspec.defstruct("BillRequest", _MILL_FIELDS + _LOT_FIELDS)
+
+_SeasonRequest: Any = msgspec.defstruct("SeasonRequest", _MILL_FIELDS + [
+    ("lots",                      _LOT_ROWS,        []),
+    ("include_bills",             Any,              True),
+])
+
+
+def _lot_kwargs(lot: Any) -> dict:
+    """compute_bill's keyword arguments from a validated _LotRow / _BillRequest."""
+    kwargs = msgspec.structs.asdict(lot)
+    kwargs["lot_no"]                    = str(lot.lot_no)
+    kwargs["is_grade_a_paddy"]          = bool(lot.is_grade_a_paddy)
+    kwargs["include_inward_transport"]  = bool(lot.include_inward_transport)
+    kwargs["include_outward_transport"] = bool(lot.include_outward_transport)
+    kwargs["bill_no"]                   = lot.bill_no or ""
+    return kwargs
+
+
 def ricemill_fci_billing(params: dict) -> dict:
     action = params.get("action", "compute_bill")
     try:
         if action == "compute_bill":
-            bill = _calc.compute_bill(
-                mill_id      = params.get("mill_id", "RM001"),
-                mill_name    = params.get("mill_name", "Rice Mill"),
-                district     = params.get("district", "default"),
-                lot_no       = params.get("lot_no", "LOT001"),
-                paddy_qtl    = float(params.get("paddy_qtl", 0)),
-                paddy_variety= params.get("paddy_variety", "Common"),
-                moisture_pct = float(params.get("moisture_pct", 13.5)),
-                cmr_grade    = CMRGrade(params.get("cmr_grade", "raw")),
-                is_grade_a_paddy = bool(params.get("is_grade_a_paddy", False)),
-                include_inward_transport  = bool(params.get("include_inward_transport", True)),
-                include_outward_transport = bool(params.get("include_outward_transport", True)),
-                storage_days  = int(params.get("storage_days", 0)),
-                bag_damage_bags = int(params.get("bag_damage_bags", 0)),
-                other_deductions = float(params.get("other_deductions", 0)),
-            )
+            req  = msgspec.convert(params, type=_BillRequest, strict=False)
+            bill = _calc.compute_bill(**_lot_kwargs(req))
             return asdict(bill)
         elif action == "rates":
             return {"fci_milling_rates_per_qtl": FCI_MILLING_RATES,
                     "note": "Rates per quintal of paddy milled, 2024-25, AP/TS"}
         elif action == "seasonal_total":
+            req = msgspec.convert(params, type=_SeasonRequest, strict=False)
             return _calc.compute_seasonal_total(
-                mill_id   = params.get("mill_id", "RM001"),
-                mill_name = params.get("mill_name", "Rice Mill"),
-                district  = params.get("district", "default"),
-                lots      = params.get("lots", []),
+                mill_id       = req.mill_id,
+                mill_name     = req.mill_name,
+                district      = req.district,
+                lots          = [_lot_kwargs(lot) for lot in req.lots],
+                include_bills = bool(req.include_bills),
             )
         else:
             return {"error": f"Unknown action: {action}"}
-    except Exception as e:
+    except ValueError as e:     # bad payload; msgspec.ValidationError is a ValueError
         return {"error": str(e)}
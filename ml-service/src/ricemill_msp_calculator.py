@@ -40,6 +40,10 @@ from typing import Dict, List, Optional
 from datetime import date
 from enum import Enum
 
+import numpy as np
+
+from money_rounding import round2_vec
+
 
 # ---------------------------------------------------------------------------
 # MSP Rates — Official CACP recommendations, approved by Cabinet
@@ -98,6 +102,10 @@ TS_LEVIES = {
 
 HANDLING_COST_PER_QTL = 20.0   # ₹/qtl loading/unloading
 
+# Total levy fraction per state (summed in dict order, as the per-lot path does)
+LEVY_AP_SUM = sum(AP_LEVIES.values())
+LEVY_TS_SUM = sum(TS_LEVIES.values())
+
 # FCI Economic Cost components (approximate, 2024-25)
 FCI_ECONOMIC_COST_COMPONENTS = {
     "msp":            2300.0,
@@ -123,6 +131,17 @@ class State(str, Enum):
     TELANGANA      = "ts"
 
 
+_CHANNEL_NOTES: Dict[ProcurementChannel, List[str]] = {
+    ProcurementChannel.FCI_DIRECT: [
+        "FCI procurement: levies covered under state agreement. Mill acts as commission agent."
+    ],
+    ProcurementChannel.APMC: [],
+    ProcurementChannel.DIRECT_FARMER: [
+        "Direct farmer purchase: no APMC levy. Ensure digital payment for 40A(3) compliance."
+    ],
+}
+
+
 # ---------------------------------------------------------------------------
 # Data structures
 # ---------------------------------------------------------------------------
@@ -144,6 +163,48 @@ class ProcurementCost:
     notes:            List[str] = field(default_factory=list)
 
 
+@dataclass
+class ProcurementCostBatch:
+    """ProcurementCost for many lots as parallel 1-D arrays (one entry per lot)."""
+    channel:            np.ndarray   # ProcurementChannel values
+    state:              np.ndarray   # State values
+    paddy_grade:        np.ndarray
+    qtl:                np.ndarray
+    msp_per_qtl:        np.ndarray
+    levy_total_pct:     np.ndarray
+    levy_amount_qtl:    np.ndarray
+    handling_qtl:       np.ndarray
+    effective_cost_qtl: np.ndarray
+    total_cost:         np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.qtl)
+
+    def to_records(self) -> List[ProcurementCost]:
+        """One ProcurementCost per lot, as compute_procurement_cost returns."""
+        return [
+            ProcurementCost(
+                channel          = ProcurementChannel(ch),
+                state            = State(st),
+                paddy_grade      = grade,
+                qtl              = qtl,
+                msp_per_qtl      = msp,
+                levy_total_pct   = levy_pct,
+                levy_amount_qtl  = levy_qtl,
+                handling_qtl     = handling,
+                effective_cost_qtl = eff_cost,
+                total_cost       = total,
+                notes            = list(_CHANNEL_NOTES[ProcurementChannel(ch)]),
+            )
+            for ch, st, grade, qtl, msp, levy_pct, levy_qtl, handling, eff_cost, total in zip(
+                self.channel.tolist(), self.state.tolist(), self.paddy_grade.tolist(),
+                self.qtl.tolist(), self.msp_per_qtl.tolist(), self.levy_total_pct.tolist(),
+                self.levy_amount_qtl.tolist(), self.handling_qtl.tolist(),
+                self.effective_cost_qtl.tolist(), self.total_cost.tolist(),
+            )
+        ]
+
+
 @dataclass
 class BreakEvenResult:
     paddy_qtl:           float
@@ -200,11 +261,7 @@ class MSPCalculator:
         eff_cost   = round(msp + levy_qtl + handling, 2)
         total      = round(eff_cost * qtl, 2)
 
-        notes = []
-        if ch == ProcurementChannel.DIRECT_FARMER:
-            notes.append("Direct farmer purchase: no APMC levy. Ensure digital payment for 40A(3) compliance.")
-        if ch == ProcurementChannel.FCI_DIRECT:
-            notes.append("FCI procurement: levies covered under state agreement. Mill acts as commission agent.")
+        notes = list(_CHANNEL_NOTES[ch])
 
         return ProcurementCost(
             channel          = ch,
@@ -220,6 +277,55 @@ class MSPCalculator:
             notes            = notes,
         )
 
+    def compute_procurement_cost_batch(
+        self,
+        qtls,
+        grades   = "common",
+        states   = "ap",
+        channels = "direct_farmer",
+    ) -> ProcurementCostBatch:
+        """
+        compute_procurement_cost for many lots at once.  Arguments are
+        array-likes (or scalars) broadcast against each other; every figure
+        matches the per-lot call, CPython rounding included.
+        """
+        qtl, grade, state, channel = (
+            np.atleast_1d(a) for a in np.broadcast_arrays(
+                np.asarray(qtls, dtype=np.float64), np.asarray(grades),
+                np.asarray(states), np.asarray(channels),
+            )
+        )
+
+        # Validate the distinct states/channels as the per-lot call does
+        for st in np.unique(state).tolist():
+            State(st)
+        for ch in np.unique(channel).tolist():
+            ProcurementChannel(ch)
+
+        grade_u, grade_i = np.unique(grade, return_inverse=True)
+        msp      = np.array(
+            [MSP_KHARIF_2024_25.get(f"paddy_{g}", 2300.0) for g in grade_u.tolist()]
+        )[grade_i]
+        levy_pct = np.where(state == State.ANDHRA_PRADESH.value, LEVY_AP_SUM, LEVY_TS_SUM)
+        levy_pct = np.where(channel != ProcurementChannel.DIRECT_FARMER.value, levy_pct, 0.0)
+        levy_qtl = round2_vec(msp * levy_pct)
+        handling = np.full(len(qtl), HANDLING_COST_PER_QTL)
+        eff_cost = round2_vec(msp + levy_qtl + handling)
+        total    = round2_vec(eff_cost * qtl)
+
+        return ProcurementCostBatch(
+            channel          = channel,
+            state            = state,
+            paddy_grade      = grade,
+            qtl              = qtl,
+            msp_per_qtl      = msp,
+            levy_total_pct   = round2_vec(levy_pct * 100),
+            levy_amount_qtl  = levy_qtl,
+            handling_qtl     = handling,
+            effective_cost_qtl = eff_cost,
+            total_cost       = total,
+        )
+
     def compute_break_even(
         self,
         paddy_cost_qtl:    float,   # effective paddy cost per quintal
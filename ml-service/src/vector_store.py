@@ -7,22 +7,53 @@ from __future__ import annotations
 
 import logging
 import os
+import pickle
 from pathlib import Path
 from typing import List, Optional
 
-from langchain.schema import Document
+import faiss
 from langchain_community.vectorstores import FAISS
 
 from embeddings import get_embeddings
-from knowledge_base import load_knowledge_base
+from knowledge_base import Chunk, load_knowledge_base
 
 logger = logging.getLogger(__name__)
 
 FAISS_INDEX_PATH = os.environ.get("FAISS_INDEX_PATH", "./faiss_index")
 
+# OpenMP threads for FAISS search, set once for the process
+FAISS_OMP_THREADS: int = int(os.environ.get("FAISS_OMP_THREADS", str(os.cpu_count() or 1)))
+faiss.omp_set_num_threads(FAISS_OMP_THREADS)
+
+# The faiss-cpu wheels pick the AVX2 build at import when the CPU has it;
+# without it every distance computation runs on the scalar fallback.
+if "AVX2" not in faiss.get_compile_options():
+    logger.warning(
+        "FAISS loaded without AVX2 (%s); similarity search runs unvectorized.",
+        faiss.get_compile_options(),
+    )
+
+
+def _load_local(index_path: str, embeddings) -> FAISS:
+    """
+    FAISS.load_local, but with the index opened memory-mapped and read-only
+    so index types that support it are paged in on demand instead of read
+    into RAM up front.  Falls back to a plain read for the rest.
+    """
+    path = Path(index_path)
+    index_file = str(path / "index.faiss")
+    try:
+        index = faiss.read_index(index_file, faiss.IO_FLAG_MMAP | faiss.IO_FLAG_READ_ONLY)
+    except RuntimeError as exc:
+        logger.warning("FAISS index not mappable (%s); reading it into memory.", exc)
+        index = faiss.read_index(index_file)
+    with open(path / "index.pkl", "rb") as f:
+        docstore, index_to_docstore_id = pickle.load(f)
+    return FAISS(embeddings, index, docstore, index_to_docstore_id)
+
 
 def build_vector_store(
-    docs: Optional[List[Document]] = None,
+    docs: Optional[List[Chunk]] = None,
     index_path: str = FAISS_INDEX_PATH,
     force_rebuild: bool = False,
 ) -> FAISS:
@@ -34,7 +65,8 @@ def build_vector_store(
     base is embedded and a new index is created and saved.
 
     Args:
-        docs: Optional pre-built list of Documents. Defaults to load_knowledge_base().
+        docs: Optional pre-built list of Chunks (or LangChain Documents).
+            Defaults to load_knowledge_base().
         index_path: Directory for persisted FAISS index files.
         force_rebuild: If True, rebuilds the index even if one exists on disk.
 
@@ -50,11 +82,7 @@ def build_vector_store(
     if index_file.exists() and not force_rebuild:
         logger.info("Loading FAISS index from disk: %s", index_path)
         try:
-            store = FAISS.load_local(
-                index_path,
-                embeddings,
-                allow_dangerous_deserialization=True,
-            )
+            store = _load_local(index_path, embeddings)
             logger.info("FAISS index loaded (%d vectors)", store.index.ntotal)
             return store
         except Exception as exc:
@@ -68,7 +96,13 @@ def build_vector_store(
         docs = load_knowledge_base()
 
     logger.info("Building FAISS index from %d document chunks …", len(docs))
-    store = FAISS.from_documents(docs, embeddings)
+    # from_texts takes the chunk fields directly, so Chunks never need
+    # converting to pydantic Documents before embedding
+    store = FAISS.from_texts(
+        [d.page_content for d in docs],
+        embeddings,
+        metadatas=[d.metadata for d in docs],
+    )
 
     # Persist to disk for subsequent fast loads
     index_dir.mkdir(parents=True, exist_ok=True)
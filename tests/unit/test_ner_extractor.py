@@ -0,0 +1,77 @@
+"""
+Regression tests for the financial NER extractor (ml-service/src/ner_extractor.py).
+
+Run from the repository root:  python -m pytest -q tests/unit
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "ml-service" / "src"))
+
+from ner_extractor import FinancialNER  # noqa: E402
+
+
+@pytest.fixture(scope="module")
+def fallback_ner():
+    """Extractor on the regex/gazetteer path only (spaCy disabled)."""
+    ner = FinancialNER()
+    ner._nlp = None
+    return ner
+
+
+def test_overlapping_amount_and_time_period_are_both_found(fallback_ner):
+    result = fallback_ner.extract("May 5 1000 dollars")
+    assert result.entity_map["AMOUNT"] == ["1000 dollars"]
+    assert result.entity_map["TIME_PERIOD"] == ["May 5 1000"]
+
+
+def test_amount_digits_also_report_a_year(fallback_ner):
+    result = fallback_ner.extract("Is $2024 enough?")
+    assert result.entity_map["AMOUNT"] == ["$2024"]
+    assert result.entity_map["TIME_PERIOD"] == ["2024"]
+
+
+@pytest.fixture(scope="module")
+def spacy_ner():
+    """Extractor on the spaCy EntityRuler path."""
+    pytest.importorskip("spacy")
+    ner = FinancialNER()
+    if ner._nlp is None:
+        pytest.skip("spaCy pipeline unavailable")
+    return ner
+
+
+@pytest.mark.parametrize("query, expected", [
+    (
+        "How much can I put in my Roth IRA in 2024?",
+        {"ACCOUNT": ["Roth IRA"], "TIME_PERIOD": ["2024"]},
+    ),
+    (
+        "Should I buy Bitcoin with $5,000 this year?",
+        {"CRYPTO": ["Bitcoin"], "AMOUNT": ["$5,000"], "TIME_PERIOD": ["this year"]},
+    ),
+    (
+        "max HSA contribution 2025",
+        {"ACCOUNT": ["HSA"], "TIME_PERIOD": ["2025"]},
+    ),
+])
+def test_spacy_matches_keep_amounts_and_time_periods(spacy_ner, query, expected):
+    result = spacy_ner.extract(query)
+    assert result.method == "spacy_ruler"
+    for etype, texts in expected.items():
+        assert result.entity_map.get(etype) == texts
+
+
+def test_spacy_matches_carry_canonical_names(spacy_ner):
+    result = spacy_ner.extract("max HSA contribution 2025")
+    canonical = {e.text: e.canonical for e in result.entities}
+    assert canonical["HSA"] == "Health Savings Account"
+
+
+def test_extract_batch_matches_extract(spacy_ner):
+    queries = ["Should I buy Bitcoin with $5,000 this year?", "May 5 1000 dollars", ""]
+    batch = spacy_ner.extract_batch(queries)
+    assert [r.entity_map for r in batch] == [spacy_ner.extract(q).entity_map for q in queries]